@@ -6,6 +6,7 @@ from .bridge_data import BRIDGE_DATA, LZ_LOOKUP, WH_LOOKUP
 from .chain_data import CHAIN_DATA
 from .event_loop import get_event_loop
 from .client_session import get_client_session
+from .web3_providers import get_rpc_session, get_web3_provider
 from .repos import (
     get_transactions_repo,
     get_messages_repo,
@@ -1,4 +1,4 @@
-from app.dependencies import CHAIN_DATA, logger
+from app.dependencies import get_web3_provider, logger
 from app.infrastructure.clients.evm import EvmClient
 from app.usecases.interfaces.clients.evm import IEvmClient
 
@@ -6,8 +6,10 @@ from app.usecases.interfaces.clients.evm import IEvmClient
 async def get_evm_client(ax_chain_id: int) -> IEvmClient:
     """Instantiate and return an EVM client."""
 
+    web3_provider = await get_web3_provider(ax_chain_id=ax_chain_id)
+
     return EvmClient(
         chain_id=ax_chain_id,
-        rpc_url=CHAIN_DATA[ax_chain_id]["rpc"],
+        web3_provider=web3_provider,
         logger=logger,
     )
@@ -0,0 +1,57 @@
+# pylint: disable=duplicate-code
+from typing import Dict, Optional
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+from app.dependencies import CHAIN_DATA, logger
+from app.infrastructure.clients.rpc_pool import RpcProviderPool
+from app.settings import settings
+
+rpc_session: Optional[ClientSession] = None
+web3_providers: Dict[int, RpcProviderPool] = {}
+
+
+def get_rpc_timeout() -> ClientTimeout:
+    return ClientTimeout(
+        total=settings.rpc_timeout, sock_connect=settings.rpc_connect_timeout
+    )
+
+
+async def get_rpc_session() -> ClientSession:
+    """Instantiate and return the session that every RPC request is made on.
+
+    There is one per process, so each RPC host has a single pool of kept-alive
+    connections."""
+
+    global rpc_session  # pylint: disable = global-statement
+    if rpc_session is None:
+        rpc_session = ClientSession(
+            connector=TCPConnector(
+                limit=settings.rpc_connection_limit,
+                limit_per_host=settings.rpc_connection_limit_per_host,
+                keepalive_timeout=settings.rpc_keepalive_timeout,
+                ttl_dns_cache=settings.rpc_dns_cache_ttl,
+            ),
+            timeout=get_rpc_timeout(),
+        )
+    return rpc_session
+
+
+async def get_web3_provider(ax_chain_id: int) -> RpcProviderPool:
+    """Instantiate and return the chain's web3 provider; there is one per chain."""
+
+    if ax_chain_id not in web3_providers:
+        provider = RpcProviderPool(
+            urls=[url.strip() for url in CHAIN_DATA[ax_chain_id]["rpc"].split(",")],
+            logger=logger,
+            request_kwargs={"timeout": get_rpc_timeout()},
+            hedge_reads=settings.rpc_hedge_reads,
+            hedge_min_delay=settings.rpc_hedge_min_delay,
+            latency_window=settings.rpc_latency_window,
+            max_consecutive_errors=settings.rpc_endpoint_max_errors,
+            cooldown=settings.rpc_endpoint_cooldown,
+        )
+        # web3 makes each URL's requests on the session cached for it.
+        await provider.cache_async_session(await get_rpc_session())
+        web3_providers[ax_chain_id] = provider
+    return web3_providers[ax_chain_id]
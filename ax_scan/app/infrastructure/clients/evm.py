@@ -1,7 +1,8 @@
 from logging import Logger
 from typing import List, Union
 
-from web3 import AsyncHTTPProvider, AsyncWeb3
+from web3 import AsyncWeb3
+from web3.providers.async_base import AsyncBaseProvider
 
 from app.dependencies import CHAIN_DATA
 from app.settings import settings
@@ -19,11 +20,11 @@ class EvmClient(IEvmClient):
     def __init__(
         self,
         chain_id: int,
-        rpc_url: str,
+        web3_provider: AsyncBaseProvider,
         logger: Logger,
     ) -> None:
         self.chain_id = chain_id
-        self.web3_client = AsyncWeb3(AsyncHTTPProvider(rpc_url))
+        self.web3_client = AsyncWeb3(web3_provider)
         self.logger = logger
 
     async def fetch_receipt(self, transaction_hash: str) -> TransactionReceipt:
@@ -0,0 +1,248 @@
+# pylint: disable=duplicate-code
+import asyncio
+import time
+from collections import deque
+from logging import Logger
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, TypeVar
+
+from aiohttp import ClientSession
+from web3 import AsyncHTTPProvider
+from web3.providers.async_base import AsyncBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+# Reads that return the same answer from any endpoint, so may be sent twice.
+HEDGED_METHODS = frozenset(
+    (
+        "eth_blockNumber",
+        "eth_feeHistory",
+        "eth_gasPrice",
+        "eth_getLogs",
+        "eth_getTransactionReceipt",
+        "eth_maxPriorityFeePerGas",
+    )
+)
+# Not retried on another endpoint; a resend could not tell "sent twice" from "failed".
+NON_RETRIABLE_METHODS = frozenset(("eth_sendRawTransaction", "eth_sendTransaction"))
+# Weight of the newest sample in the latency moving average
+LATENCY_SMOOTHING = 0.2
+
+Result = TypeVar("Result")
+
+
+class RpcEndpoint:
+    """Latency and error statistics of one RPC URL."""
+
+    __slots__ = (
+        "url",
+        "provider",
+        "latency",
+        "latencies",
+        "outcomes",
+        "consecutive_errors",
+        "cooldown_until",
+    )
+
+    def __init__(self, url: str, provider: AsyncHTTPProvider, window: int) -> None:
+        self.url = url
+        self.provider = provider
+        # Moving average; None until the first response
+        self.latency: Optional[float] = None
+        self.latencies: Deque[float] = deque(maxlen=window)
+        # True for each failed request among the last window requests
+        self.outcomes: Deque[bool] = deque(maxlen=window)
+        self.consecutive_errors = 0
+        self.cooldown_until = 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return sum(self.outcomes) / len(self.outcomes) if self.outcomes else 0.0
+
+    def record_success(self, latency: float) -> None:
+        self.latency = (
+            latency
+            if self.latency is None
+            else LATENCY_SMOOTHING * latency + (1 - LATENCY_SMOOTHING) * self.latency
+        )
+        self.latencies.append(latency)
+        self.outcomes.append(False)
+        self.consecutive_errors = 0
+
+    def record_error(self) -> None:
+        self.outcomes.append(True)
+        self.consecutive_errors += 1
+
+    def p95_latency(self) -> Optional[float]:
+        if not self.latencies:
+            return None
+        latencies = sorted(self.latencies)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+
+
+class RpcProviderPool(AsyncBaseProvider):
+    """Web3 provider that spreads a chain's requests over several RPC URLs.
+
+    Requests go to the healthiest endpoint: the fastest by moving-average
+    latency, plus error_penalty seconds times its recent error rate; endpoints
+    without a response yet are tried first. Endpoints that fail
+    max_consecutive_errors times in a row sit out for cooldown seconds.
+    Requests that fail in transport are retried on the next endpoint; with
+    hedging, reads in HEDGED_METHODS are also sent to the next endpoint once the
+    first has taken longer than its p95 latency, and the first answer wins.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        logger: Logger,
+        request_kwargs: Optional[Dict[str, Any]] = None,
+        hedge_reads: bool = False,
+        hedge_min_delay: float = 0.05,
+        latency_window: int = 100,
+        max_consecutive_errors: int = 3,
+        cooldown: float = 30,
+        error_penalty: float = 1,
+    ) -> None:
+        super().__init__()
+        if not urls:
+            raise ValueError("An RPC provider pool needs at least one URL.")
+        self.endpoints = [
+            RpcEndpoint(
+                url=url,
+                provider=AsyncHTTPProvider(url, request_kwargs=request_kwargs),
+                window=latency_window,
+            )
+            for url in urls
+        ]
+        self.logger = logger
+        self.request_kwargs = request_kwargs or {}
+        self.hedge_reads = hedge_reads
+        self.hedge_min_delay = hedge_min_delay
+        self.max_consecutive_errors = max_consecutive_errors
+        self.cooldown = cooldown
+        self.error_penalty = error_penalty
+        self.session: Optional[ClientSession] = None
+
+    def __str__(self) -> str:
+        return f"RPC provider pool of {len(self.endpoints)} endpoint(s)"
+
+    @property
+    def endpoint_uri(self) -> str:
+        """URL of the currently healthiest endpoint."""
+        return self.__ranked()[0].url
+
+    async def cache_async_session(self, session: ClientSession) -> None:
+        """Makes every endpoint's requests on session."""
+        self.session = session
+        for endpoint in self.endpoints:
+            await endpoint.provider.cache_async_session(session)
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return await self.__route(
+            send=lambda endpoint: endpoint.provider.make_request(method, params),
+            hedge=method in HEDGED_METHODS,
+            retry=method not in NON_RETRIABLE_METHODS,
+        )
+
+    async def make_batch_request(
+        self, requests: List[Dict[str, Any]], hedge: bool = False, retry: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Sends a JSON-RPC batch; routed like make_request."""
+
+        async def send(endpoint: RpcEndpoint) -> List[Dict[str, Any]]:
+            if self.session is None:
+                raise RuntimeError("The RPC provider pool has no session.")
+            async with self.session.post(
+                endpoint.url, json=requests, **self.request_kwargs
+            ) as response:
+                response.raise_for_status()
+                responses = await response.json()
+            if not isinstance(responses, list):
+                raise ValueError(f"Unexpected batch response: {responses}")
+            return responses
+
+        return await self.__route(send=send, hedge=hedge, retry=retry)
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        for endpoint in self.__ranked():
+            if await endpoint.provider.is_connected(show_traceback=show_traceback):
+                return True
+        return False
+
+    def __ranked(self) -> List[RpcEndpoint]:
+        now = time.monotonic()
+        return sorted(
+            self.endpoints,
+            key=lambda endpoint: (
+                endpoint.cooldown_until > now,
+                (endpoint.latency or 0.0) + self.error_penalty * endpoint.error_rate,
+            ),
+        )
+
+    async def __timed(
+        self, endpoint: RpcEndpoint, send: Callable[[RpcEndpoint], Awaitable[Result]]
+    ) -> Result:
+        start = time.perf_counter()
+        try:
+            result = await send(endpoint)
+        except asyncio.CancelledError:  # pylint: disable = try-except-raise
+            raise
+        except Exception:
+            endpoint.record_error()
+            if endpoint.consecutive_errors >= self.max_consecutive_errors:
+                endpoint.cooldown_until = time.monotonic() + self.cooldown
+                self.logger.warning(
+                    "[RpcProviderPool]: %s failed %s times in a row; cooling down for %ss.",
+                    endpoint.url,
+                    endpoint.consecutive_errors,
+                    self.cooldown,
+                )
+            raise
+        endpoint.record_success(latency=time.perf_counter() - start)
+        return result
+
+    def __hedge_delay(self, endpoint: RpcEndpoint) -> float:
+        return max(self.hedge_min_delay, endpoint.p95_latency() or 0.0)
+
+    async def __route(
+        self,
+        send: Callable[[RpcEndpoint], Awaitable[Result]],
+        hedge: bool,
+        retry: bool,
+    ) -> Result:
+        ranked = self.__ranked()
+        if not retry or len(ranked) == 1:
+            return await self.__timed(endpoint=ranked[0], send=send)
+
+        hedge = hedge and self.hedge_reads
+        remaining = iter(ranked)
+        pending: Set[asyncio.Future] = set()
+        failed: Optional[asyncio.Future] = None
+        try:
+            while True:
+                # The next endpoint is tried after a failure, or as a hedge once
+                # the only in-flight request is slower than its endpoint's p95.
+                endpoint = next(remaining, None)
+                if endpoint is not None:
+                    pending.add(
+                        asyncio.ensure_future(
+                            self.__timed(endpoint=endpoint, send=send)
+                        )
+                    )
+                elif not pending:
+                    # Every endpoint failed; raise the last one's error.
+                    return failed.result()
+
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self.__hedge_delay(endpoint=endpoint)
+                    if hedge and endpoint is not None and len(pending) == 1
+                    else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    failed = task
+        finally:
+            for task in pending:
+                task.cancel()
@@ -44,6 +44,21 @@ class Settings(BaseSettings):
     manage_locks_frequency: int = 60 * 5
     award_points_frequency: int = 60 * 60 * 24
 
+    # RPC connection pool, shared by every web3 provider
+    rpc_connection_limit: int = 100
+    rpc_connection_limit_per_host: int = 20
+    rpc_keepalive_timeout: float = 60
+    rpc_dns_cache_ttl: int = 60 * 5
+    rpc_timeout: float = 10
+    rpc_connect_timeout: float = 5
+    # Each RPC URL may be a comma-separated list of URLs for the chain. Requests
+    # go to the healthiest; idempotent reads may also be hedged on the next one.
+    rpc_hedge_reads: bool = False
+    rpc_hedge_min_delay: float = 0.05
+    rpc_latency_window: int = 100
+    rpc_endpoint_max_errors: int = 3
+    rpc_endpoint_cooldown: float = 30
+
     # RPC Urls
     ethereum_rpc: str
     bsc_rpc: str
@@ -7,6 +7,7 @@ from .abis.wormhole_bridge import ABI as WORMHOLE_BRIDGE_ABI
 from .logger import logger
 from .event_loop import get_event_loop
 from .client_session import get_client_session
+from .web3_providers import get_rpc_session, get_web3_provider
 from .repos import get_fee_updates_repo, get_mock_transactions_repo
 from .http_clients import get_wormhole_bridge_client, get_coingecko_client
 from .services import get_remote_price_manager
@@ -1,8 +1,8 @@
 from app.dependencies import (
-    CHAIN_DATA,
     WORMHOLE_BRIDGE_ABI,
     get_client_session,
     get_mock_transactions_repo,
+    get_web3_provider,
     logger,
 )
 from app.infrastructure.clients.http.coingecko import CoingeckoClient
@@ -21,10 +21,12 @@ async def get_wormhole_bridge_client(source_ax_chain_id: int) -> IBlockchainClie
         chain_id=source_ax_chain_id
     )
 
+    web3_provider = await get_web3_provider(ax_chain_id=source_ax_chain_id)
+
     return WormholeBridgeEvmClient(
         abi=WORMHOLE_BRIDGE_ABI,
         chain_id=source_ax_chain_id,
-        rpc_url=CHAIN_DATA[source_ax_chain_id]["rpc"],
+        web3_provider=web3_provider,
         mock_payload=bytes.fromhex(mock_transaction.payload),
         logger=logger,
     )
@@ -0,0 +1,51 @@
+# pylint: disable=duplicate-code
+from typing import Dict, Optional
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from web3 import AsyncHTTPProvider
+
+from app.dependencies import CHAIN_DATA
+from app.settings import settings
+
+rpc_session: Optional[ClientSession] = None
+web3_providers: Dict[int, AsyncHTTPProvider] = {}
+
+
+def get_rpc_timeout() -> ClientTimeout:
+    return ClientTimeout(
+        total=settings.rpc_timeout, sock_connect=settings.rpc_connect_timeout
+    )
+
+
+async def get_rpc_session() -> ClientSession:
+    """Instantiate and return the session that every RPC request is made on.
+
+    There is one per process, so each RPC host has a single pool of kept-alive
+    connections."""
+
+    global rpc_session  # pylint: disable = global-statement
+    if rpc_session is None:
+        rpc_session = ClientSession(
+            connector=TCPConnector(
+                limit=settings.rpc_connection_limit,
+                limit_per_host=settings.rpc_connection_limit_per_host,
+                keepalive_timeout=settings.rpc_keepalive_timeout,
+                ttl_dns_cache=settings.rpc_dns_cache_ttl,
+            ),
+            timeout=get_rpc_timeout(),
+        )
+    return rpc_session
+
+
+async def get_web3_provider(ax_chain_id: int) -> AsyncHTTPProvider:
+    """Instantiate and return the chain's web3 provider; there is one per chain."""
+
+    if ax_chain_id not in web3_providers:
+        provider = AsyncHTTPProvider(
+            CHAIN_DATA[ax_chain_id]["rpc"],
+            request_kwargs={"timeout": get_rpc_timeout()},
+        )
+        # web3 makes the provider's requests on the session cached for its URL.
+        await provider.cache_async_session(await get_rpc_session())
+        web3_providers[ax_chain_id] = provider
+    return web3_providers[ax_chain_id]
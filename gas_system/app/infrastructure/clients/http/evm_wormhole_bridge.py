@@ -26,15 +26,15 @@ class WormholeBridgeEvmClient(IBlockchainClient):
         self,
         abi: List[Mapping[str, Any]],
         chain_id: int,
-        rpc_url: str,
+        web3_provider: AsyncHTTPProvider,
         mock_payload: bytes,
         logger: Logger,
     ) -> None:
         self.abi = abi
         self.chain_id = chain_id
-        self.rpc_url = rpc_url
+        self.rpc_url = web3_provider.endpoint_uri
         self.payload = mock_payload
-        self.web3_client = AsyncWeb3(AsyncHTTPProvider(self.rpc_url))
+        self.web3_client = AsyncWeb3(web3_provider)
         self.contract = self.web3_client.eth.contract(
             address=self.web3_client.to_checksum_address(settings.evm_wormhole_bridge),
             abi=abi,
@@ -3,7 +3,7 @@ import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.dependencies import get_client_session, get_event_loop
+from app.dependencies import get_client_session, get_event_loop, get_rpc_session
 from app.infrastructure.db.core import get_or_create_database
 from app.infrastructure.web.endpoints.metrics import health
 from app.settings import settings
@@ -44,9 +44,11 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    # Close client session
+    # Close client sessions
     client_session = await get_client_session()
     await client_session.close()
+    rpc_session = await get_rpc_session()
+    await rpc_session.close()
     # Close database connection
     DATABASE = await get_or_create_database()
     if DATABASE.is_connected:
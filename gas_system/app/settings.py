@@ -44,6 +44,14 @@ class Settings(BaseSettings):
     celo_update_frequency: int = 60 * 30
     optimism_update_frequency: int = 60 * 60
 
+    # RPC connection pool, shared by every web3 provider
+    rpc_connection_limit: int = 100
+    rpc_connection_limit_per_host: int = 20
+    rpc_keepalive_timeout: float = 60
+    rpc_dns_cache_ttl: int = 60 * 5
+    rpc_timeout: float = 10
+    rpc_connect_timeout: float = 5
+
     # RPC Urls
     ethereum_rpc: str
     bsc_rpc: str
@@ -7,7 +7,14 @@ from .abis.wormhole_bridge import ABI as WORMHOLE_BRIDGE_ABI
 from .logger import logger
 from .event_loop import get_event_loop
 from .client_session import get_client_session
+from .web3_providers import get_rpc_session, get_web3_provider
 from .repos import get_relays_repo, get_tasks_repo
-from .http_clients import get_evm_client, get_bridge_client
-from .services import get_vaa_delivery, get_message_processor
+from .http_clients import (
+    get_evm_client,
+    get_supported_evm_clients,
+    get_bridge_client,
+    get_fee_oracle,
+    get_gas_limit_cache,
+)
+from .services import get_vaa_delivery, get_message_processor, get_nonce_managers
 from .redis import get_redis_client
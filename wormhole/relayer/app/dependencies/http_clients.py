@@ -1,22 +1,75 @@
-from app.dependencies import CHAIN_DATA, WORMHOLE_BRIDGE_ABI, get_client_session, logger
+from typing import Dict, Mapping
+
+from app.dependencies import (
+    CHAIN_DATA,
+    WORMHOLE_BRIDGE_ABI,
+    get_client_session,
+    get_web3_provider,
+    logger,
+)
 from app.infrastructure.clients.evm import EvmClient
+from app.infrastructure.clients.fee_oracle import EvmFeeOracle
 from app.infrastructure.clients.wormhole import WormholeClient
 from app.settings import settings
 from app.usecases.interfaces.clients.bridge import IBridgeClient
 from app.usecases.interfaces.clients.evm import IEvmClient
+from app.usecases.interfaces.clients.fee_oracle import IFeeOracle
+from app.usecases.interfaces.services.gas_limit_cache import IGasLimitCache
+from app.usecases.services.gas_limit_cache import GasLimitCache
+
+fee_oracles: Dict[int, IFeeOracle] = {}
+gas_limit_caches: Dict[int, IGasLimitCache] = {}
+
+
+async def get_fee_oracle(chain_id: int) -> IFeeOracle:
+    """Instantiate and return the chain's fee oracle; there is one per chain."""
+
+    if chain_id not in fee_oracles:
+        web3_provider = await get_web3_provider(chain_id=chain_id)
+        fee_oracles[chain_id] = EvmFeeOracle(
+            chain_id=chain_id, web3_provider=web3_provider, logger=logger
+        )
+    return fee_oracles[chain_id]
+
+
+async def get_gas_limit_cache(chain_id: int) -> IGasLimitCache:
+    """Instantiate and return the chain's gas-limit cache; there is one per chain."""
+
+    if chain_id not in gas_limit_caches:
+        gas_limit_caches[chain_id] = GasLimitCache(
+            safety_margin=settings.gas_limit_safety_margin,
+            window=settings.gas_limit_window,
+            estimate_frequency=settings.gas_limit_estimate_frequency,
+        )
+    return gas_limit_caches[chain_id]
 
 
 async def get_evm_client(chain_id: int) -> IEvmClient:
     """Instantiate and return EVM client."""
 
+    web3_provider = await get_web3_provider(chain_id=chain_id)
+    fee_oracle = await get_fee_oracle(chain_id=chain_id)
+    gas_limit_cache = await get_gas_limit_cache(chain_id=chain_id)
+
     return EvmClient(
         abi=WORMHOLE_BRIDGE_ABI,
         chain_id=chain_id,
-        rpc_url=CHAIN_DATA[chain_id]["rpc"],
+        web3_provider=web3_provider,
+        fee_oracle=fee_oracle,
+        gas_limit_cache=gas_limit_cache,
         logger=logger,
     )
 
 
+async def get_supported_evm_clients() -> Mapping[int, IEvmClient]:
+    """Instantiate and return an EVM client for every supported chain."""
+
+    supported_evm_clients = {}
+    for chain_id in CHAIN_DATA:
+        supported_evm_clients[chain_id] = await get_evm_client(chain_id=chain_id)
+    return supported_evm_clients
+
+
 async def get_bridge_client() -> IBridgeClient:
     """Instantiate and return Wormhole client."""
 
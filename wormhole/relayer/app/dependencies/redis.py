@@ -1,12 +1,21 @@
+from typing import Optional
+
 from app.dependencies import get_event_loop, get_vaa_delivery, logger
 from app.infrastructure.clients.redis import RedisClient
 from app.usecases.interfaces.clients.unique_set import IUniqueSetClient
 
+redis_client: Optional[IUniqueSetClient] = None
+
 
 async def get_redis_client() -> IUniqueSetClient:
     """Instantiate and return RedisClient."""
+    global redis_client  # pylint: disable = global-statement
 
-    vaa_delivery_service = await get_vaa_delivery()
-    loop = await get_event_loop()
+    if redis_client is None:
+        vaa_delivery_service = await get_vaa_delivery()
+        loop = await get_event_loop()
+        redis_client = RedisClient(
+            vaa_delivery=vaa_delivery_service, logger=logger, loop=loop
+        )
 
-    return RedisClient(vaa_delivery=vaa_delivery_service, logger=logger, loop=loop)
+    return redis_client
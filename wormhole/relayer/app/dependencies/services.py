@@ -1,23 +1,46 @@
-from app.dependencies import CHAIN_DATA, get_evm_client, get_relays_repo, logger
+from typing import Mapping, Optional
+
+from app.dependencies import (
+    CHAIN_DATA,
+    get_evm_client,
+    get_relays_repo,
+    get_supported_evm_clients,
+    logger,
+)
 from app.usecases.interfaces.services.message_processor import IVaaProcessor
+from app.usecases.interfaces.services.nonce_manager import INonceManager
 from app.usecases.interfaces.services.vaa_delivery import IVaaDelivery
 from app.usecases.services.message_processor import MessageProcessor
+from app.usecases.services.nonce_manager import NonceManager
 from app.usecases.services.vaa_delivery import VaaDelivery
 
+nonce_managers: Optional[Mapping[int, INonceManager]] = None
 
-async def get_vaa_delivery() -> IVaaDelivery:
-    """Instantiates and returns the VAA Delivery Service."""
 
-    relays_repo = await get_relays_repo()
+async def get_nonce_managers() -> Mapping[int, INonceManager]:
+    """Instantiates and returns the per-chain nonce managers.
+
+    They are shared by everything that submits transactions, so there is one
+    nonce count per chain."""
+
+    global nonce_managers  # pylint: disable = global-statement
+    if nonce_managers is None:
+        nonce_managers = {}
+        for chain_id in CHAIN_DATA:
+            evm_client = await get_evm_client(chain_id=chain_id)
+            nonce_managers[chain_id] = NonceManager(
+                evm_client=evm_client, logger=logger
+            )
+    return nonce_managers
 
-    supported_evm_clients = {}
-    for chain_id in CHAIN_DATA:
-        evm_client = await get_evm_client(chain_id=chain_id)
-        supported_evm_clients[chain_id] = evm_client
+
+async def get_vaa_delivery() -> IVaaDelivery:
+    """Instantiates and returns the VAA Delivery Service."""
 
     return VaaDelivery(
-        relays_repo=relays_repo,
-        supported_evm_clients=supported_evm_clients,
+        relays_repo=await get_relays_repo(),
+        supported_evm_clients=await get_supported_evm_clients(),
+        nonce_managers=await get_nonce_managers(),
         logger=logger,
     )
 
@@ -1,16 +1,50 @@
 from logging import Logger
-from math import ceil
-from statistics import median
-from typing import Any, List, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional, Union
 
+from eth_account import Account
 from eth_account.datastructures import SignedTransaction
-from web3 import AsyncHTTPProvider, AsyncWeb3
-from web3.types import Nonce, TxReceipt
+from eth_utils import function_abi_to_4byte_selector
+from web3 import AsyncWeb3
+from web3.types import Nonce
 
-from app.dependencies import CHAIN_DATA
+from app.infrastructure.clients.rpc_pool import RpcProviderPool
 from app.settings import settings
 from app.usecases.interfaces.clients.evm import IEvmClient
-from app.usecases.schemas.blockchain import BlockchainClientError, TransactionHash
+from app.usecases.interfaces.clients.fee_oracle import IFeeOracle
+from app.usecases.interfaces.services.gas_limit_cache import IGasLimitCache
+from app.usecases.schemas.blockchain import (
+    BlockchainClientError,
+    BlockchainErrors,
+    TransactionHash,
+    TransactionReceipt,
+)
+
+ABI_WORD = 32
+# Head of a call whose only argument is dynamic: the offset of its data
+SINGLE_DYNAMIC_ARGUMENT_OFFSET = ABI_WORD.to_bytes(ABI_WORD, "big")
+
+
+def get_function_selector(abi: List[Mapping[str, Any]], name: str) -> bytes:
+    """Returns the 4-byte selector of the named function in abi."""
+    function_abi = next(
+        entry
+        for entry in abi
+        if entry.get("type") == "function" and entry["name"] == name
+    )
+    return function_abi_to_4byte_selector(function_abi)
+
+
+def encode_bytes_call(selector: bytes, argument: bytes) -> bytes:
+    """ABI-encodes the calldata of a function whose only argument is bytes."""
+    return b"".join(
+        (
+            selector,
+            SINGLE_DYNAMIC_ARGUMENT_OFFSET,
+            len(argument).to_bytes(ABI_WORD, "big"),
+            argument,
+            bytes(-len(argument) % ABI_WORD),
+        )
+    )
 
 
 class EvmClient(IEvmClient):
@@ -18,16 +52,29 @@ class EvmClient(IEvmClient):
         self,
         abi: List[Mapping[str, Any]],
         chain_id: int,
-        rpc_url: str,
+        web3_provider: RpcProviderPool,
+        fee_oracle: IFeeOracle,
+        gas_limit_cache: IGasLimitCache,
         logger: Logger,
     ) -> None:
         self.abi = abi
         self.chain_id = chain_id
-        self.rpc_url = rpc_url
-        self.web3_client = AsyncWeb3(AsyncHTTPProvider(self.rpc_url))
-        self.contract = self.web3_client.eth.contract(
-            address=self.web3_client.to_checksum_address(settings.evm_wormhole_bridge),
-            abi=abi,
+        self.web3_provider = web3_provider
+        self.fee_oracle = fee_oracle
+        self.gas_limit_cache = gas_limit_cache
+        self.web3_client = AsyncWeb3(web3_provider)
+        self.bridge_address = self.web3_client.to_checksum_address(
+            settings.evm_wormhole_bridge
+        )
+        self.relayer_address = self.web3_client.to_checksum_address(
+            settings.relayer_address
+        )
+        # from_key is a combomethod, so calling it on the class is fine.
+        self.account = Account.from_key(  # pylint: disable = no-value-for-parameter
+            settings.relayer_private_key
+        )
+        self.process_message_selector = get_function_selector(
+            abi=abi, name="processMessage"
         )
         self.logger = logger
 
@@ -39,7 +86,7 @@ class EvmClient(IEvmClient):
         try:
             signed_transaction = await self.__craft_transaction(
                 payload=payload,
-                nonce=nonce if nonce else await self.get_current_nonce(),
+                nonce=nonce if nonce is not None else await self.get_current_nonce(),
             )
             return await self.web3_client.eth.send_raw_transaction(
                 transaction=signed_transaction.rawTransaction
@@ -48,21 +95,147 @@ class EvmClient(IEvmClient):
             self.logger.error("[EvmClient]: VAA delivery failed. Error: %s", e)
             raise BlockchainClientError(detail=str(e)) from e
 
-    async def fetch_receipt(self, transaction_hash: str) -> TxReceipt:
-        """Fetches the transaction receipt for a given transaction hash."""
+    async def deliver_many(
+        self, payloads: List[bytes], nonces: List[int]
+    ) -> List[Union[TransactionHash, BlockchainClientError]]:
+        """Sends one transaction per payload to the destination blockchain; errors are returned in place.
+
+        Transactions are signed up front and then broadcast in nonce order with
+        batched JSON-RPC calls of broadcast_batch_size, stopping after the
+        batch with the first failure. Transactions the node accepted keep their
+        hash even behind a failed nonce, since they are mined once that nonce is
+        used again; those never sent fail with LOWER_NONCE_FAILED, and those
+        that may or may not have been sent with BROADCAST_UNKNOWN.
+        """
+        results: List[Union[TransactionHash, BlockchainClientError, None]] = [
+            None
+        ] * len(payloads)
+
+        # Insertion order is nonce order
+        raw_transactions: Dict[int, str] = {}
+        for index in sorted(range(len(payloads)), key=lambda index: nonces[index]):
+            try:
+                signed_transaction = await self.__craft_transaction(
+                    payload=payloads[index], nonce=nonces[index]
+                )
+            except Exception as e:  # pylint: disable = broad-except
+                self.logger.error("[EvmClient]: VAA delivery failed. Error: %s", e)
+                results[index] = BlockchainClientError(detail=str(e))
+                break
+            raw_transactions[index] = signed_transaction.rawTransaction.hex()
+
+        indices = list(raw_transactions)
+        for start in range(0, len(indices), settings.broadcast_batch_size):
+            batch = indices[start : start + settings.broadcast_batch_size]
+            try:
+                # Broadcasts are not retried on another endpoint
+                responses = await self.web3_provider.make_batch_request(
+                    requests=[
+                        {
+                            "jsonrpc": "2.0",
+                            "id": index,
+                            "method": "eth_sendRawTransaction",
+                            "params": [raw_transactions[index]],
+                        }
+                        for index in batch
+                    ],
+                    retry=False,
+                )
+            except Exception as e:  # pylint: disable = broad-except
+                self.logger.error("[EvmClient]: VAA delivery failed. Error: %s", e)
+                for index in batch:
+                    results[index] = BlockchainClientError(
+                        detail=f"{BlockchainErrors.BROADCAST_UNKNOWN.value} {e}"
+                    )
+                break
+
+            # Batch responses may come back in any order
+            for response in responses:
+                if "result" in response:
+                    results[response["id"]] = TransactionHash(response["result"])
+                else:
+                    detail = str(response.get("error", {}).get("message"))
+                    self.logger.error(
+                        "[EvmClient]: VAA delivery failed. Error: %s", detail
+                    )
+                    results[response["id"]] = BlockchainClientError(detail=detail)
+
+            for index in batch:
+                if results[index] is None:
+                    results[index] = BlockchainClientError(
+                        detail=BlockchainErrors.BROADCAST_UNKNOWN.value
+                    )
+            if any(
+                isinstance(results[index], BlockchainClientError) for index in batch
+            ):
+                break
+
+        # The rest were never broadcast
+        return [
+            result
+            if result is not None
+            else BlockchainClientError(detail=BlockchainErrors.LOWER_NONCE_FAILED.value)
+            for result in results
+        ]
+
+    async def fetch_receipts(
+        self, transaction_hashes: List[str]
+    ) -> List[Optional[TransactionReceipt]]:
+        """Fetches the receipts of the given transactions; None if not yet mined.
+
+        Receipts are requested with batched JSON-RPC calls of receipt_batch_size.
+        """
+        receipts = []
         try:
-            return await self.web3_client.eth.wait_for_transaction_receipt(
-                transaction_hash=transaction_hash, timeout=120, poll_latency=0.1
-            )
+            for start in range(0, len(transaction_hashes), settings.receipt_batch_size):
+                batch = transaction_hashes[start : start + settings.receipt_batch_size]
+                responses = await self.web3_provider.make_batch_request(
+                    requests=[
+                        {
+                            "jsonrpc": "2.0",
+                            "id": request_id,
+                            "method": "eth_getTransactionReceipt",
+                            "params": [transaction_hash],
+                        }
+                        for request_id, transaction_hash in enumerate(batch)
+                    ],
+                    hedge=True,
+                )
+
+                # Batch responses may come back in any order
+                results = {
+                    response["id"]: response.get("result") for response in responses
+                }
+                receipts.extend(
+                    self.__parse_receipt(receipt=results.get(request_id))
+                    for request_id in range(len(batch))
+                )
         except Exception as e:
             self.logger.error("[EvmClient]: Tx receipt retrieval failed. Error: %s", e)
             raise BlockchainClientError(detail=str(e)) from e
 
+        return receipts
+
+    def __parse_receipt(
+        self, receipt: Optional[Mapping[str, str]]
+    ) -> Optional[TransactionReceipt]:
+        if receipt is None:
+            return None
+
+        transaction_receipt = TransactionReceipt(
+            status=int(receipt["status"], 16), gas_used=int(receipt["gasUsed"], 16)
+        )
+        if transaction_receipt.status == 1:
+            self.gas_limit_cache.record_gas_used(gas_used=transaction_receipt.gas_used)
+        else:
+            self.gas_limit_cache.invalidate()
+        return transaction_receipt
+
     async def get_current_nonce(self) -> Nonce:
         """Retrieves the current nonce of the relayer on a provided destination chain."""
 
         return await self.web3_client.eth.get_transaction_count(
-            self.web3_client.to_checksum_address(settings.relayer_address)
+            self.relayer_address, "pending"
         )
 
     async def __craft_transaction(
@@ -72,44 +245,43 @@ class EvmClient(IEvmClient):
     ) -> SignedTransaction:
         """Craft a raw transaction to be sent to the blockchain."""
 
-        # Obtain destination chain information
-        post_london_upgrade = CHAIN_DATA[self.chain_id]["post_london_upgrade"]
-        has_fee_history = CHAIN_DATA[self.chain_id]["has_fee_history"]
+        calldata = encode_bytes_call(
+            selector=self.process_message_selector, argument=payload
+        )
 
-        # Build transaction
-        transaction_dict = {
-            "from": self.web3_client.to_checksum_address(settings.relayer_address),
-            "nonce": nonce,
+        call = {
+            "from": self.relayer_address,
+            "to": self.bridge_address,
+            "data": calldata,
         }
 
-        if post_london_upgrade:
-            if has_fee_history:
-                fee_history = await self.web3_client.eth.fee_history(
-                    block_count=settings.recent_blocks,
-                    newest_block="latest",
-                    reward_percentiles=[settings.priority_fee_percentile],
-                )
-                max_priority_fee_list = [
-                    percentile_list[0] for percentile_list in fee_history.reward
-                ]
-
-                base_fee_per_gas = max(
-                    fee_history.baseFeePerGas[-1], fee_history.baseFeePerGas[-2]
-                )
-                max_priority_fee = ceil(median(max_priority_fee_list))
-            else:
-                base_fee_per_gas = await self.web3_client.eth.gas_price
-                max_priority_fee = await self.web3_client.eth.max_priority_fee
-
-            transaction_dict["maxFeePerGas"] = base_fee_per_gas + max_priority_fee
-            transaction_dict["maxPriorityFeePerGas"] = max_priority_fee
+        # Estimate gas only when the cached gas limit has expired
+        gas_limit = self.gas_limit_cache.get_gas_limit()
+        if gas_limit is None:
+            self.gas_limit_cache.record_estimate(
+                gas=await self.web3_client.eth.estimate_gas(call)
+            )
+            gas_limit = self.gas_limit_cache.get_gas_limit()
         else:
-            transaction_dict["gasPrice"] = await self.web3_client.eth.gas_price
+            # Without an estimate, a call is what rejects a message that was
+            # already processed, e.g. on redelivery, rather than reverting on-chain.
+            # It is sent as is; web3's request validation costs a round trip.
+            response = await self.web3_provider.make_request(
+                "eth_call", [{**call, "data": "0x" + calldata.hex()}, "latest"]
+            )
+            if "error" in response:
+                # As web3 raises for an RPC error
+                raise ValueError(response["error"])
 
-        transaction = await self.contract.functions.processMessage(
-            payload
-        ).build_transaction(transaction_dict)
+        # Every field is known, so the transaction is signed as is
+        transaction = {
+            "chainId": self.chain_id,
+            "to": self.bridge_address,
+            "data": calldata,
+            "value": 0,
+            "nonce": nonce,
+            "gas": gas_limit,
+            **await self.fee_oracle.get_fees(),
+        }
 
-        return self.web3_client.eth.account.sign_transaction(
-            transaction_dict=transaction, private_key=settings.relayer_private_key
-        )
+        return self.account.sign_transaction(transaction_dict=transaction)
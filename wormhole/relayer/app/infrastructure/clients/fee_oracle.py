@@ -0,0 +1,126 @@
+import asyncio
+import time
+from collections import deque
+from logging import Logger
+from math import ceil
+from statistics import median
+from typing import Deque, Dict, Optional
+
+from web3 import AsyncWeb3
+from web3.providers.async_base import AsyncBaseProvider
+
+from app.dependencies import CHAIN_DATA
+from app.settings import settings
+from app.usecases.interfaces.clients.fee_oracle import IFeeOracle
+
+
+class EvmFeeOracle(IFeeOracle):
+    """Keeps a chain's gas-price fields in memory, refreshed in the background.
+
+    For chains with fee history, the priority fees of the last recent_blocks
+    blocks are kept in a rolling window; each refresh only fetches the fee
+    history of blocks produced since the previous one. Fees older than
+    fee_oracle_max_age, e.g. because refreshes keep failing, are refreshed
+    before being returned. Refreshes run one at a time.
+    """
+
+    def __init__(
+        self, chain_id: int, web3_provider: AsyncBaseProvider, logger: Logger
+    ) -> None:
+        self.chain_id = chain_id
+        self.web3_client = AsyncWeb3(web3_provider)
+        self.logger = logger
+        self.post_london_upgrade = CHAIN_DATA[chain_id]["post_london_upgrade"]
+        self.has_fee_history = CHAIN_DATA[chain_id]["has_fee_history"]
+
+        self.priority_fees: Deque[int] = deque(maxlen=settings.recent_blocks)
+        self.newest_block: Optional[int] = None
+        self.fees: Optional[Dict[str, int]] = None
+        self.fetched_at: Optional[float] = None
+        self.refresh_task: Optional[asyncio.Task] = None
+        self.refresh_lock = asyncio.Lock()
+
+    async def get_fees(self) -> Dict[str, int]:
+        """Returns the gas-price fields for a transaction on the chain."""
+        if self.refresh_task is None:
+            self.refresh_task = asyncio.create_task(self.__start_refreshing())
+        if self.__is_stale():
+            async with self.refresh_lock:
+                # Another caller may have refreshed them in the meantime.
+                if self.__is_stale():
+                    # Raises if the chain cannot be reached, rather than serving
+                    # stale fees.
+                    await self.__refresh()
+        return dict(self.fees)
+
+    def __is_stale(self) -> bool:
+        return (
+            self.fees is None
+            or time.monotonic() - self.fetched_at > settings.fee_oracle_max_age
+        )
+
+    async def __start_refreshing(self) -> None:
+        while True:
+            await asyncio.sleep(settings.fee_oracle_refresh_frequency)
+            try:
+                async with self.refresh_lock:
+                    await self.__refresh()
+            except asyncio.CancelledError:  # pylint: disable = try-except-raise
+                raise
+            except Exception as e:  # pylint: disable = broad-except
+                self.logger.error(
+                    "[EvmFeeOracle]: Fee refresh failed; chain id: %s. Error: %s",
+                    self.chain_id,
+                    e,
+                )
+
+    async def __refresh(self) -> None:
+        fetched_at = time.monotonic()
+        if await self.__fetch_fees():
+            self.fetched_at = fetched_at
+
+    async def __fetch_fees(self) -> bool:
+        """Fetches the latest fees; returns False if there were none newer."""
+        if not self.post_london_upgrade:
+            self.fees = {"gasPrice": await self.web3_client.eth.gas_price}
+            return True
+
+        if not self.has_fee_history:
+            base_fee_per_gas = await self.web3_client.eth.gas_price
+            max_priority_fee = await self.web3_client.eth.max_priority_fee
+            self.fees = {
+                "maxFeePerGas": base_fee_per_gas + max_priority_fee,
+                "maxPriorityFeePerGas": max_priority_fee,
+            }
+            return True
+
+        latest_block = await self.web3_client.eth.block_number
+        # An endpoint lagging behind the previous one may report an older block.
+        if self.newest_block is not None and latest_block <= self.newest_block:
+            return False
+
+        new_blocks = (
+            latest_block - self.newest_block
+            if self.newest_block is not None
+            else settings.recent_blocks
+        )
+        fee_history = await self.web3_client.eth.fee_history(
+            block_count=min(new_blocks, settings.recent_blocks),
+            newest_block=latest_block,
+            reward_percentiles=[settings.priority_fee_percentile],
+        )
+        self.priority_fees.extend(
+            percentile_list[0] for percentile_list in fee_history.reward
+        )
+        self.newest_block = latest_block
+
+        # The last base fee is the one of the block after latest_block.
+        base_fee_per_gas = max(
+            fee_history.baseFeePerGas[-1], fee_history.baseFeePerGas[-2]
+        )
+        max_priority_fee = ceil(median(self.priority_fees))
+        self.fees = {
+            "maxFeePerGas": base_fee_per_gas + max_priority_fee,
+            "maxPriorityFeePerGas": max_priority_fee,
+        }
+        return True
@@ -1,14 +1,47 @@
 import asyncio
-from asyncio import AbstractEventLoop
+import time
+from asyncio import AbstractEventLoop, Queue, Semaphore, Task
 from datetime import datetime, timezone
 from logging import Logger
+from typing import Dict, List, NamedTuple, Optional, Set
 
 import aioredis
 from aioredis import Redis, exceptions
 
+from app import metrics
+from app.dependencies import CHAIN_ID_LOOKUP
 from app.settings import settings
 from app.usecases.interfaces.clients.unique_set import IUniqueSetClient
 from app.usecases.interfaces.services.vaa_delivery import IVaaDelivery
+from app.usecases.schemas.unique_set import UniqueSetTransport
+from app.usecases.services.unique_set_codec import decode_dest_chain_id
+
+# Pops up to ARGV[2] members scored at most ARGV[1], after skipping the first
+# ARGV[3], and returns them with their scores.
+CONSUME_SCRIPT = """
+local items = redis.call(
+    "zrangebyscore", KEYS[1], "-inf", ARGV[1],
+    "WITHSCORES", "LIMIT", ARGV[3], ARGV[2]
+)
+local members = {}
+for i = 1, #items, 2 do
+    members[#members + 1] = items[i]
+end
+if #members > 0 then
+    redis.call("zrem", KEYS[1], unpack(members))
+end
+return items
+"""
+
+
+class LaneEntry(NamedTuple):
+    """A message queued on its destination chain's lane."""
+
+    message: bytes
+    # Stream entries are acknowledged once handled
+    entry_id: Optional[bytes] = None
+    # Sorted-set members are re-added with their score if never delivered
+    score: Optional[float] = None
 
 
 class RedisClient(IUniqueSetClient):
@@ -16,15 +49,15 @@ class RedisClient(IUniqueSetClient):
         self, vaa_delivery: IVaaDelivery, logger: Logger, loop: AbstractEventLoop
     ) -> None:
         self.vaa_delivery = vaa_delivery
-        self.script = """
-        local items = redis.call("zrangebyscore", KEYS[1], "-inf", ARGV[1])
-        if #items > 0 then
-            redis.call("zrem", KEYS[1], unpack(items))
-        end
-        return items
-        """
         self.logger = logger
-        loop.create_task(self.__start_consumption())
+        self.loop = loop
+        self.redis: Optional[Redis] = None
+        # One lane per Wormhole destination-chain ID
+        self.lanes: Dict[int, Queue] = {}
+        self.lane_tasks: List[Task] = []
+        self.in_flight: Set[Task] = set()
+        self.stopping = asyncio.Event()
+        self.consumer = loop.create_task(self.__start_consumption())
 
     async def __connect(self) -> Redis:
         """Connect to Redis."""
@@ -35,34 +68,342 @@ class RedisClient(IUniqueSetClient):
 
     async def __start_consumption(self) -> None:
         """Starts listening for messages to consume."""
-        while True:
+        while not self.stopping.is_set():
             try:
-                redis = await self.__connect()
-                script_sha = await redis.script_load(self.script)
-
-                while True:
-                    await asyncio.sleep(settings.redis_consumption_frequency)
-                    current_date = datetime.now(timezone.utc)
-                    current_time = current_date.timestamp()
-                    max_score = current_time - settings.redis_min_message_age
-
-                    messages = await redis.evalsha(
-                        script_sha, 1, settings.redis_zset, max_score
-                    )
-                    for message in messages:
-                        await self.__on_message(message=message)
+                self.redis = await self.__connect()
+                if settings.redis_transport == UniqueSetTransport.STREAM:
+                    await self.__consume_stream(redis=self.redis)
+                else:
+                    await self.__consume_sorted_set(redis=self.redis)
             except exceptions.ConnectionError:
                 self.logger.error(
                     "[RedisClient]: Connection error, attempting reconnect..."
                 )
-                await asyncio.sleep(settings.redis_reconnect_frequency)
+                await self.__pause(delay=settings.redis_reconnect_frequency)
 
             except exceptions.RedisError as e:
                 self.logger.error("[RedisClient]: Unexpected error: %s", str(e))
 
-    async def __on_message(self, message: bytes) -> None:
+    async def __pause(self, delay: float) -> None:
+        """Sleeps for delay seconds, waking early if the client is stopping."""
+        if delay <= 0:
+            return
+        try:
+            await asyncio.wait_for(self.stopping.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
+
+    async def __consume_sorted_set(self, redis: Redis) -> None:
+        """Pops messages that are old enough from the sorted set.
+
+        Members whose lane is full are put back with their score. Being the
+        oldest, they are skipped over until one of their lanes has room again.
+        """
+        script_sha = await redis.script_load(CONSUME_SCRIPT)
+
+        backed_up: Set[int] = set()
+        skipped = 0
+        delay = 0.0
+        while True:
+            await self.__pause(delay=delay)
+            if self.stopping.is_set():
+                return
+            if any(not self.lanes[chain_id].full() for chain_id in backed_up):
+                backed_up.clear()
+                skipped = 0
+
+            start = time.perf_counter()
+            max_score = (
+                datetime.now(timezone.utc).timestamp() - settings.redis_min_message_age
+            )
+
+            items = await redis.evalsha(
+                script_sha,
+                1,
+                settings.redis_zset,
+                max_score,
+                settings.redis_consumption_batch_size,
+                skipped,
+            )
+            held_back: Dict[bytes, float] = {}
+            for message, score in zip(items[::2], items[1::2]):
+                entry = LaneEntry(message=message, score=float(score))
+                if not await self.__dispatch(entry=entry, backed_up=backed_up):
+                    held_back[message] = entry.score
+            if held_back:
+                await redis.zadd(settings.redis_zset, held_back, nx=True)
+                skipped += len(held_back)
+
+            batch_size = len(items) // 2
+            metrics.REDIS_BATCH_SIZE.observe(batch_size)
+            metrics.REDIS_POLL_SECONDS.observe(time.perf_counter() - start)
+
+            delay = self.__next_poll_delay(delay=delay, batch_size=batch_size)
+            if backed_up:
+                # Check back soon for room in the backed-up lanes.
+                delay = min(delay, settings.redis_consumption_frequency)
+
+    @staticmethod
+    def __next_poll_delay(delay: float, batch_size: int) -> float:
+        """Polls again at once after a full batch and backs off while empty."""
+        if batch_size >= settings.redis_consumption_batch_size:
+            return 0.0
+        if batch_size:
+            return settings.redis_consumption_frequency
+        return min(
+            max(delay * 2, settings.redis_consumption_frequency),
+            settings.redis_consumption_max_backoff,
+        )
+
+    async def __consume_stream(self, redis: Redis) -> None:
+        """Reads new entries for this consumer from the stream's consumer group.
+
+        Entries stay pending until acknowledged after processing; those another
+        consumer left pending for too long are periodically claimed. Entries
+        whose lane is full are left pending, to be claimed again later.
+        """
+        try:
+            await redis.xgroup_create(
+                name=settings.redis_stream,
+                groupname=settings.redis_consumer_group,
+                id="0",
+                mkstream=True,
+            )
+        except exceptions.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+        claim_cursor = "0-0"
+        last_claim = 0.0
+        while not self.stopping.is_set():
+            if self.loop.time() - last_claim >= settings.redis_stream_claim_frequency:
+                claim_cursor = await self.__claim_stream_entries(
+                    redis=redis, cursor=claim_cursor
+                )
+                last_claim = self.loop.time()
+
+            streams = await redis.xreadgroup(
+                groupname=settings.redis_consumer_group,
+                consumername=settings.redis_consumer_name,
+                streams={settings.redis_stream: ">"},
+                count=settings.redis_stream_batch_size,
+                block=settings.redis_stream_block_ms,
+            )
+            backed_up: Set[int] = set()
+            for _, entries in streams:
+                for entry_id, fields in entries:
+                    await self.__wait_for_min_age(entry_id=entry_id)
+                    await self.__dispatch(
+                        entry=LaneEntry(message=fields[b"message"], entry_id=entry_id),
+                        backed_up=backed_up,
+                    )
+
+    async def __claim_stream_entries(self, redis: Redis, cursor: str) -> str:
+        """Claims one batch of entries left pending by other consumers.
+
+        Returns the cursor to resume claiming from next time.
+        """
+        # XAUTOCLAIM is not wrapped by aioredis, so its reply is parsed here:
+        # [next cursor, [entry id, ...]] and, since Redis 7, [deleted ids].
+        # Only the ids are claimed, since Redis 6.2 replies with nil in place
+        # of entries trimmed from the stream and so loses their ids.
+        reply = await redis.execute_command(
+            "XAUTOCLAIM",
+            settings.redis_stream,
+            settings.redis_consumer_group,
+            settings.redis_consumer_name,
+            settings.redis_stream_claim_idle_ms,
+            cursor,
+            "COUNT",
+            settings.redis_stream_batch_size,
+            "JUSTID",
+        )
+        next_cursor, entry_ids = reply[0], reply[1]
+        trimmed: List[bytes] = list(reply[2]) if len(reply) > 2 else []
+
+        async with redis.pipeline(transaction=False) as pipe:
+            for entry_id in entry_ids:
+                pipe.xrange(settings.redis_stream, min=entry_id, max=entry_id)
+            ranges = await pipe.execute()
+
+        claimed = 0
+        backed_up: Set[int] = set()
+        for entry_id, entries in zip(entry_ids, ranges):
+            message = entries[0][1].get(b"message") if entries else None
+            # Entries trimmed from the stream while pending can never be delivered.
+            if message is None:
+                trimmed.append(entry_id)
+                continue
+            claimed += 1
+            await self.__dispatch(
+                entry=LaneEntry(message=message, entry_id=entry_id),
+                backed_up=backed_up,
+            )
+
+        if trimmed:
+            await redis.xack(
+                settings.redis_stream, settings.redis_consumer_group, *trimmed
+            )
+        if claimed or trimmed:
+            self.logger.info(
+                "[RedisClient]: Claimed %s stale stream entries; acknowledged %s trimmed.",
+                claimed,
+                len(trimmed),
+            )
+        return next_cursor.decode() if isinstance(next_cursor, bytes) else next_cursor
+
+    @staticmethod
+    async def __wait_for_min_age(entry_id: bytes) -> None:
+        """Holds an entry back until the listener has had time to store its relay."""
+        created_ms = int(entry_id.split(b"-")[0])
+        delay = (
+            created_ms + settings.redis_stream_min_message_age_ms
+        ) / 1000 - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def __dispatch(self, entry: LaneEntry, backed_up: Set[int]) -> bool:
+        """Queue a message on its destination chain's lane without waiting.
+
+        Returns False if the lane is full, or held back earlier messages from
+        this batch, so that one chain's backlog never holds up another's. The
+        chain is then added to backed_up and the caller keeps the message.
+        """
+        try:
+            dest_chain_id = decode_dest_chain_id(member=entry.message)
+        except (ValueError, TypeError, KeyError):
+            dest_chain_id = None
+        # Such a message can never be delivered, so it is not left pending.
+        if dest_chain_id not in CHAIN_ID_LOOKUP:
+            self.logger.error(
+                "[RedisClient]: Dropping message without a supported destination chain: %s.",
+                str(entry.message),
+            )
+            if entry.entry_id is not None:
+                await self.__acknowledge(entry_id=entry.entry_id)
+            return True
+
+        lane = self.lanes.get(dest_chain_id)
+        if lane is None:
+            lane = Queue(maxsize=settings.redis_lane_queue_size)
+            self.lanes[dest_chain_id] = lane
+            self.lane_tasks.append(
+                self.loop.create_task(
+                    self.__run_lane(dest_chain_id=dest_chain_id, lane=lane)
+                )
+            )
+
+        if dest_chain_id in backed_up or lane.full():
+            backed_up.add(dest_chain_id)
+            return False
+        lane.put_nowait(entry)
+        return True
+
+    async def __run_lane(self, dest_chain_id: int, lane: Queue) -> None:
+        """Deliver a destination chain's messages in the order they were received.
+
+        Deliveries are started strictly in order; up to the chain's configured
+        concurrency may be in flight at once.
+        """
+        concurrency = settings.redis_lane_concurrency.get(
+            dest_chain_id, settings.redis_default_lane_concurrency
+        )
+        semaphore = Semaphore(concurrency)
+
+        while True:
+            # A message is only taken off the lane once it can be delivered, so
+            # whatever is still queued can be put back on shutdown.
+            await semaphore.acquire()
+            entry = await lane.get()
+            task = self.loop.create_task(
+                self.__on_message(entry=entry, semaphore=semaphore)
+            )
+            self.in_flight.add(task)
+            task.add_done_callback(self.in_flight.discard)
+            task.add_done_callback(lambda _: lane.task_done())
+
+    async def __on_message(self, entry: LaneEntry, semaphore: Semaphore) -> None:
         """Handle receiving an individual Redis message."""
 
-        self.logger.info("[RedisClient]: Received message: %s.", str(message))
+        self.logger.info("[RedisClient]: Received message: %s.", str(entry.message))
+
+        try:
+            await self.vaa_delivery.process(set_message=entry.message)
+        except Exception as e:  # pylint: disable = broad-except
+            # Left pending, a stream entry is claimed and redelivered later.
+            self.logger.exception(e)
+            return
+        finally:
+            semaphore.release()
+
+        # Transactions the chain rejected are recorded on the relay and retried
+        # from the database, so the entry is done with.
+        if entry.entry_id is not None:
+            await self.__acknowledge(entry_id=entry.entry_id)
+
+    async def __acknowledge(self, entry_id: bytes) -> None:
+        """Acknowledges a stream entry.
+
+        Its member stays in the companion set, deduplicating repeats, until the
+        listener expires it.
+        """
+        if not self.redis:
+            return
+        try:
+            await self.redis.xack(
+                settings.redis_stream, settings.redis_consumer_group, entry_id
+            )
+        except exceptions.RedisError as e:
+            # Left pending, the entry is claimed and redelivered later.
+            self.logger.error(
+                "[RedisClient]: Failed to acknowledge stream entry %s: %s",
+                entry_id.decode(),
+                str(e),
+            )
+
+    async def stop(self, timeout: float) -> None:
+        """Stops consuming, gives the queued messages up to timeout seconds to be
+        delivered, then puts the rest back and closes the connection."""
 
-        await self.vaa_delivery.process(set_message=message)
+        self.stopping.set()
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(self.consumer, return_exceptions=True), timeout=timeout
+            )
+            await asyncio.wait_for(
+                asyncio.gather(*(lane.join() for lane in self.lanes.values())),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            self.logger.warning(
+                "[RedisClient]: Stopped with %s messages still queued.",
+                sum(lane.qsize() for lane in self.lanes.values()),
+            )
+
+        for task in [*self.lane_tasks, *self.in_flight]:
+            task.cancel()
+        await asyncio.gather(*self.lane_tasks, *self.in_flight, return_exceptions=True)
+        self.lane_tasks = []
+
+        # Stream entries stay pending and are claimed again later.
+        undelivered: Dict[bytes, float] = {}
+        for lane in self.lanes.values():
+            while not lane.empty():
+                entry = lane.get_nowait()
+                if entry.score is not None:
+                    undelivered[entry.message] = entry.score
+        self.lanes = {}
+
+        if self.redis:
+            try:
+                if undelivered:
+                    await self.redis.zadd(settings.redis_zset, undelivered, nx=True)
+            except exceptions.RedisError as e:
+                self.logger.error(
+                    "[RedisClient]: Failed to put back %s undelivered messages: %s",
+                    len(undelivered),
+                    str(e),
+                )
+            await self.redis.close()
+            self.redis = None
+            self.logger.info("[RedisClient]: Connection closed.")
@@ -33,3 +33,11 @@ RELAYS = sa.Table(
     ),
     schema=settings.db_schema,
 )
+
+
+# Keeps the stale-pending sweep to the small pending slice of the table.
+sa.Index(
+    "ix_relays_pending_created_at",
+    RELAYS.c.created_at,
+    postgresql_where=RELAYS.c.status == "pending",
+)
@@ -2,7 +2,19 @@ from datetime import datetime, timedelta
 from typing import List, Optional
 
 from databases import Database
-from sqlalchemy import and_, select
+from sqlalchemy import (
+    BigInteger,
+    Integer,
+    String,
+    Text,
+    and_,
+    cast,
+    column,
+    func,
+    select,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 
 from app.infrastructure.db.models.relays import RELAYS
 from app.infrastructure.db.models.transactions import TRANSACTIONS
@@ -10,12 +22,17 @@ from app.settings import settings
 from app.usecases.interfaces.repos.relays import IRelaysRepo
 from app.usecases.schemas.relays import (
     CacheStatus,
+    StaleRelay,
     Status,
+    UpdateByIdRepoAdapter,
     UpdateJoinedRepoAdapter,
     UpdateRepoAdapter,
 )
 from app.usecases.schemas.transactions import CreateRepoAdapter, TransactionsJoinRelays
 
+# asyncpg allows at most 32767 bind parameters per statement; four per relay.
+MAX_RELAYS_PER_UPDATE = 8000
+
 
 class RelaysRepo(IRelaysRepo):
     def __init__(self, db: Database):
@@ -49,6 +66,144 @@ class RelaysRepo(IRelaysRepo):
 
             await self.db.execute(insert_statement)
 
+    async def create_many(self, transactions: List[CreateRepoAdapter]) -> None:
+        """Creates many new transaction and relay objects with one statement.
+        Transactions that already exist are skipped, along with their relays.
+        """
+
+        if transactions:
+            await self.db.execute(
+                self.__create_many_statement(transactions=transactions)
+            )
+
+    def __create_many_statement(self, transactions: List[CreateRepoAdapter]):
+        columns = {
+            "emitter_address": (
+                String,
+                [transaction.emitter_address.lower() for transaction in transactions],
+            ),
+            "from_address": (
+                String,
+                [transaction.from_address.lower() for transaction in transactions],
+            ),
+            "to_address": (
+                String,
+                [transaction.to_address.lower() for transaction in transactions],
+            ),
+            "source_chain_id": (
+                Integer,
+                [transaction.source_chain_id for transaction in transactions],
+            ),
+            "dest_chain_id": (
+                Integer,
+                [transaction.dest_chain_id for transaction in transactions],
+            ),
+            "amount": (
+                BigInteger,
+                [transaction.amount for transaction in transactions],
+            ),
+            "sequence": (
+                BigInteger,
+                [transaction.sequence for transaction in transactions],
+            ),
+            "status": (
+                String,
+                [transaction.relay_status.value for transaction in transactions],
+            ),
+            "error": (
+                Text,
+                [transaction.relay_error for transaction in transactions],
+            ),
+            "message": (
+                String,
+                [transaction.relay_message for transaction in transactions],
+            ),
+            "cache_status": (
+                String,
+                [transaction.relay_cache_status.value for transaction in transactions],
+            ),
+            "grpc_status": (
+                String,
+                [transaction.relay_grpc_status.value for transaction in transactions],
+            ),
+        }
+
+        # One array per column keeps the statement the same size for any batch;
+        # the rows are read by both inserts, so they are unnested once in a CTE.
+        rows = (
+            func.unnest(
+                *(
+                    cast(array, ARRAY(column_type))
+                    for column_type, array in columns.values()
+                )
+            )
+            .table_valued(*columns)
+            .render_derived(name="rows")
+        )
+        new_rows = select(rows).cte("new_rows")
+
+        new_transactions = (
+            insert(TRANSACTIONS)
+            .from_select(
+                [
+                    TRANSACTIONS.c.emitter_address,
+                    TRANSACTIONS.c.from_address,
+                    TRANSACTIONS.c.to_address,
+                    TRANSACTIONS.c.source_chain_id,
+                    TRANSACTIONS.c.dest_chain_id,
+                    TRANSACTIONS.c.amount,
+                    TRANSACTIONS.c.sequence,
+                ],
+                select(
+                    new_rows.c.emitter_address,
+                    new_rows.c.from_address,
+                    new_rows.c.to_address,
+                    new_rows.c.source_chain_id,
+                    new_rows.c.dest_chain_id,
+                    new_rows.c.amount,
+                    new_rows.c.sequence,
+                ),
+            )
+            .on_conflict_do_nothing()
+            .returning(
+                TRANSACTIONS.c.id.label("new_id"),
+                TRANSACTIONS.c.emitter_address.label("new_emitter_address"),
+                TRANSACTIONS.c.source_chain_id.label("new_source_chain_id"),
+                TRANSACTIONS.c.sequence.label("new_sequence"),
+            )
+            .cte("new_transactions")
+        )
+
+        return insert(RELAYS).from_select(
+            [
+                RELAYS.c.transaction_id,
+                RELAYS.c.status,
+                RELAYS.c.error,
+                RELAYS.c.message,
+                RELAYS.c.cache_status,
+                RELAYS.c.grpc_status,
+            ],
+            select(
+                new_transactions.c.new_id,
+                new_rows.c.status,
+                new_rows.c.error,
+                new_rows.c.message,
+                new_rows.c.cache_status,
+                new_rows.c.grpc_status,
+            ).select_from(
+                new_transactions.join(
+                    new_rows,
+                    and_(
+                        new_transactions.c.new_emitter_address
+                        == new_rows.c.emitter_address,
+                        new_transactions.c.new_source_chain_id
+                        == new_rows.c.source_chain_id,
+                        new_transactions.c.new_sequence == new_rows.c.sequence,
+                    ),
+                )
+            ),
+        )
+
     async def update(self, relay: UpdateRepoAdapter) -> None:
         """Updates relay object."""
 
@@ -80,6 +235,51 @@ class RelaysRepo(IRelaysRepo):
 
         await self.db.execute(update_statement)
 
+    async def update_many(self, relays: List[UpdateByIdRepoAdapter]) -> None:
+        """Update many relay objects with one statement per 8000 relays."""
+
+        # NOTE: as with update(), error is the only thing that can be updated to none.
+
+        for i in range(0, len(relays), MAX_RELAYS_PER_UPDATE):
+            await self.db.execute(
+                self.__update_many_statement(
+                    relays=relays[i : i + MAX_RELAYS_PER_UPDATE]
+                )
+            )
+
+    def __update_many_statement(self, relays: List[UpdateByIdRepoAdapter]):
+        columns = [
+            column("relay_id", BigInteger),
+            column("status", String),
+            column("transaction_hash", String),
+            column("error", Text),
+        ]
+
+        # Every value is cast so that Postgres can type the VALUES columns.
+        updates = values(*columns, name="updates").data(
+            [
+                (
+                    cast(relay.relay_id, BigInteger),
+                    cast(relay.status, String),
+                    cast(relay.transaction_hash, String),
+                    cast(relay.error, Text),
+                )
+                for relay in relays
+            ]
+        )
+
+        return (
+            RELAYS.update()
+            .values(
+                status=func.coalesce(updates.c.status, RELAYS.c.status),
+                transaction_hash=func.coalesce(
+                    updates.c.transaction_hash, RELAYS.c.transaction_hash
+                ),
+                error=updates.c.error,
+            )
+            .where(RELAYS.c.id == updates.c.relay_id)
+        )
+
     async def update_relay_and_transaction(
         self, update_data: UpdateJoinedRepoAdapter
     ) -> None:
@@ -213,30 +413,30 @@ class RelaysRepo(IRelaysRepo):
 
         return TransactionsJoinRelays(**result) if result else None
 
-    async def retrieve_pending(self) -> List[TransactionsJoinRelays]:
-        """Retrieves transactions that have been pending for longer than 1 minute."""
-
-        query_conditions = [
-            RELAYS.c.status == Status.PENDING,
-            RELAYS.c.created_at
-            < datetime.utcnow() - timedelta(minutes=settings.max_pending_time_minutes),
-        ]
-
-        j = TRANSACTIONS.join(RELAYS, TRANSACTIONS.c.id == RELAYS.c.transaction_id)
-
-        columns_to_select = [
-            TRANSACTIONS,
-            RELAYS.c.id.label("relay_id"),
-            RELAYS.c.status.label("relay_status"),
-            RELAYS.c.error.label("relay_error"),
-            RELAYS.c.message.label("relay_message"),
-            RELAYS.c.transaction_hash.label("relay_transaction_hash"),
-            RELAYS.c.cache_status.label("relay_cache_status"),
-            RELAYS.c.grpc_status.label("relay_grpc_status"),
-        ]
+    async def update_stale_pending(
+        self, status: Status, error: str
+    ) -> List[StaleRelay]:
+        """Updates relays that have been pending for too long and returns their keys."""
 
-        query = select(columns_to_select).select_from(j).where(and_(*query_conditions))
+        update_statement = (
+            RELAYS.update()
+            .values(status=status, error=error)
+            .where(
+                and_(
+                    RELAYS.c.status == Status.PENDING,
+                    RELAYS.c.created_at
+                    < datetime.utcnow()
+                    - timedelta(minutes=settings.max_pending_time_minutes),
+                    RELAYS.c.transaction_id == TRANSACTIONS.c.id,
+                )
+            )
+            .returning(
+                RELAYS.c.id.label("relay_id"),
+                TRANSACTIONS.c.source_chain_id.label("source_chain_id"),
+                TRANSACTIONS.c.sequence.label("sequence"),
+            )
+        )
 
-        results = await self.db.fetch_all(query)
+        results = await self.db.fetch_all(update_statement)
 
-        return [TransactionsJoinRelays(**result) for result in results]
+        return [StaleRelay(**result) for result in results]
@@ -3,9 +3,14 @@ import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.dependencies import get_client_session, get_event_loop, get_redis_client
+from app.dependencies import (
+    get_client_session,
+    get_event_loop,
+    get_redis_client,
+    get_rpc_session,
+)
 from app.infrastructure.db.core import get_or_create_database
-from app.infrastructure.web.endpoints.metrics import health
+from app.infrastructure.web.endpoints.metrics import health, prometheus
 from app.settings import settings
 from app.usecases.tasks.events.startup import (
     start_gather_missed_task,
@@ -22,6 +27,7 @@ def setup_app() -> FastAPI:
         description="Facilitates message passing between chains.",
         openapi_url=settings.openapi_url,
     )
+    fastapi_app.include_router(prometheus.prometheus_router, prefix="/metrics")
     fastapi_app.include_router(health.health_router, prefix="/metrics/health")
 
     # CORS (Cross-Origin Resource Sharing)
@@ -56,9 +62,14 @@ async def startup_event() -> None:
 
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
-    # Close client session
+    # Drain queued messages while the database and RPC sessions are still open
+    redis_client = await get_redis_client()
+    await redis_client.stop(timeout=settings.redis_drain_timeout)
+    # Close client sessions
     client_session = await get_client_session()
     await client_session.close()
+    rpc_session = await get_rpc_session()
+    await rpc_session.close()
     # Close database connection
     DATABASE = await get_or_create_database()
     if DATABASE.is_connected:
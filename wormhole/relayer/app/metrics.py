@@ -0,0 +1,32 @@
+"""Prometheus metrics for the relayer, served at /metrics."""
+from prometheus_client import Histogram
+
+# Batches are bounded by redis_consumption_batch_size.
+BATCH_SIZE_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+# A poll is one Redis round trip plus queueing its messages on their lanes.
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+REDIS_BATCH_SIZE = Histogram(
+    "relayer_redis_batch_size",
+    "Messages popped from the Redis sorted set by one poll.",
+    buckets=BATCH_SIZE_BUCKETS,
+)
+REDIS_POLL_SECONDS = Histogram(
+    "relayer_redis_poll_seconds",
+    "Time spent popping and dispatching one batch from the Redis sorted set.",
+    buckets=LATENCY_BUCKETS,
+)
@@ -1,6 +1,10 @@
+import socket
 from os import path
+from typing import Dict
 
-from pydantic import BaseSettings
+from pydantic import BaseSettings, Field
+
+from app.usecases.schemas.unique_set import UniqueSetTransport
 
 # File path to the global .env file
 DOTENV_FILE = ".env" if path.isfile(".env") else None
@@ -23,11 +27,37 @@ class Settings(BaseSettings):
     db_schema: str
 
     # Redis
-    redis_consumption_frequency: int = 1
+    # The sorted set is polled again at once after a full batch; otherwise the
+    # poll interval starts at redis_consumption_frequency and doubles while the
+    # set has nothing eligible, up to redis_consumption_max_backoff.
+    redis_consumption_frequency: float = 1
+    redis_consumption_max_backoff: float = 8
+    redis_consumption_batch_size: int = 100
     redis_reconnect_frequency: int = 5
     redis_min_message_age: int = 15
     redis_zset: str
     redis_url: str
+    # Messages are delivered in per-destination-chain lanes. Concurrency is the
+    # number of in-flight deliveries per lane, keyed by Wormhole chain ID,
+    # e.g. REDIS_LANE_CONCURRENCY='{"2": 1, "5": 4}'
+    redis_default_lane_concurrency: int = 1
+    redis_lane_concurrency: Dict[int, int] = {}
+    redis_lane_queue_size: int = 100
+    # Seconds given to queued deliveries on shutdown; the rest are put back.
+    redis_drain_timeout: float = 10
+    # With the stream transport, relayer replicas share a consumer group and
+    # acknowledge each entry once handled; entries left pending by a replica
+    # that died are claimed by another after redis_stream_claim_idle_ms.
+    redis_transport: UniqueSetTransport = UniqueSetTransport.SORTED_SET
+    redis_stream: str = "wormhole:vaas"
+    redis_stream_members: str = "wormhole:vaas:members"
+    redis_consumer_group: str = "relayers"
+    redis_consumer_name: str = Field(default_factory=socket.gethostname)
+    redis_stream_batch_size: int = 100
+    redis_stream_block_ms: int = 1000
+    redis_stream_min_message_age_ms: int = 1000
+    redis_stream_claim_idle_ms: int = 5 * 60 * 1000
+    redis_stream_claim_frequency: int = 60
 
     # RPC Urls
     ethereum_rpc: str
@@ -39,19 +69,43 @@ class Settings(BaseSettings):
     celo_rpc: str
     optimism_rpc: str
 
+    # RPC connection pool, shared by every web3 provider
+    rpc_connection_limit: int = 100
+    rpc_connection_limit_per_host: int = 20
+    rpc_keepalive_timeout: float = 60
+    rpc_dns_cache_ttl: int = 60 * 5
+    rpc_timeout: float = 10
+    rpc_connect_timeout: float = 5
+    # Each RPC URL may be a comma-separated list of URLs for the chain. Requests
+    # go to the healthiest; idempotent reads may also be hedged on the next one.
+    rpc_hedge_reads: bool = False
+    rpc_hedge_min_delay: float = 0.05
+    rpc_latency_window: int = 100
+    rpc_endpoint_max_errors: int = 3
+    rpc_endpoint_cooldown: float = 30
+
     # EVM
     relayer_private_key: str
     relayer_address: str
     evm_wormhole_bridge: str
     priority_fee_percentile: int
     recent_blocks: int = 100
+    fee_oracle_refresh_frequency: float = 2
+    fee_oracle_max_age: float = 30
+    gas_limit_safety_margin: float = 0.2
+    gas_limit_window: int = 20
+    gas_limit_estimate_frequency: int = 60 * 5
+    receipt_batch_size: int = 100
+    broadcast_batch_size: int = 100
 
     # BRIDGE
     bridge_client_base_url: str
+    bridge_client_window: int = 20
 
     # Tasks
     retry_failed_frequency: int = 60
     gather_missed_frequency: int = 60
+    gather_missed_batch_size: int = 500
     gather_pending_frequency: int = 60 * 5
     verify_delivery_frequency: int = 60
     manage_locks_frequency: int = 60 * 5
@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional, Union
 
-from web3.types import Nonce, TxReceipt
+from web3.types import Nonce
 
-from app.usecases.schemas.blockchain import TransactionHash
+from app.usecases.schemas.blockchain import (
+    BlockchainClientError,
+    TransactionHash,
+    TransactionReceipt,
+)
 
 
 class IEvmClient(ABC):
@@ -14,8 +18,16 @@ class IEvmClient(ABC):
         """Sends transaction to the destination blockchain."""
 
     @abstractmethod
-    async def fetch_receipt(self, transaction_hash: str) -> TxReceipt:
-        """Fetches the transaction receipt for a given transaction hash."""
+    async def deliver_many(
+        self, payloads: List[bytes], nonces: List[int]
+    ) -> List[Union[TransactionHash, BlockchainClientError]]:
+        """Sends one transaction per payload to the destination blockchain; errors are returned in place."""
+
+    @abstractmethod
+    async def fetch_receipts(
+        self, transaction_hashes: List[str]
+    ) -> List[Optional[TransactionReceipt]]:
+        """Fetches the receipts of the given transactions; None if not yet mined."""
 
     @abstractmethod
     async def get_current_nonce(self) -> Nonce:
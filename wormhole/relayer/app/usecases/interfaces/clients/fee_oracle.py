@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+from typing import Dict
+
+
+class IFeeOracle(ABC):
+    @abstractmethod
+    async def get_fees(self) -> Dict[str, int]:
+        """Returns the gas-price fields for a transaction on the chain."""
@@ -1,5 +1,8 @@
-from abc import ABC
+from abc import ABC, abstractmethod
 
 
 class IUniqueSetClient(ABC):
-    """Add public methods here, if any ever exist."""
+    @abstractmethod
+    async def stop(self, timeout: float) -> None:
+        """Stops consuming, gives the queued messages up to timeout seconds to be
+        delivered, then puts the rest back and closes the connection."""
@@ -1,7 +1,13 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from app.usecases.schemas.relays import UpdateJoinedRepoAdapter, UpdateRepoAdapter
+from app.usecases.schemas.relays import (
+    StaleRelay,
+    Status,
+    UpdateByIdRepoAdapter,
+    UpdateJoinedRepoAdapter,
+    UpdateRepoAdapter,
+)
 from app.usecases.schemas.transactions import CreateRepoAdapter, TransactionsJoinRelays
 
 
@@ -10,10 +16,18 @@ class IRelaysRepo(ABC):
     async def create(self, transaction: CreateRepoAdapter) -> None:
         """Creates new transaction and relay object."""
 
+    @abstractmethod
+    async def create_many(self, transactions: List[CreateRepoAdapter]) -> None:
+        """Creates many new transaction and relay objects; existing transactions are skipped."""
+
     @abstractmethod
     async def update(self, relay: UpdateRepoAdapter) -> None:
         """Update relay object."""
 
+    @abstractmethod
+    async def update_many(self, relays: List[UpdateByIdRepoAdapter]) -> None:
+        """Update many relay objects, keyed by relay ID."""
+
     @abstractmethod
     async def update_relay_and_transaction(
         self, update_data: UpdateJoinedRepoAdapter
@@ -33,8 +47,10 @@ class IRelaysRepo(ABC):
         """Get the latest transaction for the given emitter_address and source_chain_id."""
 
     @abstractmethod
-    async def retrieve_pending(self) -> List[TransactionsJoinRelays]:
-        """Retrieves transactions that have been pending for longer than 1 minute."""
+    async def update_stale_pending(
+        self, status: Status, error: str
+    ) -> List[StaleRelay]:
+        """Updates relays that have been pending for too long and returns their keys."""
 
     @abstractmethod
     async def retrieve_undelivered(self) -> List[TransactionsJoinRelays]:
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class IGasLimitCache(ABC):
+    @abstractmethod
+    def get_gas_limit(self) -> Optional[int]:
+        """Returns the cached gas limit, or None if it should be re-estimated."""
+
+    @abstractmethod
+    def record_estimate(self, gas: int) -> None:
+        """Learns from a fresh gas estimate."""
+
+    @abstractmethod
+    def record_gas_used(self, gas_used: int) -> None:
+        """Learns from the gas used by a successful transaction."""
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """Forces the next gas limit to be estimated, e.g. after a revert."""
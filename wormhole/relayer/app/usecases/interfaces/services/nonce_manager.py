@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+
+class INonceManager(ABC):
+    @abstractmethod
+    async def allocate(self) -> int:
+        """Hands out the relayer's next nonce on the chain."""
+
+    @abstractmethod
+    async def release(self, nonce: int, error: str) -> None:
+        """Returns a nonce whose transaction could not be submitted."""
@@ -26,6 +26,10 @@ class BlockchainErrors(str, Enum):
     MESSAGE_PROCESSED = "Message already processed."
     TX_RECEIPT_STATUS_NOT_ONE = "Tx receipt exists, but status is not 1."
     TX_HASH_NOT_IN_CHAIN = "is not in the chain after"
+    NONCE_TOO_LOW = "nonce too low"
+    REPLACEMENT_UNDERPRICED = "replacement transaction underpriced"
+    LOWER_NONCE_FAILED = "A lower nonce failed to broadcast."
+    BROADCAST_UNKNOWN = "The broadcast may or may not have reached the node."
 
 
 class TransactionHash(HexBytes):
@@ -46,16 +50,8 @@ class BlockchainClientError(BlockchainClientException):
 
 class TransactionReceipt(BaseModel):
     status: int
-
-
-class TransactionReceiptResponse(BaseModel):
-    receipt: Optional[TransactionReceipt] = Field(
-        None,
-        description="The extracted version of the transaction object received from the blockchain.",
-        example=TransactionReceipt(status=1),
-    )
-    error: Optional[str] = Field(
+    gas_used: Optional[int] = Field(
         None,
-        description="Error pertaining to relay.",
-        example="An error happend, and here's why.",
+        description="The amount of gas used by the transaction.",
+        example=21000,
     )
@@ -58,6 +58,27 @@ class UpdateRepoAdapter(BaseModel):
     )
 
 
+class UpdateByIdRepoAdapter(BaseModel):
+    relay_id: int = Field(
+        ...,
+        description="The ID of the relay record.",
+        example=1,
+    )
+    status: Optional[Status] = Field(
+        None, description="The status of the relay.", example=Status.SUCCESS
+    )
+    transaction_hash: Optional[str] = Field(
+        None,
+        description="The hash of the submitted transaction.",
+        example="0xb5c8bd9430b6cc87a0e2fe110ece6bf527fa4f170a4bc8cd032f768fc5219838",
+    )
+    error: Optional[str] = Field(
+        None,
+        description="Error pertaining to relay.",
+        example="An error happend, and here's why.",
+    )
+
+
 class UpdateJoinedRepoAdapter(UpdateRepoAdapter):
     from_address: Optional[str] = Field(
         None,
@@ -86,6 +107,24 @@ class UpdateJoinedRepoAdapter(UpdateRepoAdapter):
     )
 
 
+class StaleRelay(BaseModel):
+    relay_id: int = Field(
+        ...,
+        description="The ID of the relay record.",
+        example=1,
+    )
+    source_chain_id: int = Field(
+        ...,
+        description="The source chain's bridging-protocol-assigned chain ID.",
+        example=5,
+    )
+    sequence: int = Field(
+        ...,
+        description="The bridging-protocol-assigned sequence of the transaction.",
+        example=1,
+    )
+
+
 class SubmittedRelay(BaseModel):
     status: Status = Field(
         ..., description="The status of the relay.", example=Status.SUCCESS
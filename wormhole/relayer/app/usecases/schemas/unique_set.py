@@ -1,4 +1,6 @@
 # pylint: disable=duplicate-code
+from enum import Enum
+
 from pydantic import BaseModel, Field
 
 
@@ -35,8 +37,13 @@ class UniqueSetMessage(BaseModel):
         description="The address of the contract on the source-chain that emitted the cross-chain message.",
         example="0xbf8a1387d4682b5b431cea8f53edd5e7a7834861",
     )
-    vaa_hex: str = Field(
+    vaa: bytes = Field(
         ...,
-        description="The VAA represented in hexadecimal format.",
-        example="0E31Cc997F3C3bBD3091449eF03DAB3b7455A02D",
+        description="The raw VAA bytes.",
+        example=bytes.fromhex("0E31Cc997F3C3bBD3091449eF03DAB3b7455A02D"),
     )
+
+
+class UniqueSetTransport(str, Enum):
+    SORTED_SET = "zset"
+    STREAM = "stream"
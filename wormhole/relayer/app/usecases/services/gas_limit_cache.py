@@ -0,0 +1,45 @@
+import time
+from collections import deque
+from math import ceil
+from typing import Deque, Optional
+
+from app.usecases.interfaces.services.gas_limit_cache import IGasLimitCache
+
+
+class GasLimitCache(IGasLimitCache):
+    """Gas limit for processMessage on one chain, learned from recent observations.
+
+    The limit is the largest of the last window estimates and gasUsed values
+    plus a safety margin. It expires estimate_frequency seconds after the last
+    estimate, or as soon as a transaction reverts.
+    """
+
+    def __init__(
+        self, safety_margin: float, window: int, estimate_frequency: float
+    ) -> None:
+        self.safety_margin = safety_margin
+        self.estimate_frequency = estimate_frequency
+        self.observations: Deque[int] = deque(maxlen=window)
+        self.last_estimate_time: Optional[float] = None
+
+    def get_gas_limit(self) -> Optional[int]:
+        """Returns the cached gas limit, or None if it should be re-estimated."""
+        if (
+            self.last_estimate_time is None
+            or time.monotonic() - self.last_estimate_time >= self.estimate_frequency
+        ):
+            return None
+        return ceil(max(self.observations) * (1 + self.safety_margin))
+
+    def record_estimate(self, gas: int) -> None:
+        """Learns from a fresh gas estimate."""
+        self.observations.append(gas)
+        self.last_estimate_time = time.monotonic()
+
+    def record_gas_used(self, gas_used: int) -> None:
+        """Learns from the gas used by a successful transaction."""
+        self.observations.append(gas_used)
+
+    def invalidate(self) -> None:
+        """Forces the next gas limit to be estimated, e.g. after a revert."""
+        self.last_estimate_time = None
@@ -0,0 +1,56 @@
+import asyncio
+from logging import Logger
+from typing import Optional
+
+from app.usecases.interfaces.clients.evm import IEvmClient
+from app.usecases.interfaces.services.nonce_manager import INonceManager
+from app.usecases.schemas.blockchain import BlockchainErrors
+
+
+class NonceManager(INonceManager):
+    """Allocates the relayer's nonces on one chain locally.
+
+    The first allocation is seeded from the relayer's pending transaction count;
+    later ones are counted up without a round trip. A nonce error from the node
+    means the local count has drifted, so the next allocation re-seeds it.
+    """
+
+    def __init__(self, evm_client: IEvmClient, logger: Logger) -> None:
+        self.evm_client = evm_client
+        self.logger = logger
+        self.next_nonce: Optional[int] = None
+        self.lock = asyncio.Lock()
+
+    async def allocate(self) -> int:
+        """Hands out the relayer's next nonce on the chain."""
+        async with self.lock:
+            if self.next_nonce is None:
+                self.next_nonce = await self.evm_client.get_current_nonce()
+            nonce = self.next_nonce
+            self.next_nonce += 1
+            return nonce
+
+    async def release(self, nonce: int, error: str) -> None:
+        """Returns a nonce whose transaction could not be submitted.
+
+        The nonce is reused if nothing was allocated after it; otherwise it
+        would leave a gap, so the count is re-seeded instead. So is it if the
+        transaction may have been broadcast after all.
+        """
+        async with self.lock:
+            if self.next_nonce is None:
+                return
+            if (
+                BlockchainErrors.NONCE_TOO_LOW in error
+                or BlockchainErrors.REPLACEMENT_UNDERPRICED in error
+                or BlockchainErrors.BROADCAST_UNKNOWN in error
+            ):
+                self.logger.info(
+                    "[NonceManager]: Nonce %s rejected; resyncing with the chain.",
+                    nonce,
+                )
+                self.next_nonce = None
+            elif nonce == self.next_nonce - 1:
+                self.next_nonce = nonce
+            else:
+                self.next_nonce = None
@@ -0,0 +1,66 @@
+# pylint: disable=duplicate-code
+import json
+import struct
+
+from app.usecases.schemas.unique_set import UniqueSetMessage
+from app.usecases.services.vaa_parser import emitter_address_to_str
+
+# Members are versioned binary envelopes. Members written before the envelope
+# are JSON objects, which never start with the envelope's magic byte.
+ENVELOPE_MAGIC = 0xA5
+ENVELOPE_VERSION = 1
+JSON_PREFIX = b"{"
+# magic (1) | version (1) | dest_chain_id (2)
+ENVELOPE_PREFIX = struct.Struct(">BBH")
+# magic (1) | version (1) | dest_chain_id (2) | emitter_chain (2) | sequence (8) | emitter_address (32) | to_address (32) | from_address length (2)
+ENVELOPE_HEADER = struct.Struct(">BBHHQ32s32sH")
+
+
+def decode_dest_chain_id(member: bytes) -> int:
+    """Reads only the destination chain of an envelope or a JSON member."""
+    if member[:1] == JSON_PREFIX:
+        return int(json.loads(member)["dest_chain_id"])
+
+    try:
+        magic, version, dest_chain_id = ENVELOPE_PREFIX.unpack_from(member)
+    except struct.error as e:
+        raise ValueError("Unique-set member is too short for an envelope.") from e
+    if magic != ENVELOPE_MAGIC or version != ENVELOPE_VERSION:
+        raise ValueError(f"Unsupported unique-set envelope: {magic:#x} v{version}.")
+    return dest_chain_id
+
+
+def decode_message(member: bytes) -> UniqueSetMessage:
+    """Decodes an envelope or a JSON member; raises ValueError if it is neither."""
+    if member[:1] == JSON_PREFIX:
+        fields = json.loads(member)
+        return UniqueSetMessage(vaa=bytes.fromhex(fields.pop("vaa_hex")), **fields)
+
+    try:
+        (
+            magic,
+            version,
+            dest_chain_id,
+            emitter_chain,
+            sequence,
+            emitter_address,
+            to_address,
+            from_address_length,
+        ) = ENVELOPE_HEADER.unpack_from(member)
+    except struct.error as e:
+        raise ValueError("Unique-set member is too short for an envelope.") from e
+    if magic != ENVELOPE_MAGIC or version != ENVELOPE_VERSION:
+        raise ValueError(f"Unsupported unique-set envelope: {magic:#x} v{version}.")
+
+    from_address_end = ENVELOPE_HEADER.size + from_address_length
+    # The envelope is written by the spy listener, so validation is skipped.
+    return UniqueSetMessage.construct(
+        dest_chain_id=dest_chain_id,
+        # A JSON member's integer to_address is coerced to str the same way.
+        to_address=str(int.from_bytes(to_address, "big")),
+        from_address="0x" + member[ENVELOPE_HEADER.size : from_address_end].hex(),
+        sequence=sequence,
+        emitter_chain=emitter_chain,
+        emitter_address=emitter_address_to_str(emitter_address),
+        vaa=bytes(member[from_address_end:]),
+    )
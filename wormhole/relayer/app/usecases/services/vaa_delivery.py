@@ -1,14 +1,14 @@
-import json
 from logging import Logger
 from typing import Mapping
 
 from app.dependencies import CHAIN_ID_LOOKUP
 from app.usecases.interfaces.clients.evm import IEvmClient
 from app.usecases.interfaces.repos.relays import IRelaysRepo
+from app.usecases.interfaces.services.nonce_manager import INonceManager
 from app.usecases.interfaces.services.vaa_delivery import IVaaDelivery
 from app.usecases.schemas.blockchain import BlockchainClientError, BlockchainErrors
 from app.usecases.schemas.relays import Status, UpdateRepoAdapter
-from app.usecases.schemas.unique_set import UniqueSetMessage
+from app.usecases.services.unique_set_codec import decode_message
 
 
 class VaaDelivery(IVaaDelivery):
@@ -16,25 +16,30 @@ class VaaDelivery(IVaaDelivery):
         self,
         relays_repo: IRelaysRepo,
         supported_evm_clients: Mapping[int, IEvmClient],
+        nonce_managers: Mapping[int, INonceManager],
         logger: Logger,
     ):
         self.relays_repo = relays_repo
         self.supported_evm_clients = supported_evm_clients
+        self.nonce_managers = nonce_managers
         self.logger = logger
 
     async def process(self, set_message: bytes) -> None:
         """Process message from unique set."""
 
-        message = UniqueSetMessage(**json.loads(set_message.decode()))
+        message = decode_message(member=set_message)
 
         # Send Vaa to destination chain
         chain_id = CHAIN_ID_LOOKUP[message.dest_chain_id]
         dest_evm_client = self.supported_evm_clients[chain_id]
+        nonce_manager = self.nonce_managers[chain_id]
+        nonce = await nonce_manager.allocate()
         try:
             transaction_hash_bytes = await dest_evm_client.deliver(
-                payload=bytes.fromhex(message.vaa_hex)
+                payload=message.vaa, nonce=nonce
             )
         except BlockchainClientError as e:
+            await nonce_manager.release(nonce=nonce, error=e.detail)
             if BlockchainErrors.MESSAGE_PROCESSED in e.detail:
                 error = None
                 status = Status.SUCCESS
@@ -0,0 +1,167 @@
+# pylint: disable=duplicate-code
+import hashlib
+import struct
+from typing import Optional, Tuple, Union
+
+from app.usecases.schemas.vaa import ParsedPayload, ParsedVaa, WormholeSignature
+
+# version (1) | guardian_set_index (4) | number_of_signers (1)
+HEADER = struct.Struct(">BIB")
+# guardian_index (1) | signature (65)
+SIGNATURE = struct.Struct(">B65s")
+# timestamp (4) | nonce (4) | emitter_chain (2) | emitter_address (32) | sequence (8) | consistency_level (1)
+BODY = struct.Struct(">IIH32sQB")
+# ABI head of (bytes, uint256, uint256, uint256): four 32-byte words
+ABI_WORD = 32
+ABI_HEAD_SIZE = 4 * ABI_WORD
+
+
+def emitter_address_to_str(emitter_address: bytes) -> str:
+    """Formats a 32-byte emitter address the same way as hex(int(...))."""
+    return "0x" + (emitter_address.hex().lstrip("0") or "0")
+
+
+class VaaPayload:
+    """ABI-decoded VAA payload, read directly from the underlying buffer."""
+
+    __slots__ = ("from_address", "dest_chain_id", "to_address", "amount")
+
+    def __init__(self, payload: memoryview) -> None:
+        if len(payload) < ABI_HEAD_SIZE:
+            raise ValueError("VAA payload is too short to be ABI-decoded.")
+        from_address_offset = int.from_bytes(payload[:ABI_WORD], "big")
+        self.dest_chain_id = int.from_bytes(payload[ABI_WORD : 2 * ABI_WORD], "big")
+        self.to_address = int.from_bytes(payload[2 * ABI_WORD : 3 * ABI_WORD], "big")
+        self.amount = int.from_bytes(payload[3 * ABI_WORD : ABI_HEAD_SIZE], "big")
+
+        data_start = from_address_offset + ABI_WORD
+        if data_start > len(payload):
+            raise ValueError("VAA payload is too short for its encoded bytes offset.")
+        length = int.from_bytes(payload[from_address_offset:data_start], "big")
+        if data_start + length > len(payload):
+            raise ValueError("VAA payload is too short for its encoded bytes length.")
+        self.from_address = "0x" + payload[data_start : data_start + length].hex()
+
+    def to_parsed_payload(self, validate: bool = True) -> ParsedPayload:
+        """Converts the payload into its pydantic representation."""
+        fields = {
+            "from_address": self.from_address,
+            "to_address": self.to_address,
+            "dest_chain_id": self.dest_chain_id,
+            "amount": self.amount,
+        }
+        return (
+            ParsedPayload(**fields) if validate else ParsedPayload.construct(**fields)
+        )
+
+
+class VaaView:
+    """Zero-copy view over raw VAA bytes.
+
+    The header and body fields are decoded eagerly with precompiled structs;
+    signatures, payload and hash are only materialised when accessed.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_body_start",
+        "_emitter_address_bytes",
+        "_emitter_address",
+        "_signatures",
+        "_payload",
+        "_hash",
+        "version",
+        "guardian_set_index",
+        "number_of_signers",
+        "timestamp",
+        "nonce",
+        "emitter_chain",
+        "sequence",
+        "consistency_level",
+    )
+
+    def __init__(self, vaa: Union[bytes, bytearray, memoryview]) -> None:
+        self._buffer = memoryview(vaa)
+        (
+            self.version,
+            self.guardian_set_index,
+            self.number_of_signers,
+        ) = HEADER.unpack_from(self._buffer)
+        self._body_start = HEADER.size + SIGNATURE.size * self.number_of_signers
+        (
+            self.timestamp,
+            self.nonce,
+            self.emitter_chain,
+            self._emitter_address_bytes,
+            self.sequence,
+            self.consistency_level,
+        ) = BODY.unpack_from(self._buffer, self._body_start)
+        self._emitter_address: Optional[str] = None
+        self._signatures: Optional[Tuple[Tuple[int, bytes], ...]] = None
+        self._payload: Optional[VaaPayload] = None
+        self._hash: Optional[bytes] = None
+
+    @property
+    def body(self) -> memoryview:
+        return self._buffer[self._body_start :]
+
+    @property
+    def emitter_address(self) -> str:
+        if self._emitter_address is None:
+            self._emitter_address = emitter_address_to_str(self._emitter_address_bytes)
+        return self._emitter_address
+
+    @property
+    def guardian_signatures(self) -> Tuple[Tuple[int, bytes], ...]:
+        """(guardian index, signature) pairs."""
+        if self._signatures is None:
+            self._signatures = tuple(
+                SIGNATURE.iter_unpack(self._buffer[HEADER.size : self._body_start])
+            )
+        return self._signatures
+
+    @property
+    def payload(self) -> VaaPayload:
+        if self._payload is None:
+            self._payload = VaaPayload(
+                payload=self._buffer[self._body_start + BODY.size :]
+            )
+        return self._payload
+
+    @property
+    def hash(self) -> bytes:
+        if self._hash is None:
+            self._hash = hashlib.sha3_256(self.body).digest()
+        return self._hash
+
+    def to_parsed_vaa(self, validate: bool = True) -> ParsedVaa:
+        """Converts the view into its pydantic representation.
+
+        With validate=False the models are built with construct(), which skips
+        pydantic validation entirely.
+        """
+        if validate:
+            guardian_signatures = [
+                WormholeSignature(index=index, signature=signature)
+                for index, signature in self.guardian_signatures
+            ]
+        else:
+            guardian_signatures = [
+                WormholeSignature.construct(index=index, signature=signature)
+                for index, signature in self.guardian_signatures
+            ]
+
+        fields = {
+            "version": self.version,
+            "guardian_set_index": self.guardian_set_index,
+            "guardian_signatures": guardian_signatures,
+            "timestamp": self.timestamp,
+            "nonce": self.nonce,
+            "emitter_chain": self.emitter_chain,
+            "emitter_address": self.emitter_address,
+            "sequence": self.sequence,
+            "consistency_level": self.consistency_level,
+            "payload": self.payload.to_parsed_payload(validate=validate),
+            "hash": self.hash,
+        }
+        return ParsedVaa(**fields) if validate else ParsedVaa.construct(**fields)
@@ -1,10 +1,10 @@
 from app.dependencies import (
-    CHAIN_DATA,
     get_bridge_client,
     get_event_loop,
-    get_evm_client,
     get_message_processor,
+    get_nonce_managers,
     get_relays_repo,
+    get_supported_evm_clients,
     get_tasks_repo,
     logger,
 )
@@ -17,22 +17,14 @@ from app.usecases.tasks.verify_delivery import VerifyDeliveryTask
 
 async def start_retry_failed_task() -> None:
     loop = await get_event_loop()
-    message_processor = await get_message_processor()
-    bridge_client = await get_bridge_client()
-    relays_repo = await get_relays_repo()
-    tasks_repo = await get_tasks_repo()
-
-    supported_evm_clients = {}
-    for chain_id in CHAIN_DATA:
-        evm_client = await get_evm_client(chain_id=chain_id)
-        supported_evm_clients[chain_id] = evm_client
 
     retry_failed_task = RetryFailedTask(
-        message_processor=message_processor,
-        supported_evm_clients=supported_evm_clients,
-        bridge_client=bridge_client,
-        relays_repo=relays_repo,
-        tasks_repo=tasks_repo,
+        message_processor=await get_message_processor(),
+        supported_evm_clients=await get_supported_evm_clients(),
+        nonce_managers=await get_nonce_managers(),
+        bridge_client=await get_bridge_client(),
+        relays_repo=await get_relays_repo(),
+        tasks_repo=await get_tasks_repo(),
         logger=logger,
     )
 
@@ -75,11 +67,7 @@ async def start_verify_delivery_task() -> None:
     loop = await get_event_loop()
     relays_repo = await get_relays_repo()
     tasks_repo = await get_tasks_repo()
-
-    supported_evm_clients = {}
-    for chain_id in CHAIN_DATA:
-        evm_client = await get_evm_client(chain_id=chain_id)
-        supported_evm_clients[chain_id] = evm_client
+    supported_evm_clients = await get_supported_evm_clients()
 
     verify_delivery_task = VerifyDeliveryTask(
         supported_evm_clients=supported_evm_clients,
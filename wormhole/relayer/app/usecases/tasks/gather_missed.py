@@ -3,7 +3,9 @@ import asyncio
 import base64
 import codecs
 import time
+from collections import deque
 from logging import Logger
+from typing import Deque, List
 
 from app.dependencies import CHAIN_ID_LOOKUP
 from app.settings import settings
@@ -12,7 +14,11 @@ from app.usecases.interfaces.repos.relays import IRelaysRepo
 from app.usecases.interfaces.repos.tasks import ITasksRepo
 from app.usecases.interfaces.services.message_processor import IVaaProcessor
 from app.usecases.interfaces.tasks.gather_missed import IGatherMissedVaasTask
-from app.usecases.schemas.bridge import BridgeClientException, NotFoundException
+from app.usecases.schemas.bridge import (
+    BridgeClientException,
+    BridgeMessage,
+    NotFoundException,
+)
 from app.usecases.schemas.relays import CacheStatus, GrpcStatus, RelayErrors, Status
 from app.usecases.schemas.tasks import TaskName
 from app.usecases.schemas.transactions import CreateRepoAdapter
@@ -60,81 +66,122 @@ class GatherMissedVaasTask(IGatherMissedVaasTask):
 
         task_start_time = time.time()
 
-        # Get missed transactions
-        missed_vaa_count = 0
-        for wh_chain_id in CHAIN_ID_LOOKUP:
-            transaction = await self.relays_repo.get_latest_sequence(
-                emitter_address=settings.evm_wormhole_bridge,
-                source_chain_id=wh_chain_id,
+        try:
+            # Get missed transactions, all chains concurrently; a failed chain
+            # does not stop the others.
+            results = await asyncio.gather(
+                *(
+                    self.__gather_chain(wh_chain_id=wh_chain_id)
+                    for wh_chain_id in CHAIN_ID_LOOKUP
+                ),
+                return_exceptions=True,
             )
+        finally:
+            await self.tasks_repo.delete_lock(task_id=task_id)
 
-            if transaction is not None:
-                new_sequence = transaction.sequence + 1
+        missed_vaa_count = 0
+        for wh_chain_id, result in zip(CHAIN_ID_LOOKUP, results):
+            if isinstance(result, BaseException):
+                self.logger.error(
+                    "[GatherMissedVaasTask]: Failed; chain id: %s, error: %r",
+                    wh_chain_id,
+                    result,
+                )
             else:
-                new_sequence = 0
+                missed_vaa_count += result
 
-            while True:
-                # 1. Fetch message
-                try:
-                    message = await self.bridge_client.fetch_bridge_message(
-                        emitter_address=settings.evm_wormhole_bridge,
-                        emitter_chain_id=wh_chain_id,
-                        sequence=new_sequence,
-                    )
-                except (
-                    BridgeClientException,
-                    NotFoundException,
-                ) as e:
-                    if isinstance(e, NotFoundException):
-                        self.logger.info(
-                            "[GatherMissedVaasTask]: Reached point of no new messages; chain id: %s, sequence: %s",
-                            wh_chain_id,
-                            new_sequence,
-                        )
-                    else:
-                        self.logger.error(
-                            "[GatherMissedVaasTask]: Unexpected error: %s", e
-                        )
-                    break
-                else:
-                    message_bytes = base64.b64decode(message.b64_message)
-                    parsed_vaa = self.message_processor.parse_vaa(vaa=message_bytes)
-                    message_hex = (
-                        codecs.encode(message_bytes, "hex_codec").decode().upper()
-                    )
+        self.logger.info(
+            "[GatherMissedVaasTask]: Finished; retrieved %s missed VAAs in %s seconds.",
+            missed_vaa_count,
+            round(time.time() - task_start_time, 4),
+        )
 
-                    # 2. Store record as failed (another task will pick it up)
-                    await self.relays_repo.create(
-                        transaction=CreateRepoAdapter(
-                            emitter_address=parsed_vaa.emitter_address,
-                            from_address=parsed_vaa.payload.from_address,
-                            to_address=f"0x{parsed_vaa.payload.to_address:040x}",
-                            source_chain_id=parsed_vaa.emitter_chain,
-                            dest_chain_id=parsed_vaa.payload.dest_chain_id,
-                            amount=parsed_vaa.payload.amount,
-                            sequence=parsed_vaa.sequence,
-                            relay_error=RelayErrors.MISSED_VAA,
-                            relay_status=Status.FAILED,
-                            relay_message=message_hex,
-                            relay_cache_status=CacheStatus.NEVER_CACHED,
-                            relay_grpc_status=GrpcStatus.FAILED,
+    async def __gather_chain(self, wh_chain_id: int) -> int:
+        """Stores every message past the chain's latest known sequence and returns their count.
+        Messages are fetched in order through a sliding window of concurrent requests
+        that ends at the first sequence the bridge cannot serve.
+        """
+
+        transaction = await self.relays_repo.get_latest_sequence(
+            emitter_address=settings.evm_wormhole_bridge,
+            source_chain_id=wh_chain_id,
+        )
+
+        if transaction is not None:
+            next_sequence = transaction.sequence + 1
+        else:
+            next_sequence = 0
+
+        in_flight: Deque[asyncio.Task] = deque()
+        missed_transactions: List[CreateRepoAdapter] = []
+        missed_vaa_count = 0
+        try:
+            while True:
+                while len(in_flight) < settings.bridge_client_window:
+                    in_flight.append(
+                        asyncio.create_task(
+                            self.bridge_client.fetch_bridge_message(
+                                emitter_address=settings.evm_wormhole_bridge,
+                                emitter_chain_id=wh_chain_id,
+                                sequence=next_sequence,
+                            )
                         )
                     )
+                    next_sequence += 1
 
+                # 1. Fetch message
+                sequence = next_sequence - len(in_flight)
+                try:
+                    message: BridgeMessage = await in_flight.popleft()
+                except NotFoundException:
                     self.logger.info(
-                        "[GatherMissedVaasTask]: Retrieved missed VAA; chain id: %s, sequence: %s",
-                        parsed_vaa.emitter_chain,
-                        parsed_vaa.sequence,
+                        "[GatherMissedVaasTask]: Reached point of no new messages; chain id: %s, sequence: %s",
+                        wh_chain_id,
+                        sequence,
                     )
+                    break
+                except BridgeClientException as e:
+                    self.logger.error("[GatherMissedVaasTask]: Unexpected error: %s", e)
+                    break
 
-                    missed_vaa_count += 1
-
-                new_sequence += 1
-
-        await self.tasks_repo.delete_lock(task_id=task_id)
-
-        self.logger.info(
-            "[GatherMissedVaasTask]: Finished; retrieved %s missed VAAs in %s seconds.",
-            missed_vaa_count,
-            round(time.time() - task_start_time, 4),
-        )
+                message_bytes = base64.b64decode(message.b64_message)
+                parsed_vaa = self.message_processor.parse_vaa(vaa=message_bytes)
+                message_hex = codecs.encode(message_bytes, "hex_codec").decode().upper()
+
+                # 2. Store record as failed (another task will pick it up)
+                missed_transactions.append(
+                    CreateRepoAdapter(
+                        emitter_address=parsed_vaa.emitter_address,
+                        from_address=parsed_vaa.payload.from_address,
+                        to_address=f"0x{parsed_vaa.payload.to_address:040x}",
+                        source_chain_id=parsed_vaa.emitter_chain,
+                        dest_chain_id=parsed_vaa.payload.dest_chain_id,
+                        amount=parsed_vaa.payload.amount,
+                        sequence=parsed_vaa.sequence,
+                        relay_error=RelayErrors.MISSED_VAA,
+                        relay_status=Status.FAILED,
+                        relay_message=message_hex,
+                        relay_cache_status=CacheStatus.NEVER_CACHED,
+                        relay_grpc_status=GrpcStatus.FAILED,
+                    )
+                )
+
+                self.logger.info(
+                    "[GatherMissedVaasTask]: Retrieved missed VAA; chain id: %s, sequence: %s",
+                    parsed_vaa.emitter_chain,
+                    parsed_vaa.sequence,
+                )
+
+                if len(missed_transactions) >= settings.gather_missed_batch_size:
+                    await self.relays_repo.create_many(transactions=missed_transactions)
+                    missed_vaa_count += len(missed_transactions)
+                    missed_transactions = []
+        finally:
+            # Requests past the frontier are not needed.
+            for fetch_task in in_flight:
+                fetch_task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+        await self.relays_repo.create_many(transactions=missed_transactions)
+
+        return missed_vaa_count + len(missed_transactions)
@@ -7,7 +7,7 @@ from app.settings import settings
 from app.usecases.interfaces.repos.relays import IRelaysRepo
 from app.usecases.interfaces.repos.tasks import ITasksRepo
 from app.usecases.interfaces.tasks.gather_pending import IGatherPendingVaasTask
-from app.usecases.schemas.relays import RelayErrors, Status, UpdateRepoAdapter
+from app.usecases.schemas.relays import RelayErrors, Status
 from app.usecases.schemas.tasks import TaskName
 
 
@@ -48,29 +48,21 @@ class GatherPendingVaasTask(IGatherPendingVaasTask):
         self.logger.info("[GatherPendingVaasTask]: Started.")
         task_start_time = time.time()
 
-        transactions = await self.relays_repo.retrieve_pending()
+        stale_relays = await self.relays_repo.update_stale_pending(
+            status=Status.FAILED, error=RelayErrors.STALE_PENDING
+        )
 
-        for transaction in transactions:
-            await self.relays_repo.update(
-                relay=UpdateRepoAdapter(
-                    emitter_address=transaction.emitter_address,
-                    source_chain_id=transaction.source_chain_id,
-                    sequence=transaction.sequence,
-                    transaction_hash=None,
-                    error=RelayErrors.STALE_PENDING,
-                    status=Status.FAILED,
-                )
-            )
+        for stale_relay in stale_relays:
             self.logger.info(
                 "[GatherPendingVaasTask]: Rescued stale pending; chain id: %s, sequence: %s",
-                transaction.source_chain_id,
-                transaction.sequence,
+                stale_relay.source_chain_id,
+                stale_relay.sequence,
             )
 
         await self.tasks_repo.delete_lock(task_id=task_id)
 
         self.logger.info(
             "[GatherPendingVaasTask]: Finished; processed %s pending transactions in %s seconds.",
-            len(transactions),
+            len(stale_relays),
             round(time.time() - task_start_time, 4),
         )
@@ -5,7 +5,7 @@ import codecs
 import time
 from collections import defaultdict
 from logging import Logger
-from typing import List, Mapping, Optional, Union
+from typing import List, Mapping, Tuple, Union
 
 from app.dependencies import CHAIN_ID_LOOKUP
 from app.settings import settings
@@ -14,14 +14,19 @@ from app.usecases.interfaces.clients.evm import IEvmClient
 from app.usecases.interfaces.repos.relays import IRelaysRepo
 from app.usecases.interfaces.repos.tasks import ITasksRepo
 from app.usecases.interfaces.services.message_processor import IVaaProcessor
+from app.usecases.interfaces.services.nonce_manager import INonceManager
 from app.usecases.interfaces.tasks.retry_failed import IRetryFailedTask
-from app.usecases.schemas.blockchain import BlockchainClientError, BlockchainErrors
+from app.usecases.schemas.blockchain import (
+    BlockchainClientError,
+    BlockchainErrors,
+    TransactionHash,
+)
 from app.usecases.schemas.bridge import BridgeClientException
 from app.usecases.schemas.relays import (
     Status,
     SubmittedRelay,
+    UpdateByIdRepoAdapter,
     UpdateJoinedRepoAdapter,
-    UpdateRepoAdapter,
 )
 from app.usecases.schemas.tasks import TaskName
 from app.usecases.schemas.transactions import TransactionsJoinRelays
@@ -33,6 +38,7 @@ class RetryFailedTask(IRetryFailedTask):
         self,
         message_processor: IVaaProcessor,
         supported_evm_clients: Mapping[int, IEvmClient],
+        nonce_managers: Mapping[int, INonceManager],
         bridge_client: IBridgeClient,
         relays_repo: IRelaysRepo,
         tasks_repo: ITasksRepo,
@@ -40,6 +46,7 @@ class RetryFailedTask(IRetryFailedTask):
     ):
         self.vaa_processor = message_processor
         self.supported_evm_clients = supported_evm_clients
+        self.nonce_managers = nonce_managers
         self.bridge_client = bridge_client
         self.relays_repo = relays_repo
         self.tasks_repo = tasks_repo
@@ -102,18 +109,27 @@ class RetryFailedTask(IRetryFailedTask):
         relay_tasks = []
         for dest_chain_id, relays in dest_chain_id_groups.items():
             if dest_chain_id:
-                chain_id = CHAIN_ID_LOOKUP[dest_chain_id]
-                dest_evm_client = self.supported_evm_clients[chain_id]
-                current_nonce = await dest_evm_client.get_current_nonce()
                 relay_tasks.append(
                     asyncio.create_task(
                         self.__execute_relays(
-                            relays=relays, current_nonce=current_nonce
+                            dest_chain_id=dest_chain_id, relays=relays
                         )
                     )
                 )
 
-        await asyncio.gather(*relay_tasks)
+        relay_updates: List[
+            Tuple[List[UpdateByIdRepoAdapter], List[UpdateJoinedRepoAdapter]]
+        ] = await asyncio.gather(*relay_tasks)
+
+        # Every chain's updates are written once all relays have been broadcast
+        await self.relays_repo.update_many(
+            relays=[update for updates, _ in relay_updates for update in updates]
+        )
+        for _, external_updates in relay_updates:
+            for external_update in external_updates:
+                await self.relays_repo.update_relay_and_transaction(
+                    update_data=external_update
+                )
 
         await self.tasks_repo.delete_lock(task_id=task_id)
 
@@ -125,38 +141,77 @@ class RetryFailedTask(IRetryFailedTask):
 
     async def __execute_relays(
         self,
+        dest_chain_id: int,
         relays: List[Union[TransactionsJoinRelays, ExternalVaa]],
-        current_nonce: int,
-    ) -> None:
-        """This function executes same-destination-chain relays synchronously."""
+    ) -> Tuple[List[UpdateByIdRepoAdapter], List[UpdateJoinedRepoAdapter]]:
+        """This function signs same-destination-chain relays with consecutive nonces and broadcasts them together.
+        It returns the database updates for relays already known to our system and for externally obtained vaas.
+        """
+
+        chain_id = CHAIN_ID_LOOKUP[dest_chain_id]
+        dest_evm_client = self.supported_evm_clients[chain_id]
+        nonce_manager = self.nonce_managers[chain_id]
 
-        for relay in relays:
+        payloads = [
+            bytes.fromhex(
+                relay.message_hex
+                if isinstance(relay, ExternalVaa)
+                else relay.relay_message
+            )
+            for relay in relays
+        ]
+        nonces = [await nonce_manager.allocate() for _ in relays]
+
+        results = await dest_evm_client.deliver_many(payloads=payloads, nonces=nonces)
+
+        # Only nonces that were never broadcast are released. Released last to
+        # first, the failed nonce is handed out again next, unless one above it
+        # was broadcast, in which case the count is re-seeded from the chain.
+        for nonce, result in reversed(list(zip(nonces, results))):
+            if isinstance(result, BlockchainClientError):
+                await nonce_manager.release(nonce=nonce, error=result.detail)
+
+        updates = []
+        external_updates = []
+        for relay, result in zip(relays, results):
             if isinstance(relay, ExternalVaa):
                 # NOTE: The VAA is unknown to our system.
-                submitted_relay = await self.__submit_relay(
-                    payload=bytes.fromhex(relay.message_hex),
+                submitted_relay = self.__submitted_relay(
+                    result=result,
                     source_chain_id=relay.parsed_vaa.emitter_chain,
                     sequence=relay.parsed_vaa.sequence,
-                    dest_chain_id=relay.parsed_vaa.payload.dest_chain_id,
-                    nonce=current_nonce,
                 )
-                await self.__update_database(
-                    relay=relay, submitted_relay=submitted_relay, external_vaa=relay
+                external_updates.append(
+                    UpdateJoinedRepoAdapter(
+                        emitter_address=relay.parsed_vaa.emitter_address,
+                        source_chain_id=relay.parsed_vaa.emitter_chain,
+                        sequence=relay.parsed_vaa.sequence,
+                        from_address=relay.parsed_vaa.payload.from_address,
+                        to_address=f"0x{relay.parsed_vaa.payload.to_address:040x}",
+                        dest_chain_id=relay.parsed_vaa.payload.dest_chain_id,
+                        amount=relay.parsed_vaa.payload.amount,
+                        message=relay.message_hex,
+                        transaction_hash=submitted_relay.transaction_hash,
+                        error=submitted_relay.error,
+                        status=submitted_relay.status,
+                    )
                 )
             else:
                 # NOTE: The VAA is already known to our system.
-                submitted_relay = await self.__submit_relay(
-                    payload=bytes.fromhex(relay.relay_message),
+                submitted_relay = self.__submitted_relay(
+                    result=result,
                     source_chain_id=relay.source_chain_id,
                     sequence=relay.sequence,
-                    dest_chain_id=relay.dest_chain_id,
-                    nonce=current_nonce,
                 )
-                await self.__update_database(
-                    relay=relay, submitted_relay=submitted_relay
+                updates.append(
+                    UpdateByIdRepoAdapter(
+                        relay_id=relay.relay_id,
+                        transaction_hash=submitted_relay.transaction_hash,
+                        error=submitted_relay.error,
+                        status=submitted_relay.status,
+                    )
                 )
-
-            current_nonce += 1
+        return updates, external_updates
 
     async def __get_bridge_message(
         self, emitter_address: str, emitter_chain_id: int, sequence: int
@@ -176,42 +231,31 @@ class RetryFailedTask(IRetryFailedTask):
         message_hex = codecs.encode(message_bytes, "hex_codec").decode().upper()
         return ExternalVaa(parsed_vaa=parsed_vaa, message_hex=message_hex)
 
-    async def __submit_relay(
+    def __submitted_relay(
         self,
-        payload: bytes,
+        result: Union[TransactionHash, BlockchainClientError],
         source_chain_id: int,
         sequence: int,
-        dest_chain_id: int,
-        nonce: int,
     ) -> SubmittedRelay:
-        # The VAA is known to our system; it just needs to be retried.
-        chain_id = CHAIN_ID_LOOKUP[dest_chain_id]
-        dest_evm_client = self.supported_evm_clients[chain_id]
-
-        try:
-            transaction_hash_bytes = await dest_evm_client.deliver(
-                payload=payload,
-                nonce=nonce,
-            )
-        except BlockchainClientError as e:
+        if isinstance(result, BlockchainClientError):
             self.logger.info(
                 "[RetryFailedTask]: VAA delivery failed; chain id %s, sequence %s",
                 source_chain_id,
                 sequence,
             )
-            if BlockchainErrors.MESSAGE_PROCESSED in e.detail:
+            if BlockchainErrors.MESSAGE_PROCESSED in result.detail:
                 error = None
                 status = Status.SUCCESS
                 transaction_hash = None
             else:
-                error = e.detail
+                error = result.detail
                 status = Status.FAILED
                 transaction_hash = None
         else:
             error = None
             # A success is constituted by transaction receipt status of 1
             status = Status.PENDING
-            transaction_hash = transaction_hash_bytes.hex()
+            transaction_hash = result.hex()
             self.logger.info(
                 "[RetryFailedTask]: Transaction submission successful; chain id: %s, sequence: %s, transaction hash: %s",
                 source_chain_id,
@@ -222,41 +266,3 @@ class RetryFailedTask(IRetryFailedTask):
         return SubmittedRelay(
             error=error, status=status, transaction_hash=transaction_hash
         )
-
-    async def __update_database(
-        self,
-        relay: TransactionsJoinRelays,
-        submitted_relay: SubmittedRelay,
-        external_vaa: Optional[ExternalVaa] = None,
-    ) -> None:
-        """This internal function updates transcation and relay records in the database.
-        The method by which it updates is dependent on whether or not the vaa was obtained externally.
-        """
-
-        if external_vaa:
-            await self.relays_repo.update_relay_and_transaction(
-                update_data=UpdateJoinedRepoAdapter(
-                    emitter_address=external_vaa.parsed_vaa.emitter_address,
-                    source_chain_id=external_vaa.parsed_vaa.emitter_chain,
-                    sequence=external_vaa.parsed_vaa.sequence,
-                    from_address=external_vaa.parsed_vaa.payload.from_address,
-                    to_address=f"0x{external_vaa.parsed_vaa.payload.to_address:040x}",
-                    dest_chain_id=external_vaa.parsed_vaa.payload.dest_chain_id,
-                    amount=external_vaa.parsed_vaa.payload.amount,
-                    message=external_vaa.message_hex,
-                    transaction_hash=submitted_relay.transaction_hash,
-                    error=submitted_relay.error,
-                    status=submitted_relay.status,
-                )
-            )
-        else:
-            await self.relays_repo.update(
-                relay=UpdateRepoAdapter(
-                    emitter_address=relay.emitter_address,
-                    source_chain_id=relay.source_chain_id,
-                    sequence=relay.sequence,
-                    transaction_hash=submitted_relay.transaction_hash,
-                    error=submitted_relay.error,
-                    status=submitted_relay.status,
-                )
-            )
@@ -1,7 +1,8 @@
 import asyncio
 import time
+from collections import defaultdict
 from logging import Logger
-from typing import List, Mapping
+from typing import List, Mapping, Optional
 
 from app.dependencies import CHAIN_ID_LOOKUP
 from app.settings import settings
@@ -13,9 +14,8 @@ from app.usecases.schemas.blockchain import (
     BlockchainClientError,
     BlockchainErrors,
     TransactionReceipt,
-    TransactionReceiptResponse,
 )
-from app.usecases.schemas.relays import Status, UpdateRepoAdapter
+from app.usecases.schemas.relays import Status, UpdateByIdRepoAdapter
 from app.usecases.schemas.tasks import TaskName
 from app.usecases.schemas.transactions import TransactionsJoinRelays
 
@@ -61,41 +61,42 @@ class VerifyDeliveryTask(IVerifyDeliveryTask):
 
         undelivered_transactions = await self.relays_repo.retrieve_undelivered()
 
-        get_receipt_tasks = [
-            asyncio.create_task(self.__get_transaction_receipt(transaction=transaction))
-            for transaction in undelivered_transactions
-        ]
+        # One batched receipt sweep per destination chain, all chains concurrently
+        dest_chain_id_groups = defaultdict(list)
+        for transaction in undelivered_transactions:
+            dest_chain_id_groups[transaction.dest_chain_id].append(transaction)
 
-        receipt_list: List[TransactionReceiptResponse] = await asyncio.gather(
-            *get_receipt_tasks
+        receipt_lists: List[List[Optional[TransactionReceipt]]] = await asyncio.gather(
+            *(
+                self.__get_transaction_receipts(
+                    dest_chain_id=dest_chain_id, transactions=transactions
+                )
+                for dest_chain_id, transactions in dest_chain_id_groups.items()
+            )
         )
 
-        for index, receipt_info in enumerate(receipt_list):
-            if receipt_info.error:
-                if BlockchainErrors.TX_HASH_NOT_IN_CHAIN in receipt_info.error:
-                    status = Status.FAILED
-                    error = receipt_info.error
-                else:
-                    status = Status.PENDING
-                    error = None
-            else:
-                if receipt_info.receipt.status == 1:
+        updates: List[UpdateByIdRepoAdapter] = []
+        for transactions, receipts in zip(dest_chain_id_groups.values(), receipt_lists):
+            for transaction, receipt in zip(transactions, receipts):
+                if receipt is None:
+                    # Not mined yet; checked again on the next run
+                    continue
+
+                if receipt.status == 1:
                     status = Status.SUCCESS
                     error = None
                 else:
                     status = Status.FAILED
                     error = BlockchainErrors.TX_RECEIPT_STATUS_NOT_ONE
 
-            # Update records
-            await self.relays_repo.update(
-                relay=UpdateRepoAdapter(
-                    emitter_address=undelivered_transactions[index].emitter_address,
-                    source_chain_id=undelivered_transactions[index].source_chain_id,
-                    sequence=undelivered_transactions[index].sequence,
-                    status=status,
-                    error=error,
+                updates.append(
+                    UpdateByIdRepoAdapter(
+                        relay_id=transaction.relay_id, status=status, error=error
+                    )
                 )
-            )
+
+        # Update records
+        await self.relays_repo.update_many(relays=updates)
 
         await self.tasks_repo.delete_lock(task_id=task_id)
 
@@ -105,18 +106,21 @@ class VerifyDeliveryTask(IVerifyDeliveryTask):
             round(time.time() - task_start_time, 4),
         )
 
-    async def __get_transaction_receipt(
-        self, transaction: TransactionsJoinRelays
-    ) -> TransactionReceiptResponse:
-        chain_id = CHAIN_ID_LOOKUP[transaction.dest_chain_id]
+    async def __get_transaction_receipts(
+        self, dest_chain_id: int, transactions: List[TransactionsJoinRelays]
+    ) -> List[Optional[TransactionReceipt]]:
+        chain_id = CHAIN_ID_LOOKUP[dest_chain_id]
         dest_evm_client = self.supported_evm_clients[chain_id]
         try:
-            transaction_receipt = await dest_evm_client.fetch_receipt(
-                transaction_hash=transaction.relay_transaction_hash
-            )
-            return TransactionReceiptResponse(
-                receipt=TransactionReceipt(status=transaction_receipt.status),
-                error=None,
+            return await dest_evm_client.fetch_receipts(
+                transaction_hashes=[
+                    transaction.relay_transaction_hash for transaction in transactions
+                ]
             )
         except BlockchainClientError as e:
-            return TransactionReceiptResponse(receipt=None, error=e.detail)
+            self.logger.error(
+                "[VerifyDeliveryTask]: Receipt retrieval failed; chain id: %s. Error: %s",
+                chain_id,
+                e.detail,
+            )
+            return [None] * len(transactions)
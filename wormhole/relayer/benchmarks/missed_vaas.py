@@ -0,0 +1,222 @@
+"""Compares windowed, concurrent missed-VAA gathering against the previous serial scan.
+
+A local stub Wormhole API serves a backlog of VAAs with a fixed response
+latency. Writes to the database configured by DB_URL/DB_SCHEMA; point it at a
+disposable development database. Every row it creates is deleted afterwards.
+
+Run from the relayer directory with: python -m benchmarks.missed_vaas
+"""
+import asyncio
+import base64
+import codecs
+import multiprocessing
+import time
+import uuid
+from typing import Tuple
+
+from aiohttp import ClientSession, web
+from databases import Database
+from sqlalchemy import delete, select
+
+from app.dependencies import CHAIN_ID_LOOKUP, logger
+from app.infrastructure.clients.wormhole import WormholeClient
+from app.infrastructure.db.models.relays import RELAYS
+from app.infrastructure.db.models.transactions import TRANSACTIONS
+from app.infrastructure.db.repos.relays import RelaysRepo
+from app.infrastructure.db.repos.tasks import TasksRepo
+from app.settings import settings
+from app.usecases.schemas.bridge import BridgeClientException, NotFoundException
+from app.usecases.schemas.relays import CacheStatus, GrpcStatus, RelayErrors, Status
+from app.usecases.schemas.transactions import CreateRepoAdapter
+from app.usecases.services.message_processor import MessageProcessor
+from app.usecases.services.vaa_parser import BODY, HEADER, SIGNATURE
+from app.usecases.tasks.gather_missed import GatherMissedVaasTask
+from tests.constants import TEST_VAA
+
+BACKLOG = 5_000
+BACKLOG_CHAIN_ID = 5
+LATENCY_SECONDS = 0.01
+
+
+def build_vaas(emitter_address: str) -> dict:
+    """Base64 VAAs for the backlog, keyed by sequence."""
+    template = bytearray(bytes.fromhex(TEST_VAA))
+    body_start = HEADER.size + SIGNATURE.size * HEADER.unpack_from(template)[2]
+    timestamp, nonce, _, _, _, consistency_level = BODY.unpack_from(
+        template, body_start
+    )
+
+    vaas = {}
+    for sequence in range(BACKLOG):
+        BODY.pack_into(
+            template,
+            body_start,
+            timestamp,
+            nonce,
+            BACKLOG_CHAIN_ID,
+            bytes.fromhex(emitter_address[2:]).rjust(32, b"\0"),
+            sequence,
+            consistency_level,
+        )
+        vaas[sequence] = base64.b64encode(template).decode()
+    return vaas
+
+
+def run_stub_api(emitter_address: str, ports: multiprocessing.Queue) -> None:
+    """Serves the backlog from a separate process so it does not share the event loop."""
+    vaas = build_vaas(emitter_address=emitter_address)
+
+    async def signed_vaa(request: web.Request) -> web.Response:
+        await asyncio.sleep(LATENCY_SECONDS)
+        sequence = int(request.match_info["sequence"])
+        if int(request.match_info["chain_id"]) != BACKLOG_CHAIN_ID or (
+            sequence not in vaas
+        ):
+            return web.json_response({"code": 5, "message": "not found"}, status=404)
+        return web.json_response({"vaaBytes": vaas[sequence]})
+
+    async def serve() -> None:
+        app = web.Application()
+        app.router.add_get("/v1/signed_vaa/{chain_id}/{emitter}/{sequence}", signed_vaa)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        ports.put(runner.addresses[0][1])
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+def start_stub_api(emitter_address: str) -> Tuple[multiprocessing.Process, str]:
+    ports: multiprocessing.Queue = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=run_stub_api, args=(emitter_address, ports), daemon=True
+    )
+    process.start()
+    return process, f"http://127.0.0.1:{ports.get()}"
+
+
+async def legacy_gather(bridge_client: WormholeClient, relays_repo: RelaysRepo) -> None:
+    processor = MessageProcessor()
+    for wh_chain_id in CHAIN_ID_LOOKUP:
+        transaction = await relays_repo.get_latest_sequence(
+            emitter_address=settings.evm_wormhole_bridge,
+            source_chain_id=wh_chain_id,
+        )
+        new_sequence = transaction.sequence + 1 if transaction is not None else 0
+
+        while True:
+            try:
+                message = await bridge_client.fetch_bridge_message(
+                    emitter_address=settings.evm_wormhole_bridge,
+                    emitter_chain_id=wh_chain_id,
+                    sequence=new_sequence,
+                )
+            except (BridgeClientException, NotFoundException):
+                break
+
+            message_bytes = base64.b64decode(message.b64_message)
+            parsed_vaa = processor.parse_vaa(vaa=message_bytes)
+            await relays_repo.create(
+                transaction=CreateRepoAdapter(
+                    emitter_address=parsed_vaa.emitter_address,
+                    from_address=parsed_vaa.payload.from_address,
+                    to_address=f"0x{parsed_vaa.payload.to_address:040x}",
+                    source_chain_id=parsed_vaa.emitter_chain,
+                    dest_chain_id=parsed_vaa.payload.dest_chain_id,
+                    amount=parsed_vaa.payload.amount,
+                    sequence=parsed_vaa.sequence,
+                    relay_error=RelayErrors.MISSED_VAA,
+                    relay_status=Status.FAILED,
+                    relay_message=codecs.encode(message_bytes, "hex_codec")
+                    .decode()
+                    .upper(),
+                    relay_cache_status=CacheStatus.NEVER_CACHED,
+                    relay_grpc_status=GrpcStatus.FAILED,
+                )
+            )
+            new_sequence += 1
+
+
+async def stored_count(db: Database, emitter_address: str) -> int:
+    return await db.fetch_val(
+        "SELECT count(*) FROM "
+        f"{settings.db_schema}.transactions t JOIN {settings.db_schema}.relays r "
+        "ON r.transaction_id = t.id WHERE t.emitter_address = :emitter_address",
+        {"emitter_address": emitter_address},
+    )
+
+
+async def cleanup(db: Database, emitter_address: str) -> None:
+    transaction_ids = select(TRANSACTIONS.c.id).where(
+        TRANSACTIONS.c.emitter_address == emitter_address
+    )
+    async with db.transaction():
+        await db.execute(
+            delete(RELAYS).where(RELAYS.c.transaction_id.in_(transaction_ids))
+        )
+        await db.execute(
+            delete(TRANSACTIONS).where(
+                TRANSACTIONS.c.emitter_address == emitter_address
+            )
+        )
+
+
+async def main() -> None:
+    db = Database(url=settings.db_url)
+    await db.connect()
+    relays_repo = RelaysRepo(db=db)
+    # Emitter addresses without a leading zero round-trip through VAA parsing.
+    emitter_addresses = [f"0xbe{uuid.uuid4().hex}{uuid.uuid4().hex[:6]}" for _ in "ab"]
+    stub_apis = [
+        start_stub_api(emitter_address=emitter_address)
+        for emitter_address in emitter_addresses
+    ]
+    client_session = ClientSession()
+    logger.disabled = True
+
+    try:
+        bridge_clients = [
+            WormholeClient(client_session=client_session, base_url=base_url)
+            for _, base_url in stub_apis
+        ]
+
+        settings.evm_wormhole_bridge = emitter_addresses[0]
+        start = time.perf_counter()
+        await legacy_gather(bridge_client=bridge_clients[0], relays_repo=relays_repo)
+        legacy_seconds = time.perf_counter() - start
+        assert await stored_count(db, emitter_addresses[0]) == BACKLOG
+
+        settings.evm_wormhole_bridge = emitter_addresses[1]
+        task = GatherMissedVaasTask(
+            message_processor=MessageProcessor(),
+            bridge_client=bridge_clients[1],
+            tasks_repo=TasksRepo(db=db),
+            relays_repo=relays_repo,
+            logger=logger,
+        )
+        start = time.perf_counter()
+        await task.task(task_id=0)
+        windowed_seconds = time.perf_counter() - start
+        assert await stored_count(db, emitter_addresses[1]) == BACKLOG
+    finally:
+        await client_session.close()
+        for process, _ in stub_apis:
+            process.terminate()
+        for emitter_address in emitter_addresses:
+            await cleanup(db=db, emitter_address=emitter_address)
+        await db.disconnect()
+
+    print(
+        f"{BACKLOG}-sequence backlog, {LATENCY_SECONDS * 1e3:.0f} ms API latency, "
+        f"window of {settings.bridge_client_window}"
+    )
+    print(f"{'serial scan':<20} {legacy_seconds:10.2f} s")
+    print(
+        f"{'windowed scan':<20} {windowed_seconds:10.2f} s  "
+        f"{legacy_seconds / windowed_seconds:6.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
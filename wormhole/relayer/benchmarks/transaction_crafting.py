@@ -0,0 +1,99 @@
+"""Compares direct processMessage encoding and signing against web3's contract path.
+
+No RPC requests are made; every transaction field is provided up front.
+
+Run from the relayer directory with: python -m benchmarks.transaction_crafting
+"""
+import asyncio
+import time
+
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from app.dependencies import WORMHOLE_BRIDGE_ABI
+from app.infrastructure.clients.evm import encode_bytes_call, get_function_selector
+from app.settings import settings
+from app.usecases.schemas.blockchain import Chains
+from tests.constants import TEST_VAA
+
+PAYLOADS = 10_000
+GAS_LIMIT = 250_000
+FEES = {"maxFeePerGas": 30_000_000_000, "maxPriorityFeePerGas": 1_500_000_000}
+
+
+async def main() -> None:
+    web3_client = AsyncWeb3(AsyncHTTPProvider("http://localhost"))
+    bridge_address = web3_client.to_checksum_address(settings.evm_wormhole_bridge)
+    contract = web3_client.eth.contract(address=bridge_address, abi=WORMHOLE_BRIDGE_ABI)
+    account = web3_client.eth.account.from_key(settings.relayer_private_key)
+    selector = get_function_selector(abi=WORMHOLE_BRIDGE_ABI, name="processMessage")
+
+    vaa = bytes.fromhex(TEST_VAA)
+    payloads = [vaa + nonce.to_bytes(4, "big") for nonce in range(PAYLOADS)]
+
+    def transaction_fields(nonce: int) -> dict:
+        return {
+            "chainId": Chains.ETHEREUM.value,
+            "nonce": nonce,
+            "gas": GAS_LIMIT,
+            "value": 0,
+            **FEES,
+        }
+
+    # Previous path: contract function encoding, build_transaction, sign with the key
+    start = time.perf_counter()
+    legacy_transactions = [
+        await contract.functions.processMessage(payload).build_transaction(
+            transaction_fields(nonce)
+        )
+        for nonce, payload in enumerate(payloads)
+    ]
+    legacy_encode_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    legacy_signed = [
+        web3_client.eth.account.sign_transaction(
+            transaction_dict=transaction, private_key=settings.relayer_private_key
+        )
+        for transaction in legacy_transactions
+    ]
+    legacy_sign_seconds = time.perf_counter() - start
+
+    # Direct path: precomputed selector, raw transaction dict, cached account
+    start = time.perf_counter()
+    transactions = [
+        {
+            **transaction_fields(nonce),
+            "to": bridge_address,
+            "data": encode_bytes_call(selector=selector, argument=payload),
+        }
+        for nonce, payload in enumerate(payloads)
+    ]
+    encode_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    signed = [
+        account.sign_transaction(transaction_dict=transaction)
+        for transaction in transactions
+    ]
+    sign_seconds = time.perf_counter() - start
+
+    assert [transaction.rawTransaction for transaction in signed] == [
+        transaction.rawTransaction for transaction in legacy_signed
+    ]
+
+    print(f"{PAYLOADS} processMessage transactions")
+    for name, legacy_seconds, seconds in (
+        ("encode", legacy_encode_seconds, encode_seconds),
+        ("sign", legacy_sign_seconds, sign_seconds),
+        (
+            "encode + sign",
+            legacy_encode_seconds + legacy_sign_seconds,
+            encode_seconds + sign_seconds,
+        ),
+    ):
+        print(
+            f"{name:<14} web3 {legacy_seconds * 1e3:9.1f} ms  "
+            f"direct {seconds * 1e3:9.1f} ms  {legacy_seconds / seconds:6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
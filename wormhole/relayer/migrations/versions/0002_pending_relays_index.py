@@ -0,0 +1,40 @@
+"""pending relays index
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Built concurrently so that relays stay writable while the index is built.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_relays_pending_created_at",
+            "relays",
+            ["created_at"],
+            unique=False,
+            schema="wh_relayer",
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_relays_pending_created_at",
+            table_name="relays",
+            schema="wh_relayer",
+            postgresql_concurrently=True,
+        )
@@ -1,17 +1,23 @@
 # pylint: disable=redefined-outer-name,unused-argument
+import asyncio
 import os
 import random
 from datetime import datetime, timedelta
 from typing import List, Mapping
 
+import aioredis
 import pytest_asyncio
 import respx
+from aioredis import Redis
 from databases import Database
 from fastapi import FastAPI
 from httpx import AsyncClient
 
 import tests.constants as constant
-from app.dependencies import CHAIN_DATA, get_relays_repo, logger
+from app.dependencies import CHAIN_DATA, WORMHOLE_BRIDGE_ABI, get_relays_repo, logger
+from app.infrastructure.clients.evm import EvmClient
+from app.infrastructure.clients.fee_oracle import EvmFeeOracle
+from app.infrastructure.clients.redis import RedisClient
 from app.infrastructure.db.repos.relays import RelaysRepo
 from app.infrastructure.db.repos.tasks import TasksRepo
 from app.infrastructure.web.setup import setup_app
@@ -20,12 +26,15 @@ from app.usecases.interfaces.clients.bridge import IBridgeClient
 from app.usecases.interfaces.clients.evm import IEvmClient
 from app.usecases.interfaces.repos.relays import IRelaysRepo
 from app.usecases.interfaces.repos.tasks import ITasksRepo
+from app.usecases.interfaces.services.gas_limit_cache import IGasLimitCache
 from app.usecases.interfaces.services.message_processor import IVaaProcessor
+from app.usecases.interfaces.services.nonce_manager import INonceManager
 from app.usecases.interfaces.services.vaa_delivery import IVaaDelivery
 from app.usecases.interfaces.tasks.gather_missed import IGatherMissedVaasTask
 from app.usecases.interfaces.tasks.manage_locks import IManageLocksTask
 from app.usecases.interfaces.tasks.retry_failed import IRetryFailedTask
 from app.usecases.interfaces.tasks.verify_delivery import IVerifyDeliveryTask
+from app.usecases.schemas.blockchain import Chains
 from app.usecases.schemas.relays import (
     CacheStatus,
     RelayErrors,
@@ -33,7 +42,10 @@ from app.usecases.schemas.relays import (
     UpdateRepoAdapter,
 )
 from app.usecases.schemas.tasks import TaskInDb, TaskName
+from app.usecases.schemas.unique_set import UniqueSetTransport
+from app.usecases.services.gas_limit_cache import GasLimitCache
 from app.usecases.services.message_processor import MessageProcessor
+from app.usecases.services.nonce_manager import NonceManager
 from app.usecases.services.vaa_delivery import VaaDelivery
 from app.usecases.tasks.gather_missed import GatherMissedVaasTask
 from app.usecases.tasks.gather_pending import GatherPendingVaasTask
@@ -43,7 +55,9 @@ from app.usecases.tasks.verify_delivery import VerifyDeliveryTask
 
 # Mocks
 from tests.mocks.clients.evm import EvmResult, MockEvmClient
+from tests.mocks.clients.web3_provider import MockWeb3Provider
 from tests.mocks.clients.wormhole import MockWormholeClient
+from tests.mocks.services.vaa_delivery import MockVaaDelivery
 
 
 # Database Connection
@@ -70,6 +84,22 @@ async def test_db(test_db_url) -> Database:
     await test_db.disconnect()
 
 
+# Redis Connection
+@pytest_asyncio.fixture
+async def test_redis_url() -> str:
+    host = os.getenv("REDIS_HOST", "localhost")
+    port = os.getenv("REDIS_PORT", "6380")
+    return f"redis://{host}:{port}/0"
+
+
+@pytest_asyncio.fixture
+async def test_redis(test_redis_url: str) -> Redis:
+    test_redis = await aioredis.from_url(test_redis_url)
+    yield test_redis
+    await test_redis.flushdb()
+    await test_redis.close()
+
+
 @pytest_asyncio.fixture
 async def relays_repo(test_db: Database) -> IRelaysRepo:
     return RelaysRepo(db=test_db)
@@ -110,15 +140,167 @@ async def test_wormhole_client() -> IBridgeClient:
     return MockWormholeClient()
 
 
+@pytest_asyncio.fixture
+async def redis_settings(test_redis: Redis, test_redis_url: str, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "redis_url", test_redis_url)
+    monkeypatch.setattr(settings, "redis_zset", constant.TEST_REDIS_ZSET)
+    monkeypatch.setattr(settings, "redis_min_message_age", 0)
+    monkeypatch.setattr(
+        settings, "redis_consumption_frequency", constant.TEST_REDIS_POLL_FREQUENCY
+    )
+    monkeypatch.setattr(
+        settings, "redis_consumption_max_backoff", constant.TEST_REDIS_POLL_FREQUENCY
+    )
+    monkeypatch.setattr(
+        settings, "redis_consumption_batch_size", constant.TEST_REDIS_BATCH_SIZE
+    )
+    monkeypatch.setattr(
+        settings, "redis_lane_queue_size", constant.TEST_REDIS_LANE_QUEUE_SIZE
+    )
+
+
+@pytest_asyncio.fixture
+async def evm_client(gas_limit_cache: IGasLimitCache, monkeypatch) -> EvmClient:
+    monkeypatch.setattr(settings, "relayer_private_key", constant.TEST_PRIVATE_KEY)
+    monkeypatch.setattr(settings, "relayer_address", constant.TEST_RELAYER_ADDRESS)
+    monkeypatch.setattr(settings, "evm_wormhole_bridge", constant.TEST_BRIDGE_ADDRESS)
+    gas_limit_cache.record_estimate(gas=constant.TEST_GAS_ESTIMATE)
+    web3_provider = MockWeb3Provider()
+    return EvmClient(
+        abi=WORMHOLE_BRIDGE_ABI,
+        chain_id=Chains.BSC.value,
+        web3_provider=web3_provider,
+        fee_oracle=EvmFeeOracle(
+            chain_id=Chains.BSC.value, web3_provider=web3_provider, logger=logger
+        ),
+        gas_limit_cache=gas_limit_cache,
+        logger=logger,
+    )
+
+
+@pytest_asyncio.fixture
+async def fee_oracle_settings(monkeypatch) -> None:
+    # Refreshes are driven by the tests through the max age.
+    monkeypatch.setattr(settings, "fee_oracle_refresh_frequency", 60)
+    monkeypatch.setattr(settings, "fee_oracle_max_age", 0)
+
+
+@pytest_asyncio.fixture
+async def stream_settings(redis_settings: None, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "redis_transport", UniqueSetTransport.STREAM)
+    monkeypatch.setattr(settings, "redis_stream", constant.TEST_REDIS_STREAM)
+    monkeypatch.setattr(settings, "redis_consumer_group", constant.TEST_CONSUMER_GROUP)
+    monkeypatch.setattr(settings, "redis_consumer_name", constant.TEST_CONSUMER_NAME)
+    monkeypatch.setattr(
+        settings, "redis_stream_block_ms", constant.TEST_REDIS_STREAM_BLOCK_MS
+    )
+    monkeypatch.setattr(settings, "redis_stream_min_message_age_ms", 0)
+    monkeypatch.setattr(
+        settings, "redis_stream_claim_idle_ms", constant.TEST_REDIS_CLAIM_IDLE_MS
+    )
+    # Claim on every read
+    monkeypatch.setattr(settings, "redis_stream_claim_frequency", 0)
+
+
+@pytest_asyncio.fixture
+async def stale_stream_entries(stream_settings: None, test_redis: Redis) -> List[bytes]:
+    """Entries read by a consumer that died before acknowledging them; the
+    second was then trimmed from the stream."""
+    await test_redis.xgroup_create(
+        name=constant.TEST_REDIS_STREAM,
+        groupname=constant.TEST_CONSUMER_GROUP,
+        id="0",
+        mkstream=True,
+    )
+    entry_ids = [
+        await test_redis.xadd(constant.TEST_REDIS_STREAM, {"message": message})
+        for message in constant.TEST_STALE_STREAM_MESSAGES
+    ]
+    await test_redis.xreadgroup(
+        groupname=constant.TEST_CONSUMER_GROUP,
+        consumername=constant.TEST_DEAD_CONSUMER_NAME,
+        streams={constant.TEST_REDIS_STREAM: ">"},
+    )
+    await test_redis.xdel(constant.TEST_REDIS_STREAM, entry_ids[1])
+    return entry_ids
+
+
+@pytest_asyncio.fixture
+async def mock_vaa_delivery() -> MockVaaDelivery:
+    return MockVaaDelivery()
+
+
+async def start_redis_client(vaa_delivery: IVaaDelivery) -> RedisClient:
+    """Starts a RedisClient and waits until it has connected."""
+    redis_client = RedisClient(
+        vaa_delivery=vaa_delivery, logger=logger, loop=asyncio.get_running_loop()
+    )
+    while redis_client.redis is None:
+        await asyncio.sleep(0.01)
+    return redis_client
+
+
+@pytest_asyncio.fixture
+async def redis_client(
+    redis_settings: None, mock_vaa_delivery: MockVaaDelivery
+) -> RedisClient:
+    redis_client = await asyncio.wait_for(
+        start_redis_client(vaa_delivery=mock_vaa_delivery),
+        timeout=constant.TEST_REDIS_CONNECT_TIMEOUT,
+    )
+    yield redis_client
+    await redis_client.stop(timeout=constant.TEST_REDIS_DRAIN_TIMEOUT)
+
+
+@pytest_asyncio.fixture
+async def stream_redis_client(
+    stream_settings: None, mock_vaa_delivery: MockVaaDelivery
+) -> RedisClient:
+    redis_client = await asyncio.wait_for(
+        start_redis_client(vaa_delivery=mock_vaa_delivery),
+        timeout=constant.TEST_REDIS_CONNECT_TIMEOUT,
+    )
+    yield redis_client
+    await redis_client.stop(timeout=constant.TEST_REDIS_DRAIN_TIMEOUT)
+
+
 # Services
+@pytest_asyncio.fixture
+async def gas_limit_cache() -> IGasLimitCache:
+    return GasLimitCache(
+        safety_margin=constant.TEST_GAS_LIMIT_SAFETY_MARGIN,
+        window=constant.TEST_GAS_LIMIT_WINDOW,
+        estimate_frequency=constant.TEST_GAS_LIMIT_ESTIMATE_FREQUENCY,
+    )
+
+
+@pytest_asyncio.fixture
+async def nonce_manager() -> INonceManager:
+    return NonceManager(
+        evm_client=MockEvmClient(result=EvmResult.SUCCESS), logger=logger
+    )
+
+
+@pytest_asyncio.fixture
+async def nonce_managers(
+    supported_evm_clients_success: Mapping[int, IEvmClient]
+) -> Mapping[int, INonceManager]:
+    nonce_managers = {}
+    for chain_id, evm_client in supported_evm_clients_success.items():
+        nonce_managers[chain_id] = NonceManager(evm_client=evm_client, logger=logger)
+    return nonce_managers
+
+
 @pytest_asyncio.fixture
 async def vaa_delivery(
     supported_evm_clients_success: IEvmClient,
+    nonce_managers: Mapping[int, INonceManager],
     relays_repo: IRelaysRepo,
 ) -> IVaaDelivery:
     return VaaDelivery(
         relays_repo=relays_repo,
         supported_evm_clients=supported_evm_clients_success,
+        nonce_managers=nonce_managers,
         logger=logger,
     )
 
@@ -126,11 +308,13 @@ async def vaa_delivery(
 @pytest_asyncio.fixture
 async def vaa_delivery_error(
     supported_evm_clients_error: IEvmClient,
+    nonce_managers: Mapping[int, INonceManager],
     relays_repo: IRelaysRepo,
 ) -> IVaaDelivery:
     return VaaDelivery(
         relays_repo=relays_repo,
         supported_evm_clients=supported_evm_clients_error,
+        nonce_managers=nonce_managers,
         logger=logger,
     )
 
@@ -188,12 +372,38 @@ async def retry_failed_task(
     message_processor: IVaaProcessor,
     test_wormhole_client: IBridgeClient,
     supported_evm_clients_success: IEvmClient,
+    nonce_managers: Mapping[int, INonceManager],
     relays_repo: IRelaysRepo,
     tasks_repo: ITasksRepo,
 ) -> IRetryFailedTask:
     return RetryFailedTask(
         message_processor=message_processor,
         supported_evm_clients=supported_evm_clients_success,
+        nonce_managers=nonce_managers,
+        bridge_client=test_wormhole_client,
+        relays_repo=relays_repo,
+        tasks_repo=tasks_repo,
+        logger=logger,
+    )
+
+
+@pytest_asyncio.fixture
+async def retry_failed_task_broadcast_failure(
+    message_processor: IVaaProcessor,
+    test_wormhole_client: IBridgeClient,
+    nonce_managers: Mapping[int, INonceManager],
+    relays_repo: IRelaysRepo,
+    tasks_repo: ITasksRepo,
+) -> IRetryFailedTask:
+    supported_evm_clients = {}
+    for chain_id in CHAIN_DATA:
+        supported_evm_clients[chain_id] = MockEvmClient(
+            result=EvmResult.SUCCESS, fail_at_nonce=constant.TEST_NONCE + 1
+        )
+    return RetryFailedTask(
+        message_processor=message_processor,
+        supported_evm_clients=supported_evm_clients,
+        nonce_managers=nonce_managers,
         bridge_client=test_wormhole_client,
         relays_repo=relays_repo,
         tasks_repo=tasks_repo,
@@ -298,6 +508,36 @@ async def failed_transaction(test_db: Database) -> None:
         )
 
 
+@pytest_asyncio.fixture
+async def failed_transactions(test_db: Database) -> None:
+    for index in range(constant.DEFAULT_ITERATIONS):
+        async with test_db.transaction():
+            transaction_id = await test_db.execute(
+                """INSERT INTO wh_relayer.transactions (emitter_address, from_address, to_address, source_chain_id, dest_chain_id, amount, sequence) VALUES (:emitter_address, :from_address, :to_address, :source_chain_id, :dest_chain_id, :amount, :sequence) RETURNING id""",
+                {
+                    "emitter_address": constant.TEST_EMITTER_ADDRESS,
+                    "from_address": constant.TEST_USER_ADDRESS,
+                    "to_address": constant.TEST_USER_ADDRESS,
+                    "source_chain_id": constant.TEST_SOURCE_CHAIN_ID,
+                    "dest_chain_id": constant.TEST_DESTINATION_CHAIN_ID,
+                    "amount": constant.TEST_AMOUNT,
+                    "sequence": constant.TEST_SEQUENCE + index,
+                },
+            )
+            await test_db.execute(
+                """INSERT INTO wh_relayer.relays (transaction_id, message, status, transaction_hash, error, cache_status, grpc_status) VALUES (:transaction_id, :message, :status, :transaction_hash, :error, :cache_status, :grpc_status)""",
+                {
+                    "transaction_id": transaction_id,
+                    "status": Status.FAILED,
+                    "error": constant.BLOCKCHAIN_CLIENT_ERROR_DETAIL,
+                    "message": constant.TEST_VAA,
+                    "transaction_hash": None,
+                    "cache_status": CacheStatus.NEVER_CACHED,
+                    "grpc_status": "success",
+                },
+            )
+
+
 @pytest_asyncio.fixture
 async def pending_transactions(test_db: Database) -> None:
     for index in range(constant.DEFAULT_ITERATIONS):
@@ -54,4 +54,32 @@ BLOCKCHAIN_CLIENT_ERROR_DETAIL = "[EvmClient]: Error - VAA delivery failed."
 TEST_TRANSACTION_HASH = (
     "0xa4100d05fcbf2e93dfa8e8742fe7d8ba58529774b0c7e7b72f58b0e5f8de3d5e"
 )
+TEST_NONCE = 1
+TEST_GAS_ESTIMATE = 200000
+TEST_GAS_LIMIT_SAFETY_MARGIN = 0.5
+TEST_GAS_LIMIT_WINDOW = 3
+TEST_GAS_LIMIT_ESTIMATE_FREQUENCY = 60
 DEFAULT_ITERATIONS = 3
+TEST_REDIS_ZSET = "test:vaas"
+TEST_REDIS_CONNECT_TIMEOUT = 5
+TEST_REDIS_DRAIN_TIMEOUT = 1
+TEST_REDIS_POLL_FREQUENCY = 0.01
+TEST_REDIS_BATCH_SIZE = 4
+TEST_REDIS_LANE_QUEUE_SIZE = 2
+TEST_BLOCK_NUMBER = 1000
+TEST_BASE_FEE = 100
+TEST_PRIORITY_FEE = 2
+TEST_FEE_ORACLE_MAX_AGE = 0.05
+TEST_PRIVATE_KEY = "0x" + "4c" * 32
+TEST_RELAYER_ADDRESS = "0xdB00079cad3e665853Bf766eFe26F4C38cdbdCDA"
+TEST_BRIDGE_ADDRESS = "0x24fc99a7d2b6ba22c3f9162582a65943a5236e23"
+TEST_REDIS_STREAM = "test:vaas:stream"
+TEST_CONSUMER_GROUP = "test-relayers"
+TEST_CONSUMER_NAME = "test-relayer"
+TEST_DEAD_CONSUMER_NAME = "dead-relayer"
+TEST_REDIS_STREAM_BLOCK_MS = 10
+TEST_REDIS_CLAIM_IDLE_MS = 100
+TEST_STALE_STREAM_MESSAGES = [
+    b'{"dest_chain_id": 2, "sequence": 0}',
+    b'{"dest_chain_id": 2, "sequence": 1}',
+]
@@ -1,8 +1,8 @@
 from enum import Enum
-from typing import Optional
+from typing import List, Optional, Union
 
 from hexbytes import HexBytes
-from web3.types import Nonce, TxReceipt
+from web3.types import Nonce
 
 from app.usecases.interfaces.clients.evm import IEvmClient
 from app.usecases.schemas.blockchain import (
@@ -21,8 +21,11 @@ class EvmResult(str, Enum):
 
 
 class MockEvmClient(IEvmClient):
-    def __init__(self, result: EvmResult) -> None:
+    def __init__(self, result: EvmResult, fail_at_nonce: Optional[int] = None) -> None:
         self.result = result
+        # The broadcast of this nonce fails; the next one was broadcast in the
+        # same batch, and the rest are never sent.
+        self.fail_at_nonce = fail_at_nonce
 
     async def deliver(
         self, payload: str, nonce: Optional[int] = None
@@ -32,15 +35,39 @@ class MockEvmClient(IEvmClient):
             return HexBytes(constant.TEST_TRANSACTION_HASH)
         raise BlockchainClientError(detail=constant.BLOCKCHAIN_CLIENT_ERROR_DETAIL)
 
-    async def fetch_receipt(self, transaction_hash: str) -> TxReceipt:
-        """Fetches the transaction receipt for a given transaction hash."""
+    async def deliver_many(
+        self, payloads: List[bytes], nonces: List[int]
+    ) -> List[Union[TransactionHash, BlockchainClientError]]:
+        """Sends one transaction per payload to the destination blockchain; errors are returned in place."""
+        if self.result == EvmResult.SUCCESS:
+            return [self.__broadcast_result(nonce=nonce) for nonce in nonces]
+        return [
+            BlockchainClientError(detail=constant.BLOCKCHAIN_CLIENT_ERROR_DETAIL)
+            for _ in payloads
+        ]
+
+    def __broadcast_result(
+        self, nonce: int
+    ) -> Union[TransactionHash, BlockchainClientError]:
+        if self.fail_at_nonce is None or nonce < self.fail_at_nonce:
+            return HexBytes(constant.TEST_TRANSACTION_HASH)
+        if nonce == self.fail_at_nonce:
+            return BlockchainClientError(detail=constant.BLOCKCHAIN_CLIENT_ERROR_DETAIL)
+        if nonce == self.fail_at_nonce + 1:
+            return HexBytes(constant.TEST_TRANSACTION_HASH)
+        return BlockchainClientError(detail=BlockchainErrors.LOWER_NONCE_FAILED.value)
+
+    async def fetch_receipts(
+        self, transaction_hashes: List[str]
+    ) -> List[Optional[TransactionReceipt]]:
+        """Fetches the receipts of the given transactions; None if not yet mined."""
 
         if self.result == EvmResult.SUCCESS:
-            return TransactionReceipt(status=1)
+            return [TransactionReceipt(status=1) for _ in transaction_hashes]
         elif self.result == EvmResult.FAILURE:
-            return TransactionReceipt(status=0)
-        raise BlockchainClientError(detail=BlockchainErrors.TX_HASH_NOT_IN_CHAIN)
+            return [TransactionReceipt(status=0) for _ in transaction_hashes]
+        return [None for _ in transaction_hashes]
 
     async def get_current_nonce(self) -> Nonce:
         """Retrieves the current nonce of the relayer on a provided destination chain."""
-        return Nonce(1)
+        return Nonce(constant.TEST_NONCE)
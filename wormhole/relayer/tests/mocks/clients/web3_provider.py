@@ -0,0 +1,82 @@
+# pylint: disable=unused-argument
+from typing import Any, Dict, List, Optional, Tuple
+
+from web3.providers.async_base import AsyncBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from app.usecases.schemas.blockchain import BlockchainErrors
+from tests import constants as constant
+
+
+class MockWeb3Provider(AsyncBaseProvider):
+    """Answers the fee RPC methods of a chain whose head is block_number, calls
+    to processMessage, and batched broadcasts."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.block_number = constant.TEST_BLOCK_NUMBER
+        self.fail = False
+        self.requests: List[Tuple[str, Any]] = []
+        # Request ids of the broadcast transactions, in order
+        self.broadcasts: List[int] = []
+        # Position among the broadcasts of the one the node rejects
+        self.failed_broadcast: Optional[int] = None
+        # Calls revert as for a message that was already processed
+        self.processed = False
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        self.requests.append((method, params))
+        if self.fail:
+            raise ConnectionError("RPC endpoint unreachable.")
+
+        if method == "eth_blockNumber":
+            result: Any = hex(self.block_number)
+        elif method == "eth_feeHistory":
+            block_count, newest_block = int(params[0], 16), int(params[1], 16)
+            result = {
+                "oldestBlock": hex(newest_block - block_count + 1),
+                # One priority fee per block, equal to its number
+                "reward": [
+                    [hex(block)]
+                    for block in range(newest_block - block_count + 1, newest_block + 1)
+                ],
+                "baseFeePerGas": [hex(constant.TEST_BASE_FEE)] * (block_count + 1),
+                "gasUsedRatio": [0.5] * block_count,
+            }
+        elif method == "eth_call":
+            if self.processed:
+                return {
+                    "jsonrpc": "2.0",
+                    "id": len(self.requests),
+                    "error": {
+                        "code": -32000,
+                        "message": f"execution reverted: {BlockchainErrors.MESSAGE_PROCESSED.value}",
+                    },
+                }
+            result = "0x"
+        elif method == "eth_gasPrice":
+            result = hex(constant.TEST_BASE_FEE)
+        elif method == "eth_maxPriorityFeePerGas":
+            result = hex(constant.TEST_PRIORITY_FEE)
+        else:
+            raise NotImplementedError(method)
+
+        return {"jsonrpc": "2.0", "id": len(self.requests), "result": result}
+
+    async def make_batch_request(
+        self, requests: List[Dict[str, Any]], hedge: bool = False, retry: bool = True
+    ) -> List[Dict[str, Any]]:
+        responses = []
+        for request in requests:
+            if len(self.broadcasts) == self.failed_broadcast:
+                response: Dict[str, Any] = {
+                    "error": {"message": constant.BLOCKCHAIN_CLIENT_ERROR_DETAIL}
+                }
+            else:
+                response = {"result": constant.TEST_TRANSACTION_HASH}
+            self.broadcasts.append(request["id"])
+            responses.append({"jsonrpc": "2.0", "id": request["id"], **response})
+        return responses
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
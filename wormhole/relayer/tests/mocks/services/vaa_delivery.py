@@ -0,0 +1,31 @@
+import asyncio
+from typing import Dict, List, Set
+
+from app.usecases.interfaces.services.vaa_delivery import IVaaDelivery
+from app.usecases.services.unique_set_codec import decode_dest_chain_id
+
+
+class MockVaaDelivery(IVaaDelivery):
+    def __init__(self) -> None:
+        self.delivered: List[bytes] = []
+        self.failed: List[bytes] = []
+        # Deliveries to a held destination chain wait until it is released.
+        self.held: Dict[int, asyncio.Event] = {}
+        # Deliveries to a failing destination chain raise.
+        self.failing: Set[int] = set()
+
+    def hold(self, dest_chain_id: int) -> None:
+        self.held[dest_chain_id] = asyncio.Event()
+
+    def release(self, dest_chain_id: int) -> None:
+        self.held.pop(dest_chain_id).set()
+
+    async def process(self, set_message: bytes) -> None:
+        """Records the message once its destination chain is not held."""
+        dest_chain_id = decode_dest_chain_id(member=set_message)
+        if dest_chain_id in self.held:
+            await self.held[dest_chain_id].wait()
+        if dest_chain_id in self.failing:
+            self.failed.append(set_message)
+            raise ConnectionError("Relay could not be updated.")
+        self.delivered.append(set_message)
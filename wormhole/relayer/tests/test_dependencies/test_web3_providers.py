@@ -0,0 +1,32 @@
+import pytest
+from aiohttp import ClientSession
+
+from app.dependencies import CHAIN_DATA, get_rpc_session, get_web3_provider
+from app.infrastructure.clients.rpc_pool import RpcProviderPool
+from app.settings import settings
+
+
+@pytest.mark.asyncio
+async def test_get_rpc_session() -> None:
+
+    rpc_session = await get_rpc_session()
+
+    assert isinstance(rpc_session, ClientSession)
+    assert rpc_session is await get_rpc_session()
+    assert rpc_session.connector.limit == settings.rpc_connection_limit
+    assert rpc_session.connector.limit_per_host == (
+        settings.rpc_connection_limit_per_host
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_web3_provider() -> None:
+
+    for chain_id in CHAIN_DATA:
+        web3_provider = await get_web3_provider(chain_id=chain_id)
+
+        assert isinstance(web3_provider, RpcProviderPool)
+        assert [endpoint.url for endpoint in web3_provider.endpoints] == (
+            CHAIN_DATA[chain_id]["rpc"].split(",")
+        )
+        assert web3_provider is await get_web3_provider(chain_id=chain_id)
@@ -0,0 +1,108 @@
+import pytest
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import Web3
+
+import tests.constants as constant
+from app.dependencies import WORMHOLE_BRIDGE_ABI
+from app.infrastructure.clients.evm import (
+    EvmClient,
+    encode_bytes_call,
+    get_function_selector,
+)
+from app.settings import settings
+from app.usecases.schemas.blockchain import BlockchainClientError, BlockchainErrors
+
+
+def test_get_function_selector() -> None:
+
+    selector = get_function_selector(abi=WORMHOLE_BRIDGE_ABI, name="processMessage")
+
+    assert selector == Web3.keccak(text="processMessage(bytes)")[:4]
+
+
+@pytest.mark.parametrize("length", [0, 31, 32, 33])
+def test_encode_bytes_call(length: int) -> None:
+    """Test that the calldata matches eth_abi's encoding around word boundaries."""
+
+    selector = get_function_selector(abi=WORMHOLE_BRIDGE_ABI, name="processMessage")
+    argument = bytes(range(1, length + 1))
+
+    calldata = encode_bytes_call(selector=selector, argument=argument)
+
+    assert calldata == selector + encode(["bytes"], [argument])
+
+
+@pytest.mark.asyncio
+async def test_deliver_processed(evm_client: EvmClient) -> None:
+    """Test that a message already processed is rejected before it is broadcast,
+    even with a cached gas limit."""
+
+    evm_client.web3_provider.processed = True
+
+    with pytest.raises(BlockchainClientError) as error:
+        await evm_client.deliver(payload=constant.TEST_VAA_BYTES, nonce=10)
+
+    assert BlockchainErrors.MESSAGE_PROCESSED in error.value.detail
+    assert [method for method, _ in evm_client.web3_provider.requests] == ["eth_call"]
+
+
+@pytest.mark.asyncio
+async def test_deliver_many(evm_client: EvmClient) -> None:
+    """Test that transactions are broadcast in nonce order."""
+
+    nonces = [12, 10, 11]
+
+    results = await evm_client.deliver_many(
+        payloads=[constant.TEST_VAA_BYTES] * len(nonces), nonces=nonces
+    )
+
+    assert results == [HexBytes(constant.TEST_TRANSACTION_HASH)] * len(nonces)
+    assert evm_client.web3_provider.broadcasts == [1, 2, 0]
+
+
+@pytest.mark.asyncio
+async def test_deliver_many_failure(evm_client: EvmClient, monkeypatch) -> None:
+    """Test that broadcasting stops after the batch with the first failed nonce,
+    that those broadcast in the same batch keep their hash, and that the rest
+    fail."""
+
+    monkeypatch.setattr(settings, "broadcast_batch_size", 2)
+    # Nonce 12, first in the second batch
+    evm_client.web3_provider.failed_broadcast = 2
+    nonces = [12, 10, 11, 14, 13]
+
+    results = await evm_client.deliver_many(
+        payloads=[constant.TEST_VAA_BYTES] * len(nonces), nonces=nonces
+    )
+
+    assert evm_client.web3_provider.broadcasts == [1, 2, 0, 4]
+    for index in (1, 2, 4):
+        assert results[index] == HexBytes(constant.TEST_TRANSACTION_HASH)
+    assert results[0].detail == constant.BLOCKCHAIN_CLIENT_ERROR_DETAIL
+    assert isinstance(results[3], BlockchainClientError)
+    assert results[3].detail == BlockchainErrors.LOWER_NONCE_FAILED
+
+
+@pytest.mark.asyncio
+async def test_deliver_many_broadcast_unknown(
+    evm_client: EvmClient, monkeypatch
+) -> None:
+    """Test that transactions whose broadcast may have reached the node are
+    reported as such, so that their nonces are not simply reused."""
+
+    async def make_batch_request(**kwargs):
+        raise TimeoutError("Broadcast timed out.")
+
+    monkeypatch.setattr(
+        evm_client.web3_provider, "make_batch_request", make_batch_request
+    )
+    nonces = [10, 11]
+
+    results = await evm_client.deliver_many(
+        payloads=[constant.TEST_VAA_BYTES] * len(nonces), nonces=nonces
+    )
+
+    for result in results:
+        assert isinstance(result, BlockchainClientError)
+        assert BlockchainErrors.BROADCAST_UNKNOWN in result.detail
@@ -0,0 +1,178 @@
+# pylint: disable=unused-argument
+import asyncio
+from math import ceil
+from statistics import median
+from typing import List
+
+import pytest
+
+import tests.constants as constant
+from app.dependencies import logger
+from app.infrastructure.clients.fee_oracle import EvmFeeOracle
+from app.settings import settings
+from app.usecases.schemas.blockchain import Chains
+from tests.mocks.clients.web3_provider import MockWeb3Provider
+
+
+def fee_history_block_counts(provider: MockWeb3Provider) -> List[int]:
+    return [
+        int(params[0], 16)
+        for method, params in provider.requests
+        if method == "eth_feeHistory"
+    ]
+
+
+def expected_fees(newest_block: int) -> dict:
+    """Fees once the window holds the recent_blocks blocks up to newest_block."""
+    blocks = range(newest_block - settings.recent_blocks + 1, newest_block + 1)
+    max_priority_fee = ceil(median(blocks))
+    return {
+        "maxFeePerGas": constant.TEST_BASE_FEE + max_priority_fee,
+        "maxPriorityFeePerGas": max_priority_fee,
+    }
+
+
+def build_fee_oracle(chain_id: int, provider: MockWeb3Provider) -> EvmFeeOracle:
+    return EvmFeeOracle(chain_id=chain_id, web3_provider=provider, logger=logger)
+
+
+@pytest.mark.asyncio
+async def test_get_fees_fee_history(fee_oracle_settings: None) -> None:
+    """Test that only the fee history of new blocks is fetched after the first."""
+
+    provider = MockWeb3Provider()
+    fee_oracle = build_fee_oracle(chain_id=Chains.ETHEREUM.value, provider=provider)
+
+    try:
+        assert await fee_oracle.get_fees() == expected_fees(
+            newest_block=constant.TEST_BLOCK_NUMBER
+        )
+
+        provider.block_number += 3
+        assert await fee_oracle.get_fees() == expected_fees(
+            newest_block=constant.TEST_BLOCK_NUMBER + 3
+        )
+    finally:
+        fee_oracle.refresh_task.cancel()
+
+    assert fee_history_block_counts(provider=provider) == [settings.recent_blocks, 3]
+
+
+@pytest.mark.asyncio
+async def test_get_fees_concurrent(fee_oracle_settings: None, monkeypatch) -> None:
+    """Test that concurrent callers without fees share a single refresh."""
+
+    monkeypatch.setattr(settings, "fee_oracle_max_age", 60)
+    provider = MockWeb3Provider()
+    fee_oracle = build_fee_oracle(chain_id=Chains.ETHEREUM.value, provider=provider)
+
+    try:
+        results = await asyncio.gather(*(fee_oracle.get_fees() for _ in range(5)))
+    finally:
+        fee_oracle.refresh_task.cancel()
+
+    assert results == [expected_fees(newest_block=constant.TEST_BLOCK_NUMBER)] * 5
+    assert fee_history_block_counts(provider=provider) == [settings.recent_blocks]
+    assert len(fee_oracle.priority_fees) == settings.recent_blocks
+
+
+@pytest.mark.asyncio
+async def test_get_fees_older_block(fee_oracle_settings: None) -> None:
+    """Test that a block older than the newest one seen is not fetched again."""
+
+    provider = MockWeb3Provider()
+    fee_oracle = build_fee_oracle(chain_id=Chains.ETHEREUM.value, provider=provider)
+
+    try:
+        fees = await fee_oracle.get_fees()
+
+        fetched_at = fee_oracle.fetched_at
+        provider.block_number -= 5
+        assert await fee_oracle.get_fees() == fees
+        # Nothing newer was read, so the fees are no fresher.
+        assert fee_oracle.fetched_at == fetched_at
+    finally:
+        fee_oracle.refresh_task.cancel()
+
+    assert fee_history_block_counts(provider=provider) == [settings.recent_blocks]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "chain_id, fees",
+    [
+        (Chains.BSC.value, {"gasPrice": constant.TEST_BASE_FEE}),
+        (
+            Chains.CELO.value,
+            {
+                "maxFeePerGas": constant.TEST_BASE_FEE + constant.TEST_PRIORITY_FEE,
+                "maxPriorityFeePerGas": constant.TEST_PRIORITY_FEE,
+            },
+        ),
+    ],
+)
+async def test_get_fees_without_fee_history(
+    fee_oracle_settings: None, chain_id: int, fees: dict
+) -> None:
+
+    provider = MockWeb3Provider()
+    fee_oracle = build_fee_oracle(chain_id=chain_id, provider=provider)
+
+    try:
+        assert await fee_oracle.get_fees() == fees
+    finally:
+        fee_oracle.refresh_task.cancel()
+
+    assert fee_history_block_counts(provider=provider) == []
+
+
+@pytest.mark.asyncio
+async def test_get_fees_stale(fee_oracle_settings: None, monkeypatch) -> None:
+    """Test that cached fees are served until they are too old to be trusted."""
+
+    monkeypatch.setattr(
+        settings, "fee_oracle_max_age", constant.TEST_FEE_ORACLE_MAX_AGE
+    )
+    provider = MockWeb3Provider()
+    fee_oracle = build_fee_oracle(chain_id=Chains.ETHEREUM.value, provider=provider)
+
+    try:
+        fees = await fee_oracle.get_fees()
+
+        provider.fail = True
+        assert await fee_oracle.get_fees() == fees
+
+        await asyncio.sleep(constant.TEST_FEE_ORACLE_MAX_AGE)
+        with pytest.raises(ConnectionError):
+            await fee_oracle.get_fees()
+    finally:
+        fee_oracle.refresh_task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_background_refresh(fee_oracle_settings: None, monkeypatch) -> None:
+    """Test that failed background refreshes are logged and retried."""
+
+    monkeypatch.setattr(
+        settings, "fee_oracle_refresh_frequency", constant.TEST_FEE_ORACLE_MAX_AGE / 5
+    )
+    monkeypatch.setattr(settings, "fee_oracle_max_age", 60)
+    provider = MockWeb3Provider()
+    fee_oracle = build_fee_oracle(chain_id=Chains.ETHEREUM.value, provider=provider)
+
+    try:
+        await fee_oracle.get_fees()
+
+        provider.fail = True
+        await asyncio.sleep(constant.TEST_FEE_ORACLE_MAX_AGE)
+        provider.fail = False
+        provider.block_number += 1
+        await asyncio.sleep(constant.TEST_FEE_ORACLE_MAX_AGE)
+
+        assert await fee_oracle.get_fees() == expected_fees(
+            newest_block=constant.TEST_BLOCK_NUMBER + 1
+        )
+    finally:
+        fee_oracle.refresh_task.cancel()
+
+    assert fee_history_block_counts(provider=provider) == [settings.recent_blocks, 1]
@@ -0,0 +1,296 @@
+# pylint: disable=unused-argument, protected-access
+import asyncio
+import json
+import time
+from typing import Dict, List, Tuple
+
+import pytest
+from aioredis import Redis
+
+import tests.constants as constant
+from app.infrastructure.clients.redis import CONSUME_SCRIPT, RedisClient
+from app.settings import settings
+from tests.mocks.services.vaa_delivery import MockVaaDelivery
+
+HELD_CHAIN_ID = 2
+FREE_CHAIN_ID = 5
+
+
+def build_messages(dest_chain_id: int, count: int) -> List[bytes]:
+    return [
+        json.dumps({"dest_chain_id": dest_chain_id, "sequence": sequence}).encode()
+        for sequence in range(count)
+    ]
+
+
+async def add_messages(test_redis: Redis, messages: List[bytes]) -> Dict[bytes, float]:
+    """Adds messages to the sorted set, oldest first, and returns their scores."""
+    oldest = time.time() - 60
+    members = {message: oldest + index for index, message in enumerate(messages)}
+    await test_redis.zadd(constant.TEST_REDIS_ZSET, members)
+    return members
+
+
+async def stored_messages(test_redis: Redis) -> List[Tuple[bytes, float]]:
+    return await test_redis.zrange(constant.TEST_REDIS_ZSET, 0, -1, withscores=True)
+
+
+async def wait_until(condition) -> None:
+    async def poll() -> None:
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout=1)
+
+
+def test_next_poll_delay(monkeypatch) -> None:
+    """Test that polling backs off while the sorted set is empty, up to the cap,
+    and resets once messages arrive."""
+
+    monkeypatch.setattr(settings, "redis_consumption_frequency", 1)
+    monkeypatch.setattr(settings, "redis_consumption_max_backoff", 8)
+    monkeypatch.setattr(
+        settings, "redis_consumption_batch_size", constant.TEST_REDIS_BATCH_SIZE
+    )
+    next_poll_delay = RedisClient._RedisClient__next_poll_delay
+
+    delays = [0.0]
+    for _ in range(5):
+        delays.append(next_poll_delay(delay=delays[-1], batch_size=0))
+    assert delays == [0.0, 1, 2, 4, 8, 8]
+
+    # A partial batch polls again at the base frequency, a full one at once.
+    assert next_poll_delay(delay=8, batch_size=1) == 1
+    assert next_poll_delay(delay=8, batch_size=constant.TEST_REDIS_BATCH_SIZE - 1) == 1
+    assert next_poll_delay(delay=8, batch_size=constant.TEST_REDIS_BATCH_SIZE) == 0
+
+
+@pytest.mark.asyncio
+async def test_consume_script(redis_settings: None, test_redis: Redis) -> None:
+    """Test that a poll pops at most a batch of the oldest messages old enough,
+    after skipping those held back."""
+
+    messages = build_messages(dest_chain_id=HELD_CHAIN_ID, count=10)
+    members = await add_messages(test_redis=test_redis, messages=messages)
+    recent = build_messages(dest_chain_id=FREE_CHAIN_ID, count=1)
+    await test_redis.zadd(constant.TEST_REDIS_ZSET, {recent[0]: time.time()})
+    script_sha = await test_redis.script_load(CONSUME_SCRIPT)
+
+    async def pop(skipped: int) -> List[bytes]:
+        items = await test_redis.evalsha(
+            script_sha,
+            1,
+            constant.TEST_REDIS_ZSET,
+            time.time() - 1,
+            constant.TEST_REDIS_BATCH_SIZE,
+            skipped,
+        )
+        assert [float(score) for score in items[1::2]] == [
+            members[message] for message in items[::2]
+        ]
+        return items[::2]
+
+    assert await pop(skipped=0) == messages[:4]
+    assert await pop(skipped=2) == messages[6:10]
+    assert await pop(skipped=0) == messages[4:6]
+    assert await pop(skipped=0) == []
+
+    assert await test_redis.zrange(constant.TEST_REDIS_ZSET, 0, -1) == recent
+
+
+@pytest.mark.asyncio
+async def test_lane_ordering(
+    redis_client: RedisClient, mock_vaa_delivery: MockVaaDelivery, test_redis: Redis
+) -> None:
+    """Test that a chain's messages are delivered in the order they were added,
+    including those put back while its lane was full."""
+
+    messages = build_messages(dest_chain_id=HELD_CHAIN_ID, count=10)
+    await add_messages(test_redis=test_redis, messages=messages)
+
+    await wait_until(lambda: len(mock_vaa_delivery.delivered) == len(messages))
+
+    assert mock_vaa_delivery.delivered == messages
+    assert await stored_messages(test_redis=test_redis) == []
+
+
+@pytest.mark.asyncio
+async def test_lane_concurrency(
+    redis_client: RedisClient,
+    mock_vaa_delivery: MockVaaDelivery,
+    test_redis: Redis,
+    monkeypatch,
+) -> None:
+    """Test that chains are delivered to independently, each up to its own
+    concurrency."""
+
+    monkeypatch.setattr(settings, "redis_lane_concurrency", {HELD_CHAIN_ID: 2})
+    mock_vaa_delivery.hold(dest_chain_id=HELD_CHAIN_ID)
+    held_messages = build_messages(dest_chain_id=HELD_CHAIN_ID, count=3)
+    free_messages = build_messages(dest_chain_id=FREE_CHAIN_ID, count=3)
+    await add_messages(test_redis=test_redis, messages=held_messages + free_messages)
+
+    await wait_until(lambda: len(mock_vaa_delivery.delivered) == len(free_messages))
+    assert mock_vaa_delivery.delivered == free_messages
+    assert len(redis_client.in_flight) == 2
+
+    mock_vaa_delivery.release(dest_chain_id=HELD_CHAIN_ID)
+    await wait_until(
+        lambda: len(mock_vaa_delivery.delivered)
+        == len(held_messages) + len(free_messages)
+    )
+    assert mock_vaa_delivery.delivered[len(free_messages) :] == held_messages
+
+
+@pytest.mark.asyncio
+async def test_lane_full(
+    redis_client: RedisClient, mock_vaa_delivery: MockVaaDelivery, test_redis: Redis
+) -> None:
+    """Test that a full lane leaves its backlog in the sorted set without holding
+    up other chains."""
+
+    mock_vaa_delivery.hold(dest_chain_id=HELD_CHAIN_ID)
+    held_messages = build_messages(dest_chain_id=HELD_CHAIN_ID, count=8)
+    free_messages = build_messages(dest_chain_id=FREE_CHAIN_ID, count=2)
+    members = await add_messages(
+        test_redis=test_redis, messages=held_messages + free_messages
+    )
+
+    await wait_until(lambda: len(mock_vaa_delivery.delivered) == len(free_messages))
+    assert mock_vaa_delivery.delivered == free_messages
+
+    # One in flight and a full lane; the rest are back at their original scores.
+    backlog = held_messages[1 + constant.TEST_REDIS_LANE_QUEUE_SIZE :]
+    assert await stored_messages(test_redis=test_redis) == [
+        (message, members[message]) for message in backlog
+    ]
+
+    mock_vaa_delivery.release(dest_chain_id=HELD_CHAIN_ID)
+    await wait_until(
+        lambda: len(mock_vaa_delivery.delivered)
+        == len(held_messages) + len(free_messages)
+    )
+    assert mock_vaa_delivery.delivered[len(free_messages) :] == held_messages
+
+
+@pytest.mark.asyncio
+async def test_stop(
+    redis_client: RedisClient, mock_vaa_delivery: MockVaaDelivery, test_redis: Redis
+) -> None:
+    """Test that messages still queued on stop are put back in the sorted set."""
+
+    mock_vaa_delivery.hold(dest_chain_id=HELD_CHAIN_ID)
+    messages = build_messages(dest_chain_id=HELD_CHAIN_ID, count=4)
+    members = await add_messages(test_redis=test_redis, messages=messages)
+
+    await wait_until(lambda: len(redis_client.in_flight) == 1)
+    await redis_client.stop(timeout=constant.TEST_REDIS_POLL_FREQUENCY)
+
+    # The delivery in flight is cancelled; the queued ones are put back.
+    assert await stored_messages(test_redis=test_redis) == [
+        (message, members[message]) for message in messages[1:]
+    ]
+    assert redis_client.redis is None
+
+
+async def add_stream_messages(test_redis: Redis, messages: List[bytes]) -> List[bytes]:
+    return [
+        await test_redis.xadd(constant.TEST_REDIS_STREAM, {"message": message})
+        for message in messages
+    ]
+
+
+async def pending_entries(test_redis: Redis) -> List[bytes]:
+    pending = await test_redis.xpending_range(
+        constant.TEST_REDIS_STREAM,
+        constant.TEST_CONSUMER_GROUP,
+        min="-",
+        max="+",
+        count=100,
+    )
+    return [entry["message_id"] for entry in pending]
+
+
+@pytest.mark.asyncio
+async def test_stream_acknowledgement(
+    stream_redis_client: RedisClient,
+    mock_vaa_delivery: MockVaaDelivery,
+    test_redis: Redis,
+) -> None:
+    """Test that stream entries are acknowledged once delivered, and left pending
+    for a later claim when delivery fails."""
+
+    mock_vaa_delivery.failing.add(FREE_CHAIN_ID)
+    delivered = build_messages(dest_chain_id=HELD_CHAIN_ID, count=2)
+    failed = build_messages(dest_chain_id=FREE_CHAIN_ID, count=1)
+    entry_ids = await add_stream_messages(
+        test_redis=test_redis, messages=delivered + failed
+    )
+
+    await wait_until(
+        lambda: mock_vaa_delivery.delivered == delivered and mock_vaa_delivery.failed
+    )
+    await wait_until(lambda: len(stream_redis_client.in_flight) == 0)
+
+    assert await pending_entries(test_redis=test_redis) == entry_ids[len(delivered) :]
+
+
+@pytest.mark.asyncio
+async def test_stream_unsupported_chain(
+    stream_redis_client: RedisClient,
+    mock_vaa_delivery: MockVaaDelivery,
+    test_redis: Redis,
+) -> None:
+    """Test that an entry without a supported destination chain is acknowledged
+    without being delivered."""
+
+    unsupported = build_messages(dest_chain_id=0, count=1)
+    supported = build_messages(dest_chain_id=HELD_CHAIN_ID, count=1)
+    await add_stream_messages(test_redis=test_redis, messages=unsupported + supported)
+
+    await wait_until(lambda: mock_vaa_delivery.delivered == supported)
+    await wait_until(lambda: len(stream_redis_client.in_flight) == 0)
+
+    assert await pending_entries(test_redis=test_redis) == []
+
+
+@pytest.mark.asyncio
+async def test_stream_claim(
+    stale_stream_entries: List[bytes],
+    stream_redis_client: RedisClient,
+    mock_vaa_delivery: MockVaaDelivery,
+    test_redis: Redis,
+) -> None:
+    """Test that entries left pending by another consumer are claimed once idle,
+    and that those trimmed from the stream are acknowledged."""
+
+    await wait_until(
+        lambda: mock_vaa_delivery.delivered == constant.TEST_STALE_STREAM_MESSAGES[:1]
+    )
+    await wait_until(lambda: len(stream_redis_client.in_flight) == 0)
+
+    assert await pending_entries(test_redis=test_redis) == []
+
+
+@pytest.mark.asyncio
+async def test_stream_min_message_age(
+    stream_redis_client: RedisClient,
+    mock_vaa_delivery: MockVaaDelivery,
+    test_redis: Redis,
+    monkeypatch,
+) -> None:
+    """Test that an entry is not delivered before it is the minimum age."""
+
+    min_age_ms = 200
+    monkeypatch.setattr(settings, "redis_stream_min_message_age_ms", min_age_ms)
+    # Not claimed back while it waits
+    monkeypatch.setattr(settings, "redis_stream_claim_idle_ms", 60 * 1000)
+    messages = build_messages(dest_chain_id=HELD_CHAIN_ID, count=1)
+    (entry_id,) = await add_stream_messages(test_redis=test_redis, messages=messages)
+
+    await asyncio.sleep(min_age_ms / 2000)
+    assert mock_vaa_delivery.delivered == []
+
+    await wait_until(lambda: mock_vaa_delivery.delivered == messages)
+    added_ms = int(entry_id.split(b"-")[0])
+    assert time.time() * 1000 >= added_ms + min_age_ms
@@ -0,0 +1,188 @@
+# pylint: disable=redefined-outer-name
+import asyncio
+import socket
+from typing import AsyncIterator, Callable, Dict, List
+
+import pytest
+import pytest_asyncio
+from aiohttp import ClientConnectorError, ClientSession, web
+
+from app.dependencies import logger
+from app.infrastructure.clients.rpc_pool import RpcProviderPool
+
+TEST_BLOCK_NUMBER = "0x10"
+TEST_COOLDOWN = 0.1
+
+
+def unused_url() -> str:
+    """URL of a local port nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+
+@pytest_asyncio.fixture
+async def start_rpc() -> AsyncIterator[Callable]:
+    """Starts local JSON-RPC endpoints that answer after delay seconds."""
+    runners: List[web.AppRunner] = []
+    calls: Dict[str, int] = {}
+
+    async def start(delay: float = 0) -> str:
+        async def handle(request: web.Request) -> web.Response:
+            calls[url] = calls.get(url, 0) + 1
+            await asyncio.sleep(delay)
+            body = await request.json()
+            if isinstance(body, list):
+                return web.json_response(
+                    [
+                        {"jsonrpc": "2.0", "id": item["id"], "result": item["method"]}
+                        for item in body
+                    ]
+                )
+            return web.json_response(
+                {"jsonrpc": "2.0", "id": body["id"], "result": TEST_BLOCK_NUMBER}
+            )
+
+        app = web.Application()
+        app.router.add_post("/", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        runners.append(runner)
+        url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+        return url
+
+    start.calls = calls  # type: ignore[attr-defined]
+    yield start
+    for runner in runners:
+        await runner.cleanup()
+
+
+async def build_pool(urls: List[str], **kwargs) -> RpcProviderPool:
+    pool = RpcProviderPool(urls=urls, logger=logger, **kwargs)
+    await pool.cache_async_session(ClientSession())
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_make_request_fails_over(start_rpc: Callable) -> None:
+
+    dead_url = unused_url()
+    pool = await build_pool(urls=[dead_url, await start_rpc()])
+
+    try:
+        response = await pool.make_request("eth_blockNumber", [])
+    finally:
+        await pool.session.close()
+
+    assert response["result"] == TEST_BLOCK_NUMBER
+    assert pool.endpoints[0].error_rate == 1
+    assert pool.endpoint_uri != dead_url
+
+
+@pytest.mark.asyncio
+async def test_make_request_all_fail() -> None:
+
+    pool = await build_pool(urls=[unused_url(), unused_url()])
+
+    try:
+        with pytest.raises(ClientConnectorError):
+            await pool.make_request("eth_blockNumber", [])
+    finally:
+        await pool.session.close()
+
+    assert [endpoint.error_rate for endpoint in pool.endpoints] == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_endpoint_cooldown(start_rpc: Callable) -> None:
+
+    dead_url = unused_url()
+    live_url = await start_rpc()
+    pool = await build_pool(
+        urls=[dead_url, live_url],
+        max_consecutive_errors=2,
+        cooldown=TEST_COOLDOWN,
+        error_penalty=0,
+    )
+
+    try:
+        for _ in range(3):
+            await pool.make_request("eth_blockNumber", [])
+        # Sat out the third request
+        assert pool.endpoints[0].consecutive_errors == 2
+        assert start_rpc.calls == {live_url: 3}
+
+        await asyncio.sleep(TEST_COOLDOWN)
+        assert pool.endpoint_uri == dead_url
+    finally:
+        await pool.session.close()
+
+
+@pytest.mark.asyncio
+async def test_make_request_send_not_retried(start_rpc: Callable) -> None:
+
+    pool = await build_pool(urls=[unused_url(), await start_rpc()])
+
+    try:
+        with pytest.raises(Exception):
+            await pool.make_request("eth_sendRawTransaction", ["0x00"])
+    finally:
+        await pool.session.close()
+
+    assert start_rpc.calls == {}
+
+
+@pytest.mark.asyncio
+async def test_make_batch_request_hedged(start_rpc: Callable) -> None:
+
+    slow_url = await start_rpc(delay=2)
+    fast_url = await start_rpc()
+    pool = await build_pool(
+        urls=[slow_url, fast_url], hedge_reads=True, hedge_min_delay=0.05
+    )
+
+    try:
+        responses = await asyncio.wait_for(
+            pool.make_batch_request(
+                requests=[
+                    {
+                        "jsonrpc": "2.0",
+                        "id": 0,
+                        "method": "eth_getTransactionReceipt",
+                        "params": ["0x00"],
+                    }
+                ],
+                hedge=True,
+            ),
+            timeout=1,
+        )
+    finally:
+        await pool.session.close()
+
+    assert responses == [
+        {"jsonrpc": "2.0", "id": 0, "result": "eth_getTransactionReceipt"}
+    ]
+    assert start_rpc.calls == {slow_url: 1, fast_url: 1}
+
+
+@pytest.mark.asyncio
+async def test_endpoints_ranked_by_health(start_rpc: Callable) -> None:
+
+    slow_url = await start_rpc(delay=0.1)
+    fast_url = await start_rpc()
+    pool = await build_pool(urls=[slow_url, fast_url])
+
+    try:
+        pool.endpoints[0].record_success(latency=0.1)
+        pool.endpoints[1].record_success(latency=0.01)
+        assert pool.endpoint_uri == fast_url
+
+        pool.endpoints[1].record_error()
+        assert pool.endpoint_uri == slow_url
+
+        await pool.make_request("eth_blockNumber", [])
+    finally:
+        await pool.session.close()
+
+    assert start_rpc.calls == {slow_url: 1}
@@ -4,7 +4,15 @@ from databases import Database
 
 import tests.constants as constant
 from app.usecases.interfaces.repos.relays import IRelaysRepo
-from app.usecases.schemas.relays import Status, UpdateRepoAdapter
+from app.usecases.schemas.relays import (
+    CacheStatus,
+    GrpcStatus,
+    RelayErrors,
+    Status,
+    UpdateByIdRepoAdapter,
+    UpdateRepoAdapter,
+)
+from app.usecases.schemas.transactions import CreateRepoAdapter
 
 
 @pytest.mark.asyncio
@@ -36,3 +44,143 @@ async def test_update(
     assert test_relay["transaction_hash"] == constant.TEST_TRANSACTION_HASH
     assert test_relay["error"] is None
     assert test_relay["status"] == Status.SUCCESS
+
+
+@pytest.mark.asyncio
+async def test_update_many(
+    relays_repo: IRelaysRepo,
+    inserted_recent_transactions: None,
+    test_db: Database,
+) -> None:
+    """Test that many relays can be updated at once, keyed by relay ID"""
+
+    relay_ids = [
+        row["id"]
+        for row in await test_db.fetch_all(
+            "SELECT id FROM wh_relayer.relays ORDER BY id"
+        )
+    ]
+    assert len(relay_ids) == len(constant.TEST_MISSED_VAAS_CHAIN_IDS)
+
+    await relays_repo.update_many(
+        relays=[
+            UpdateByIdRepoAdapter(
+                relay_id=relay_id,
+                status=Status.PENDING,
+                transaction_hash=constant.TEST_TRANSACTION_HASH,
+                error=None,
+            )
+            for relay_id in relay_ids
+        ]
+    )
+    # A missing hash leaves the submitted one in place.
+    await relays_repo.update_many(
+        relays=[
+            UpdateByIdRepoAdapter(
+                relay_id=relay_ids[0],
+                status=Status.FAILED,
+                transaction_hash=None,
+                error=RelayErrors.STALE_PENDING,
+            )
+        ]
+    )
+
+    # Assertions
+    test_relays = await test_db.fetch_all("SELECT * FROM wh_relayer.relays ORDER BY id")
+
+    assert test_relays[0]["status"] == Status.FAILED
+    assert test_relays[0]["error"] == RelayErrors.STALE_PENDING
+    assert test_relays[0]["transaction_hash"] == constant.TEST_TRANSACTION_HASH
+    for test_relay in test_relays[1:]:
+        assert test_relay["status"] == Status.PENDING
+        assert test_relay["error"] is None
+        assert test_relay["transaction_hash"] == constant.TEST_TRANSACTION_HASH
+
+
+@pytest.mark.asyncio
+async def test_update_stale_pending(
+    relays_repo: IRelaysRepo,
+    pending_transactions: None,
+    test_db: Database,
+) -> None:
+    """Test that stale pending relays are updated and their keys returned"""
+
+    stale_relays = await relays_repo.update_stale_pending(
+        status=Status.FAILED, error=RelayErrors.STALE_PENDING
+    )
+
+    # Assertions
+    assert sorted(stale_relay.sequence for stale_relay in stale_relays) == [
+        constant.TEST_SEQUENCE + index for index in range(constant.DEFAULT_ITERATIONS)
+    ]
+    for stale_relay in stale_relays:
+        assert stale_relay.source_chain_id == constant.TEST_SOURCE_CHAIN_ID
+
+    test_relays = await test_db.fetch_all("SELECT * FROM wh_relayer.relays")
+
+    assert len(test_relays) == constant.DEFAULT_ITERATIONS
+    for test_relay in test_relays:
+        assert test_relay["status"] == Status.FAILED
+        assert test_relay["error"] == RelayErrors.STALE_PENDING
+
+    # Nothing is left to sweep on the next run.
+    assert not await relays_repo.update_stale_pending(
+        status=Status.FAILED, error=RelayErrors.STALE_PENDING
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_many(
+    relays_repo: IRelaysRepo,
+    inserted_transaction: None,
+    test_db: Database,
+) -> None:
+    """Test that many transactions and relays can be created at once, skipping known ones"""
+
+    sequences = [
+        constant.TEST_SEQUENCE + index for index in range(constant.DEFAULT_ITERATIONS)
+    ]
+
+    await relays_repo.create_many(
+        transactions=[
+            CreateRepoAdapter(
+                emitter_address=constant.TEST_EMITTER_ADDRESS,
+                from_address=constant.TEST_USER_ADDRESS,
+                to_address=constant.TEST_USER_ADDRESS,
+                source_chain_id=constant.TEST_SOURCE_CHAIN_ID,
+                dest_chain_id=constant.TEST_DESTINATION_CHAIN_ID,
+                amount=constant.TEST_AMOUNT,
+                sequence=sequence,
+                relay_error=RelayErrors.MISSED_VAA,
+                relay_status=Status.FAILED,
+                relay_message=constant.TEST_VAA,
+                relay_cache_status=CacheStatus.NEVER_CACHED,
+                relay_grpc_status=GrpcStatus.FAILED,
+            )
+            for sequence in sequences
+        ]
+    )
+
+    # Assertions
+    test_relays = await test_db.fetch_all(
+        """SELECT * FROM wh_relayer.transactions AS t JOIN wh_relayer.relays AS r ON t.id = r.transaction_id
+        ORDER BY t.sequence
+        """
+    )
+
+    assert [test_relay["sequence"] for test_relay in test_relays] == sequences
+    # The already inserted transaction is left as it was.
+    assert test_relays[0]["status"] == Status.PENDING
+    assert test_relays[0]["error"] is None
+    for test_relay in test_relays[1:]:
+        assert test_relay["emitter_address"] == constant.TEST_EMITTER_ADDRESS
+        assert test_relay["source_chain_id"] == constant.TEST_SOURCE_CHAIN_ID
+        assert test_relay["dest_chain_id"] == constant.TEST_DESTINATION_CHAIN_ID
+        assert test_relay["amount"] == constant.TEST_AMOUNT
+        assert test_relay["to_address"] == constant.TEST_USER_ADDRESS.lower()
+        assert test_relay["status"] == Status.FAILED
+        assert test_relay["error"] == RelayErrors.MISSED_VAA
+        assert test_relay["message"] == constant.TEST_VAA
+        assert test_relay["grpc_status"] == GrpcStatus.FAILED
+        assert test_relay["cache_status"] == CacheStatus.NEVER_CACHED
+        assert test_relay["transaction_hash"] is None
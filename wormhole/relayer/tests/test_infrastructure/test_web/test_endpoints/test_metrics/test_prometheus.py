@@ -0,0 +1,19 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_prometheus_metrics(test_client: AsyncClient) -> None:
+
+    endpoint = "/metrics"
+
+    response = await test_client.get(endpoint)
+
+    # Assertions
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    for metric in [
+        "relayer_redis_batch_size_count",
+        "relayer_redis_poll_seconds_count",
+    ]:
+        assert metric in response.text
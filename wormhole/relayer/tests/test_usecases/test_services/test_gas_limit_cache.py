@@ -0,0 +1,55 @@
+import time
+from math import ceil
+
+import pytest
+
+from app.usecases.interfaces.services.gas_limit_cache import IGasLimitCache
+from tests import constants as constant
+
+
+def with_margin(gas: int) -> int:
+    return ceil(gas * (1 + constant.TEST_GAS_LIMIT_SAFETY_MARGIN))
+
+
+@pytest.mark.asyncio
+async def test_gas_limit(gas_limit_cache: IGasLimitCache) -> None:
+    """Test that the gas limit is the largest recent observation plus the margin."""
+
+    # Nothing learned yet
+    assert gas_limit_cache.get_gas_limit() is None
+
+    gas_limit_cache.record_estimate(gas=constant.TEST_GAS_ESTIMATE)
+    assert gas_limit_cache.get_gas_limit() == with_margin(constant.TEST_GAS_ESTIMATE)
+
+    # Receipts raise the limit
+    gas_limit_cache.record_gas_used(gas_used=constant.TEST_GAS_ESTIMATE + 1)
+    assert gas_limit_cache.get_gas_limit() == with_margin(
+        constant.TEST_GAS_ESTIMATE + 1
+    )
+
+    # Observations older than the window are forgotten
+    for _ in range(constant.TEST_GAS_LIMIT_WINDOW):
+        gas_limit_cache.record_gas_used(gas_used=constant.TEST_GAS_ESTIMATE - 1)
+    assert gas_limit_cache.get_gas_limit() == with_margin(
+        constant.TEST_GAS_ESTIMATE - 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_gas_limit_expiry(
+    gas_limit_cache: IGasLimitCache, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the gas limit is re-estimated periodically and after a revert."""
+
+    gas_limit_cache.record_estimate(gas=constant.TEST_GAS_ESTIMATE)
+    gas_limit_cache.invalidate()
+    assert gas_limit_cache.get_gas_limit() is None
+
+    gas_limit_cache.record_estimate(gas=constant.TEST_GAS_ESTIMATE)
+    now = time.monotonic()
+    monkeypatch.setattr(
+        time,
+        "monotonic",
+        lambda: now + constant.TEST_GAS_LIMIT_ESTIMATE_FREQUENCY,
+    )
+    assert gas_limit_cache.get_gas_limit() is None
@@ -0,0 +1,62 @@
+import pytest
+
+from app.usecases.interfaces.services.nonce_manager import INonceManager
+from app.usecases.schemas.blockchain import BlockchainErrors
+from tests import constants as constant
+
+
+@pytest.mark.asyncio
+async def test_allocate(nonce_manager: INonceManager) -> None:
+    """Test that nonces are seeded from the chain once and then counted up locally."""
+
+    nonces = [await nonce_manager.allocate() for _ in range(3)]
+
+    assert nonces == [
+        constant.TEST_NONCE,
+        constant.TEST_NONCE + 1,
+        constant.TEST_NONCE + 2,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_release(nonce_manager: INonceManager) -> None:
+    """Test that an unused nonce is handed out again, and that re-seeding avoids gaps."""
+
+    first_nonce = await nonce_manager.allocate()
+    second_nonce = await nonce_manager.allocate()
+
+    # The most recently allocated nonce is reused
+    await nonce_manager.release(
+        nonce=second_nonce, error=constant.BLOCKCHAIN_CLIENT_ERROR_DETAIL
+    )
+    assert await nonce_manager.allocate() == second_nonce
+
+    # Releasing an earlier nonce would leave a gap; the count is re-seeded
+    await nonce_manager.release(
+        nonce=first_nonce, error=constant.BLOCKCHAIN_CLIENT_ERROR_DETAIL
+    )
+    assert await nonce_manager.allocate() == constant.TEST_NONCE
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [
+        BlockchainErrors.NONCE_TOO_LOW,
+        BlockchainErrors.REPLACEMENT_UNDERPRICED,
+        BlockchainErrors.BROADCAST_UNKNOWN,
+    ],
+)
+async def test_release_nonce_error(nonce_manager: INonceManager, error: str) -> None:
+    """Test that nonce errors from the node, or a broadcast that may have
+    reached it, cause a resync with the chain."""
+
+    for _ in range(3):
+        await nonce_manager.allocate()
+    last_nonce = await nonce_manager.allocate()
+
+    await nonce_manager.release(
+        nonce=last_nonce, error=f"{{'message': '{error.value}'}}"
+    )
+
+    assert await nonce_manager.allocate() == constant.TEST_NONCE
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+import tests.constants as constant
+from app.usecases.services.unique_set_codec import (
+    ENVELOPE_HEADER,
+    ENVELOPE_MAGIC,
+    ENVELOPE_VERSION,
+    decode_dest_chain_id,
+    decode_message,
+)
+
+TO_ADDRESS = int(constant.TEST_USER_ADDRESS, 16)
+
+
+def build_envelope() -> bytes:
+    """A member as published by the spy listener."""
+    from_address = bytes.fromhex(constant.TEST_USER_ADDRESS[2:])
+    return (
+        ENVELOPE_HEADER.pack(
+            ENVELOPE_MAGIC,
+            ENVELOPE_VERSION,
+            constant.TEST_DESTINATION_CHAIN_ID,
+            constant.TEST_SOURCE_CHAIN_ID,
+            constant.TEST_SEQUENCE,
+            int(constant.TEST_EMITTER_ADDRESS, 16).to_bytes(32, "big"),
+            TO_ADDRESS.to_bytes(32, "big"),
+            len(from_address),
+        )
+        + from_address
+        + constant.TEST_VAA_BYTES
+    )
+
+
+def build_json() -> bytes:
+    """A member as published before the envelope was introduced."""
+    return json.dumps(
+        {
+            "dest_chain_id": constant.TEST_DESTINATION_CHAIN_ID,
+            "to_address": TO_ADDRESS,
+            "from_address": constant.TEST_USER_ADDRESS.lower(),
+            "sequence": constant.TEST_SEQUENCE,
+            "emitter_chain": constant.TEST_SOURCE_CHAIN_ID,
+            "emitter_address": constant.TEST_EMITTER_ADDRESS,
+            "vaa_hex": constant.TEST_VAA,
+        }
+    ).encode()
+
+
+def test_decode_envelope_matches_json() -> None:
+    envelope = build_envelope()
+    legacy = build_json()
+
+    message = decode_message(member=envelope)
+
+    assert message == decode_message(member=legacy)
+    assert message.vaa == constant.TEST_VAA_BYTES
+    assert message.emitter_address == constant.TEST_EMITTER_ADDRESS
+    assert len(envelope) < len(legacy) / 2
+
+
+def test_decode_dest_chain_id() -> None:
+    assert (
+        decode_dest_chain_id(member=build_envelope())
+        == constant.TEST_DESTINATION_CHAIN_ID
+    )
+    assert (
+        decode_dest_chain_id(member=build_json()) == constant.TEST_DESTINATION_CHAIN_ID
+    )
+
+
+def test_decode_invalid() -> None:
+    unsupported = bytes([ENVELOPE_MAGIC, ENVELOPE_VERSION + 1]) + build_envelope()[2:]
+
+    for decode in (decode_message, decode_dest_chain_id):
+        with pytest.raises(ValueError):
+            decode(member=unsupported)
+        with pytest.raises(ValueError):
+            decode(member=bytes([ENVELOPE_MAGIC]))
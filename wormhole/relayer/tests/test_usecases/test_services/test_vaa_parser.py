@@ -0,0 +1,55 @@
+import hashlib
+
+import pytest
+
+import tests.constants as constant
+from app.usecases.schemas.vaa import ParsedPayload, ParsedVaa
+from app.usecases.services.vaa_parser import VaaPayload, VaaView, emitter_address_to_str
+
+
+def test_vaa_view() -> None:
+    vaa_view = VaaView(constant.TEST_VAA_BYTES)
+
+    assert vaa_view.version == 1
+    assert vaa_view.emitter_chain == constant.TEST_SOURCE_CHAIN_ID
+    assert vaa_view.emitter_address == constant.TEST_EMITTER_ADDRESS
+    assert vaa_view.sequence == constant.TEST_SEQUENCE
+    assert vaa_view.payload.from_address == constant.TEST_USER_ADDRESS.lower()
+    assert vaa_view.payload.to_address == int(constant.TEST_USER_ADDRESS, 16)
+    assert vaa_view.payload.dest_chain_id == constant.TEST_DESTINATION_CHAIN_ID
+    assert vaa_view.payload.amount == constant.TEST_AMOUNT
+    assert len(vaa_view.guardian_signatures) == vaa_view.number_of_signers
+    assert vaa_view.hash == hashlib.sha3_256(bytes(vaa_view.body)).digest()
+
+
+def test_vaa_view_to_parsed_vaa() -> None:
+    vaa_view = VaaView(constant.TEST_VAA_BYTES)
+
+    validated = vaa_view.to_parsed_vaa()
+    constructed = vaa_view.to_parsed_vaa(validate=False)
+
+    assert isinstance(validated, ParsedVaa)
+    assert isinstance(constructed, ParsedVaa)
+    assert validated == constructed
+
+
+def test_vaa_payload() -> None:
+    payload = VaaPayload(payload=memoryview(constant.TEST_VAA_PAYLOAD))
+
+    assert isinstance(payload.to_parsed_payload(), ParsedPayload)
+    assert payload.from_address == constant.TEST_USER_ADDRESS.lower()
+    assert payload.amount == constant.TEST_AMOUNT
+
+
+def test_vaa_payload_too_short() -> None:
+    with pytest.raises(ValueError):
+        VaaPayload(payload=memoryview(constant.TEST_VAA_PAYLOAD[:-32]))
+
+
+def test_emitter_address_to_str() -> None:
+    emitter_address = bytes(12) + bytes.fromhex("0abc" + "00" * 18)
+
+    assert emitter_address_to_str(emitter_address) == hex(
+        int(emitter_address.hex(), 16)
+    )
+    assert emitter_address_to_str(bytes(32)) == "0x0"
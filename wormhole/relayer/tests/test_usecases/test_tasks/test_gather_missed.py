@@ -3,6 +3,7 @@ from databases import Database
 
 import tests.constants as constant
 from app.settings import settings
+from app.usecases.interfaces.repos.relays import IRelaysRepo
 from app.usecases.interfaces.repos.tasks import ITasksRepo
 from app.usecases.interfaces.tasks.gather_missed import IGatherMissedVaasTask
 from app.usecases.schemas.relays import RelayErrors, Status
@@ -98,3 +99,55 @@ async def test_task(
             constant.TEST_USER_ADDRESS, 16
         )
         assert test_relay["transaction_hash"] is None
+
+
+@pytest.mark.asyncio
+async def test_task_chain_failure(  # pylint: disable = too-many-arguments
+    gather_missed_task: IGatherMissedVaasTask,
+    inserted_recent_transactions: None,  # pylint: disable = unused-argument
+    test_db: Database,
+    relays_repo: IRelaysRepo,
+    tasks_repo: ITasksRepo,
+    monkeypatch,
+) -> None:
+    """Test that a failed chain neither stops the others nor keeps the lock."""
+
+    get_latest_sequence = relays_repo.get_latest_sequence
+
+    async def failing_get_latest_sequence(emitter_address: str, source_chain_id: int):
+        if source_chain_id == constant.CELO_CHAIN_ID:
+            raise ConnectionError("Database unavailable.")
+        return await get_latest_sequence(
+            emitter_address=emitter_address, source_chain_id=source_chain_id
+        )
+
+    monkeypatch.setattr(
+        gather_missed_task.relays_repo,
+        "get_latest_sequence",
+        failing_get_latest_sequence,
+    )
+
+    # Act
+    settings.evm_wormhole_bridge = constant.TEST_EMITTER_ADDRESS
+    task = await tasks_repo.retrieve(task_name=TaskName.GATHER_MISSED)
+    assert await tasks_repo.create_lock(task_id=task.id)
+    await gather_missed_task.task(task_id=task.id)
+
+    # Assert that the lock was released
+    assert await tasks_repo.retrieve_all_locks() == []
+
+    # Assert that the other chain's missing VAAs are now tracked
+    for test_sequence in constant.TEST_MISSED_VAAS_POLYGON_SEQUENCES:
+        test_relay = await test_db.fetch_one(
+            """SELECT * FROM wh_relayer.transactions AS t JOIN wh_relayer.relays AS r ON t.id = r.transaction_id
+            WHERE t.emitter_address=:emitter_address AND t.source_chain_id=:source_chain_id AND t.sequence=:sequence
+            """,
+            {
+                "emitter_address": constant.TEST_EMITTER_ADDRESS,
+                "source_chain_id": constant.POLYGON_CHAIN_ID,
+                "sequence": test_sequence,
+            },
+        )
+
+        assert test_relay["status"] == Status.FAILED
+        assert test_relay["error"] == RelayErrors.MISSED_VAA
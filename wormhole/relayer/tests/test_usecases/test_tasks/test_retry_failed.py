@@ -1,8 +1,12 @@
+from typing import Mapping
+
 import pytest
 from databases import Database
 
 import tests.constants as constant
+from app.dependencies import CHAIN_ID_LOOKUP
 from app.usecases.interfaces.repos.tasks import ITasksRepo
+from app.usecases.interfaces.services.nonce_manager import INonceManager
 from app.usecases.interfaces.tasks.retry_failed import IRetryFailedTask
 from app.usecases.schemas.relays import RelayErrors, Status
 from app.usecases.schemas.tasks import TaskName
@@ -56,3 +60,63 @@ async def test_task(
     assert int(test_relay["to_address"], 16) == int(constant.TEST_USER_ADDRESS, 16)
     assert int(test_relay["from_address"], 16) == int(constant.TEST_USER_ADDRESS, 16)
     assert test_relay["transaction_hash"] == constant.TEST_TRANSACTION_HASH
+
+
+@pytest.mark.asyncio
+async def test_task_known_relays(
+    retry_failed_task: IRetryFailedTask,
+    test_db: Database,
+    failed_transactions: None,  # pylint: disable = unused-argument
+    nonce_managers: Mapping[int, INonceManager],
+    tasks_repo: ITasksRepo,
+) -> None:
+    """Test that known, failed relays to one chain are retried with consecutive nonces."""
+
+    task = await tasks_repo.retrieve(task_name=TaskName.RETRY_FAILED)
+    await retry_failed_task.task(task_id=task.id)
+
+    test_relays = await test_db.fetch_all("SELECT * FROM wh_relayer.relays")
+
+    assert len(test_relays) == constant.DEFAULT_ITERATIONS
+    for test_relay in test_relays:
+        assert test_relay["status"] == Status.PENDING
+        assert test_relay["error"] is None
+        assert test_relay["message"] == constant.TEST_VAA
+        assert test_relay["transaction_hash"] == constant.TEST_TRANSACTION_HASH
+
+    nonce_manager = nonce_managers[CHAIN_ID_LOOKUP[constant.TEST_DESTINATION_CHAIN_ID]]
+    assert await nonce_manager.allocate() == (
+        constant.TEST_NONCE + constant.DEFAULT_ITERATIONS
+    )
+
+
+@pytest.mark.asyncio
+async def test_task_broadcast_failure(
+    retry_failed_task_broadcast_failure: IRetryFailedTask,
+    test_db: Database,
+    failed_transactions: None,  # pylint: disable = unused-argument
+    nonce_managers: Mapping[int, INonceManager],
+    tasks_repo: ITasksRepo,
+) -> None:
+    """Test that relays broadcast behind a failed nonce keep their hash, that
+    the rest stay failed, and that the nonce count is then re-seeded."""
+
+    task = await tasks_repo.retrieve(task_name=TaskName.RETRY_FAILED)
+    await retry_failed_task_broadcast_failure.task(task_id=task.id)
+
+    test_relays = await test_db.fetch_all("SELECT * FROM wh_relayer.relays")
+
+    assert sorted(test_relay["status"] for test_relay in test_relays) == sorted(
+        [Status.PENDING] * 2 + [Status.FAILED] * (constant.DEFAULT_ITERATIONS - 2)
+    )
+    for test_relay in test_relays:
+        if test_relay["status"] == Status.FAILED:
+            assert test_relay["error"] == constant.BLOCKCHAIN_CLIENT_ERROR_DETAIL
+            assert test_relay["transaction_hash"] is None
+        else:
+            assert test_relay["transaction_hash"] == constant.TEST_TRANSACTION_HASH
+
+    # The failed nonce is below one already broadcast, so it is not handed out
+    # again directly; the count is re-seeded from the chain instead.
+    nonce_manager = nonce_managers[CHAIN_ID_LOOKUP[constant.TEST_DESTINATION_CHAIN_ID]]
+    assert nonce_manager.next_nonce is None
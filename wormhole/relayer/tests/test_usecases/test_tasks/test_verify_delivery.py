@@ -112,7 +112,7 @@ async def test_task_error(
     pending_transactions_with_tx_hash: None,  # pylint: disable = unused-argument
     tasks_repo: ITasksRepo,
 ) -> None:
-    """Test that the verify_delivery task correctly updates relays with a 'pending' status and a transaction hash."""
+    """Test that the verify_delivery task leaves relays whose transactions are not yet mined pending."""
 
     composite_ids = []
 
@@ -149,5 +149,5 @@ async def test_task_error(
             },
         )
 
-        assert test_tx["status"] == Status.FAILED
-        assert test_tx["error"] == BlockchainErrors.TX_HASH_NOT_IN_CHAIN
+        assert test_tx["status"] == Status.PENDING
+        assert test_tx["error"] is None
@@ -4,7 +4,7 @@ various classes and utility funtions."""
 from .logger import logger
 from .event_loop import get_event_loop
 from .client_session import get_client_session
-from .repos import get_transactions_repo, get_relays_repo
+from .repos import get_transactions_repo, get_cached_transactions_repo, get_relays_repo
 from .redis import get_redis_client
-from .services import get_vaa_manager
+from .services import get_vaa_manager, get_vaa_worker_pool
 from .stream_client import get_stream_client
@@ -4,10 +4,25 @@ from app.infrastructure.db.repos.transactions import TransactionsRepo
 from app.usecases.interfaces.repos.relays import IRelaysRepo
 from app.usecases.interfaces.repos.transactions import ITransactionsRepo
 
+cached_transactions_repo = None
+
 
 async def get_transactions_repo() -> ITransactionsRepo:
     return TransactionsRepo(db=await get_or_create_database())
 
 
+async def get_cached_transactions_repo() -> ITransactionsRepo:
+    """Transactions repo for VAA ingestion; caches each emitter's latest sequence."""
+    global cached_transactions_repo  # pylint: disable = global-statement
+
+    if cached_transactions_repo is None:
+        cached_transactions_repo = TransactionsRepo(
+            db=await get_or_create_database(), cache_latest_sequences=True
+        )
+        await cached_transactions_repo.warm_latest_sequences()
+
+    return cached_transactions_repo
+
+
 async def get_relays_repo() -> IRelaysRepo:
     return RelaysRepo(db=await get_or_create_database())
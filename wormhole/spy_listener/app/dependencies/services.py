@@ -1,14 +1,46 @@
-from app.dependencies import get_redis_client, get_transactions_repo, logger
+from app.dependencies import get_cached_transactions_repo, get_redis_client, logger
+from app.settings import settings
 from app.usecases.interfaces.services.vaa_manager import IVaaManager
+from app.usecases.interfaces.services.vaa_worker_pool import IVaaWorkerPool
+from app.usecases.services.recent_vaas import RecentVaas
 from app.usecases.services.vaa_manager import VaaManager
+from app.usecases.services.vaa_worker_pool import VaaWorkerPool
+
+vaa_manager = None
+vaa_worker_pool = None
 
 
 async def get_vaa_manager() -> IVaaManager:
     """Instantiates and returns the VAA Manager Service."""
+    global vaa_manager  # pylint: disable = global-statement
+
+    if vaa_manager is None:
+        transaction_repo = await get_cached_transactions_repo()
+        unique_set_client = await get_redis_client()
+        vaa_manager = VaaManager(
+            transactions_repo=transaction_repo,
+            unique_set=unique_set_client,
+            logger=logger,
+            recent_vaas=RecentVaas(
+                capacity=settings.recent_vaas_capacity, ttl=settings.recent_vaas_ttl
+            ),
+        )
+
+    return vaa_manager
+
+
+async def get_vaa_worker_pool() -> IVaaWorkerPool:
+    """Instantiates and returns the VAA Worker Pool."""
+    global vaa_worker_pool  # pylint: disable = global-statement
 
-    transaction_repo = await get_transactions_repo()
-    unique_set_client = await get_redis_client()
+    if vaa_worker_pool is None:
+        vaa_manager_service = await get_vaa_manager()
+        vaa_worker_pool = VaaWorkerPool(
+            vaa_manager=vaa_manager_service,
+            logger=logger,
+            workers=settings.vaa_workers,
+            queue_size=settings.vaa_queue_size,
+            queue_full_policy=settings.vaa_queue_full_policy,
+        )
 
-    return VaaManager(
-        transactions_repo=transaction_repo, unique_set=unique_set_client, logger=logger
-    )
+    return vaa_worker_pool
@@ -1,4 +1,4 @@
-from app.dependencies import get_vaa_manager
+from app.dependencies import get_vaa_worker_pool
 from app.infrastructure.clients.streams.spy_listen import StreamClient
 from app.usecases.interfaces.clients.grpc.spy_listen import IStreamClient
 
@@ -6,6 +6,6 @@ from app.usecases.interfaces.clients.grpc.spy_listen import IStreamClient
 async def get_stream_client() -> IStreamClient:
     """Instantiate and return Stream client."""
 
-    vaa_manager = await get_vaa_manager()
+    vaa_worker_pool = await get_vaa_worker_pool()
 
-    return StreamClient(vaa_manager=vaa_manager)
+    return StreamClient(vaa_worker_pool=vaa_worker_pool)
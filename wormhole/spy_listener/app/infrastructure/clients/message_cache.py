@@ -0,0 +1,228 @@
+import mmap
+import os
+import struct
+import zlib
+from collections import deque
+from itertools import islice
+from typing import Deque, Iterator, List, Optional, Tuple
+
+from app.usecases.schemas.unique_set import UniqueSetMessage
+from app.usecases.services.unique_set_codec import decode_message, encode_message
+
+# length (4) | crc32 (4)
+RECORD_HEADER = struct.Struct(">II")
+# committed offset (8)
+CHECKPOINT = struct.Struct(">Q")
+CHECKPOINT_FILE = "checkpoint"
+SEGMENT_SUFFIX = ".log"
+
+
+class SegmentLog:
+    """Append-only record log split across fixed-size memory-mapped segment files.
+
+    A record's offset is its byte position across all segments; a segment's file
+    name is the offset of its first byte. Records never straddle segments, and
+    everything below the committed offset, which is checkpointed to disk, has
+    been consumed.
+    """
+
+    def __init__(self, directory: str, segment_size: int) -> None:
+        self.directory = directory
+        self.segment_size = segment_size
+        self.segments: List[Tuple[int, mmap.mmap]] = []
+        os.makedirs(directory, exist_ok=True)
+
+        self.committed_offset = self.__read_checkpoint()
+        for base in sorted(
+            int(name[: -len(SEGMENT_SUFFIX)])
+            for name in os.listdir(directory)
+            if name.endswith(SEGMENT_SUFFIX)
+        ):
+            if base + segment_size <= self.committed_offset:
+                os.remove(self.__segment_path(base))
+            else:
+                self.segments.append((base, self.__map_segment(base)))
+
+        # Records past a torn or corrupt write are not recoverable; appending
+        # resumes where the last valid record ends, over zeroed space.
+        self.write_offset = max(
+            self.committed_offset,
+            self.segments[0][0] if self.segments else 0,
+        )
+        for next_offset, _ in self.read(offset=self.write_offset):
+            self.write_offset = next_offset
+        self.__truncate(offset=self.write_offset)
+
+    def __segment_path(self, base: int) -> str:
+        return os.path.join(self.directory, f"{base:020d}{SEGMENT_SUFFIX}")
+
+    def __map_segment(self, base: int) -> mmap.mmap:
+        with open(self.__segment_path(base), "a+b") as segment_file:
+            segment_file.truncate(self.segment_size)
+            return mmap.mmap(segment_file.fileno(), self.segment_size)
+
+    def __read_checkpoint(self) -> int:
+        try:
+            with open(os.path.join(self.directory, CHECKPOINT_FILE), "rb") as file:
+                return CHECKPOINT.unpack(file.read(CHECKPOINT.size))[0]
+        except (FileNotFoundError, struct.error):
+            return 0
+
+    def __truncate(self, offset: int) -> None:
+        while self.segments and self.segments[-1][0] > offset:
+            base, segment = self.segments.pop()
+            segment.close()
+            os.remove(self.__segment_path(base))
+        if self.segments:
+            position = offset - self.segments[-1][0]
+            self.segments[-1][1][position:] = bytes(self.segment_size - position)
+
+    def __segment_for(self, offset: int) -> Optional[mmap.mmap]:
+        for base, segment in self.segments:
+            if base <= offset < base + self.segment_size:
+                return segment
+        return None
+
+    def append(self, record: bytes) -> int:
+        """Appends record and returns the offset just past it."""
+        size = RECORD_HEADER.size + len(record)
+        if size > self.segment_size:
+            raise ValueError("Record does not fit in a log segment.")
+
+        # A new segment is opened once the last one is full, or too full to
+        # hold the record.
+        if (
+            not self.segments
+            or self.write_offset + size > self.segments[-1][0] + self.segment_size
+        ):
+            base = (
+                self.segments[-1][0] + self.segment_size
+                if self.segments
+                else self.write_offset - self.write_offset % self.segment_size
+            )
+            self.segments.append((base, self.__map_segment(base)))
+            self.write_offset = base
+
+        base, segment = self.segments[-1]
+        position = self.write_offset - base
+        segment[position + RECORD_HEADER.size : position + size] = record
+        # The header is written last so that a torn write never looks valid.
+        RECORD_HEADER.pack_into(segment, position, len(record), zlib.crc32(record))
+        self.write_offset += size
+        return self.write_offset
+
+    def read(self, offset: int) -> Iterator[Tuple[int, bytes]]:
+        """Yields (offset past record, record) for valid records from offset on."""
+        while True:
+            segment = self.__segment_for(offset)
+            if segment is None:
+                return
+            position = offset % self.segment_size
+            length, crc = (
+                RECORD_HEADER.unpack_from(segment, position)
+                if position + RECORD_HEADER.size <= self.segment_size
+                else (0, 0)
+            )
+            start = position + RECORD_HEADER.size
+            if length == 0 or start + length > self.segment_size:
+                # End of this segment's records; continue in the next one.
+                next_base = offset - position + self.segment_size
+                if self.__segment_for(next_base) is None:
+                    return
+                offset = next_base
+                continue
+            record = segment[start : start + length]
+            if zlib.crc32(record) != crc:
+                return
+            offset += RECORD_HEADER.size + length
+            yield offset, record
+
+    def sync(self) -> None:
+        """Flushes appended records to disk."""
+        for _, segment in self.segments:
+            segment.flush()
+
+    def commit(self, offset: int) -> None:
+        """Durably marks everything below offset as consumed."""
+        self.committed_offset = offset
+        self.sync()
+
+        checkpoint_path = os.path.join(self.directory, CHECKPOINT_FILE)
+        with open(f"{checkpoint_path}.tmp", "wb") as file:
+            file.write(CHECKPOINT.pack(offset))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(f"{checkpoint_path}.tmp", checkpoint_path)
+
+        while self.segments and (
+            self.segments[0][0] + self.segment_size <= offset and len(self.segments) > 1
+        ):
+            base, segment = self.segments.pop(0)
+            segment.close()
+            os.remove(self.__segment_path(base))
+
+    def close(self) -> None:
+        self.sync()
+        for _, segment in self.segments:
+            segment.close()
+        self.segments = []
+
+
+class MessageCache:
+    """Durable FIFO of unique-set messages that could not be published.
+
+    Every message is appended to a segment log on disk; the oldest pending
+    messages are also kept, decoded, in a bounded in-memory ring. Messages that
+    do not fit in the ring stay on disk until the ring drains. Removing from the
+    front only advances the log's committed offset.
+    """
+
+    def __init__(self, directory: str, ring_size: int, segment_size: int) -> None:
+        self.log = SegmentLog(directory=directory, segment_size=segment_size)
+        # (offset past the message in the log, message)
+        self.ring: Deque[Tuple[int, UniqueSetMessage]] = deque()
+        self.ring_size = ring_size
+        # Offset of the first pending message that is not in the ring.
+        self.unread_offset = self.log.committed_offset
+        self.size = sum(1 for _ in self.log.read(offset=self.log.committed_offset))
+        self.__fill_ring()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __fill_ring(self) -> None:
+        if self.unread_offset >= self.log.write_offset:
+            return
+        for next_offset, record in self.log.read(offset=self.unread_offset):
+            if len(self.ring) >= self.ring_size:
+                return
+            self.ring.append((next_offset, decode_message(member=record)))
+            self.unread_offset = next_offset
+
+    def extend(self, messages: List[UniqueSetMessage]) -> None:
+        """Durably appends messages to the back of the cache."""
+        for message in messages:
+            on_disk_only = self.unread_offset != self.log.write_offset
+            next_offset = self.log.append(encode_message(message=message))
+            self.size += 1
+            if not on_disk_only and len(self.ring) < self.ring_size:
+                self.ring.append((next_offset, message))
+                self.unread_offset = next_offset
+        self.log.sync()
+
+    def peek(self, count: int) -> List[UniqueSetMessage]:
+        """Returns up to count messages from the front of the cache."""
+        self.__fill_ring()
+        return [message for _, message in islice(self.ring, count)]
+
+    def remove(self, count: int) -> None:
+        """Removes count messages from the front of the cache."""
+        next_offset = None
+        for _ in range(min(count, len(self.ring))):
+            next_offset, _ = self.ring.popleft()
+            self.size -= 1
+        if next_offset is not None:
+            self.log.commit(offset=next_offset)
+
+    def close(self) -> None:
+        self.log.close()
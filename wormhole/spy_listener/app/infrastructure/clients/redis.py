@@ -1,18 +1,34 @@
 import asyncio
-import json
 from asyncio import AbstractEventLoop
 from datetime import datetime, timezone
 from logging import Logger
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import aioredis
 from aioredis import Redis, exceptions
 
+from app import metrics
+from app.infrastructure.clients.message_cache import MessageCache
 from app.settings import settings
 from app.usecases.interfaces.clients.unique_set import IUniqueSetClient
 from app.usecases.interfaces.repos.relays import IRelaysRepo
 from app.usecases.schemas.relays import CacheStatus, Status, UpdateRepoAdapter
-from app.usecases.schemas.unique_set import UniqueSetError, UniqueSetMessage
+from app.usecases.schemas.unique_set import (
+    UniqueSetError,
+    UniqueSetMessage,
+    UniqueSetTransport,
+)
+from app.usecases.services.unique_set_codec import encode_message
+
+# Adds a message to the stream only if it is not already a recent member.
+STREAM_PUBLISH_SCRIPT = """
+redis.call("zremrangebyscore", KEYS[2], "-inf", ARGV[2] - ARGV[3])
+local added = redis.call("zadd", KEYS[2], "NX", ARGV[2], ARGV[1])
+if added == 1 then
+    redis.call("xadd", KEYS[1], "MAXLEN", "~", ARGV[4], "*", "message", ARGV[1])
+end
+return added
+"""
 
 
 class RedisClient(IUniqueSetClient):
@@ -22,16 +38,36 @@ class RedisClient(IUniqueSetClient):
         self, logger: Logger, loop: AbstractEventLoop, relays_repo: IRelaysRepo
     ) -> None:
         self.logger = logger
+        self.loop = loop
         self.relays_repo = relays_repo
         self.redis: Optional[Redis] = None
-        self.message_cache: List[UniqueSetMessage] = []
-        loop.create_task(self.__manage_connection())
-        loop.create_task(self.__process_message_cache())
+        self.stream_publish_sha: Optional[str] = None
+        self.message_cache = MessageCache(
+            directory=settings.redis_message_cache_dir,
+            ring_size=settings.redis_message_cache_ring_size,
+            segment_size=settings.redis_message_cache_segment_size,
+        )
+        metrics.MESSAGE_CACHE_SIZE.set_function(lambda: len(self.message_cache))
+        if len(self.message_cache):
+            self.logger.info(
+                "[RedisClient]: Recovered %s cached message(s) from disk.",
+                len(self.message_cache),
+            )
+        self.publish_batch: List[Tuple[UniqueSetMessage, asyncio.Future]] = []
+        self.publish_flush_handle: Optional[asyncio.TimerHandle] = None
+        self.tasks = [
+            loop.create_task(self.__manage_connection()),
+            loop.create_task(self.__process_message_cache()),
+        ]
 
     async def __connect(self) -> Redis:
         self.redis = await aioredis.from_url(settings.redis_url, encoding="utf-8")
         if await self.redis.ping():
             self.logger.info("[RedisClient]: Connection established.")
+        if settings.redis_transport == UniqueSetTransport.STREAM:
+            self.stream_publish_sha = await self.redis.script_load(
+                STREAM_PUBLISH_SCRIPT
+            )
 
     async def __manage_connection(self) -> None:
         while True:
@@ -48,87 +84,189 @@ class RedisClient(IUniqueSetClient):
 
     async def __process_message_cache(self) -> None:
         while True:
-            rescued_messages = []
-            failed_rescues = []
-            if self.message_cache and self.redis:
-                for message in self.message_cache:
+            if len(self.message_cache) and self.redis:
+                rescued_messages = 0
+                failed_rescues = 0
+                while len(self.message_cache):
+                    messages = self.message_cache.peek(
+                        count=settings.redis_publish_batch_size
+                    )
                     try:
-                        await self.publish(message=message)
+                        await self.__add(messages=messages)
                     except UniqueSetError:
-                        failed_rescues.append(message)
-                    else:
-                        rescued_messages.append(message)
-
-                        await self.relays_repo.update(
-                            relay=UpdateRepoAdapter(
-                                emitter_address=message.emitter_address,
-                                source_chain_id=message.emitter_chain,
-                                sequence=message.sequence,
-                                status=Status.PENDING,
-                                error=None,
-                                cache_status=CacheStatus.PREVIOUSLY_CACHED,
-                            )
+                        failed_rescues = len(self.message_cache)
+                        break
+
+                    try:
+                        await self.relays_repo.update_many(
+                            relays=[
+                                UpdateRepoAdapter(
+                                    emitter_address=message.emitter_address,
+                                    source_chain_id=message.emitter_chain,
+                                    sequence=message.sequence,
+                                    status=Status.PENDING,
+                                    error=None,
+                                    cache_status=CacheStatus.PREVIOUSLY_CACHED,
+                                )
+                                for message in messages
+                            ]
+                        )
+                    except Exception as e:  # pylint: disable = broad-except
+                        # Still cached, so retried on the next pass.
+                        self.logger.error(
+                            "[RedisClient]: Failed to update cached messages' relays; retrying next pass.\n\nError: %s",
+                            str(e),
                         )
+                        failed_rescues = len(self.message_cache)
+                        break
 
-                for message in rescued_messages:
-                    self.message_cache = [m for m in self.message_cache if m != message]
+                    # Removed only once handled, so a crash replays rather than loses.
+                    self.message_cache.remove(count=len(messages))
+                    rescued_messages += len(messages)
 
                 self.logger.info(
                     "[RedisClient]: Cached message results: %s succeeded, %s failed.",
-                    len(rescued_messages),
-                    len(failed_rescues),
+                    rescued_messages,
+                    failed_rescues,
                 )
 
-                rescued_messages, failed_rescues = [], []
-
             await asyncio.sleep(settings.redis_in_memory_cache_periodicity)
 
-    async def publish(self, message: UniqueSetMessage) -> int:
-        """Publishes message to unique set."""
-        set_message = json.dumps(message.dict()).encode()
-        current_date = datetime.now(timezone.utc)
-        current_time = current_date.timestamp()
-        if self.redis:
-            try:
-                result = await self.redis.zadd(
-                    settings.redis_zset, {set_message: current_time}
-                )
-            except exceptions.ConnectionError as e:
-                self.logger.error(
-                    "[RedisClient]: Connection error; message not published; attempting reconnect..."
-                )
-                self.message_cache.append(message)
-                raise UniqueSetError(detail=str(e)) from e
-            except exceptions.RedisError as e:
-                self.logger.error(
-                    "[RedisClient]: Unexpected error; message not published.\n\nError: %s",
-                    str(e),
-                )
-                self.message_cache.append(message)
-                raise UniqueSetError(detail=str(e)) from e
+    async def __add(self, messages: List[UniqueSetMessage]) -> List[int]:
+        """Adds messages to the unique set in a single round trip.
+
+        One ZADD (or, with the stream transport, one publish script call) per
+        member is pipelined, rather than a single multi-member ZADD, so that the
+        added/not-added result of every member is kept.
+        """
+        if not self.redis:
+            raise UniqueSetError(detail="Redis is not connected.")
+
+        current_time = datetime.now(timezone.utc).timestamp()
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for message in messages:
+                    member = encode_message(
+                        message=message, member_format=settings.redis_member_format
+                    )
+                    if settings.redis_transport == UniqueSetTransport.STREAM:
+                        pipe.evalsha(
+                            self.stream_publish_sha,
+                            2,
+                            settings.redis_stream,
+                            settings.redis_stream_members,
+                            member,
+                            current_time,
+                            settings.redis_stream_member_ttl,
+                            settings.redis_stream_max_length,
+                        )
+                    else:
+                        pipe.zadd(settings.redis_zset, {member: current_time})
+                return await pipe.execute()
+        except exceptions.NoScriptError as e:
+            # The server lost its scripts, e.g. after a failover; reload for next time.
+            self.logger.error(
+                "[RedisClient]: Publish script missing; %s message(s) not published.",
+                len(messages),
+            )
+            self.stream_publish_sha = await self.redis.script_load(
+                STREAM_PUBLISH_SCRIPT
+            )
+            raise UniqueSetError(detail=str(e)) from e
+        except exceptions.ConnectionError as e:
+            self.logger.error(
+                "[RedisClient]: Connection error; %s message(s) not published; attempting reconnect...",
+                len(messages),
+            )
+            raise UniqueSetError(detail=str(e)) from e
+        except exceptions.RedisError as e:
+            self.logger.error(
+                "[RedisClient]: Unexpected error; %s message(s) not published.\n\nError: %s",
+                len(messages),
+                str(e),
+            )
+            raise UniqueSetError(detail=str(e)) from e
+
+    def __flush_publish_batch(self) -> None:
+        if self.publish_flush_handle:
+            self.publish_flush_handle.cancel()
+            self.publish_flush_handle = None
+        batch, self.publish_batch = self.publish_batch, []
+        if batch:
+            self.loop.create_task(self.__publish_batch(batch=batch))
+
+    async def __publish_batch(
+        self, batch: List[Tuple[UniqueSetMessage, asyncio.Future]]
+    ) -> None:
+        """Publishes a batch, failing every caller still waiting if it raises."""
+        try:
+            await self.__send_batch(batch=batch)
+        except Exception as e:  # pylint: disable = broad-except
+            self.logger.exception(e)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def __send_batch(
+        self, batch: List[Tuple[UniqueSetMessage, asyncio.Future]]
+    ) -> None:
+        messages = [message for message, _ in batch]
+        metrics.REDIS_PUBLISH_BATCH_SIZE.observe(len(messages))
+        try:
+            results = await self.__add(messages=messages)
+        except UniqueSetError as e:
+            self.message_cache.extend(messages)
+            metrics.CACHED_MESSAGES.inc(len(messages))
+            self.logger.error(
+                "[RedisClient]: %s message(s) cached; emitter chain/sequence: %s",
+                len(messages),
+                ", ".join(f"{m.emitter_chain}/{m.sequence}" for m in messages),
+            )
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(UniqueSetError(detail=e.detail))
+            return
+
+        published = 0
+        for (message, future), result in zip(batch, results):
             if result == 1:
-                self.logger.info(
-                    "[RedisClient]: Message published; emitter chain: %s, sequence: %s",
-                    message.emitter_chain,
-                    message.sequence,
-                )
+                published += 1
             else:
                 self.logger.info(
                     "[RedisClient]: Publish attempted - result not 1; emitter chain: %s, sequence: %s",
                     message.emitter_chain,
                     message.sequence,
                 )
-            return result
-        self.message_cache.append(message)
-        self.logger.error(
-            "[RedisClient]: Message cached; emitter chain: %s, sequence: %s",
-            message.emitter_chain,
-            message.sequence,
+            if not future.done():
+                future.set_result(result)
+
+        self.logger.info(
+            "[RedisClient]: %s of %s message(s) published.", published, len(batch)
         )
-        raise UniqueSetError(detail="Redis is not connected.")
+
+    async def publish(self, message: UniqueSetMessage) -> int:
+        """Publishes message to unique set.
+
+        Messages published within the same window are sent to Redis together;
+        each caller still receives the result for its own message.
+        """
+        future = self.loop.create_future()
+        self.publish_batch.append((message, future))
+        if len(self.publish_batch) >= settings.redis_publish_batch_size:
+            self.__flush_publish_batch()
+        elif self.publish_flush_handle is None:
+            self.publish_flush_handle = self.loop.call_later(
+                settings.redis_publish_batch_window_ms / 1000,
+                self.__flush_publish_batch,
+            )
+        return await future
 
     async def close_connection(self) -> None:
-        """Closes external connection."""
+        """Closes external connection and stops the background tasks."""
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.message_cache.close()
         if self.redis:
             await self.redis.close()
             self.redis = None
@@ -6,19 +6,21 @@ from typing import List
 
 import grpc
 
+from app import metrics
 from app.dependencies import logger
 from app.infrastructure.clients.streams.grpc.spy.v1 import spy_pb2, spy_pb2_grpc
 from app.settings import settings
 from app.usecases.interfaces.clients.grpc.spy_listen import IStreamClient
-from app.usecases.interfaces.services.vaa_manager import IVaaManager
+from app.usecases.interfaces.services.vaa_worker_pool import IVaaWorkerPool
 
 
 class StreamClient(IStreamClient):
-    def __init__(self, vaa_manager: IVaaManager):
-        self.vaa_manager = vaa_manager
+    def __init__(self, vaa_worker_pool: IVaaWorkerPool):
+        self.vaa_worker_pool = vaa_worker_pool
 
     async def start(self, loop: AbstractEventLoop) -> None:
         """Starts GRPC connection."""
+        await self.vaa_worker_pool.start(loop=loop)
         loop.create_task(self.connect())
 
     async def connect(self) -> None:
@@ -42,13 +44,14 @@ class StreamClient(IStreamClient):
                     )
 
                     async for response in stub.SubscribeSignedVAA(request):
-                        await self.vaa_manager.process(vaa=response.vaa_bytes)
+                        await self.vaa_worker_pool.submit(vaa=response.vaa_bytes)
 
             except grpc.aio.AioRpcError as e:
                 logger.error(
                     "[StreamClient]: Connection dropped.\nError: %s\n\nAttempting to reconnect...",
                     str(e),
                 )
+                metrics.STREAM_RECONNECTS.inc()
                 await asyncio.sleep(settings.reconnect_wait_time)
 
     def __get_filters(self) -> List[spy_pb2.FilterEntry]:
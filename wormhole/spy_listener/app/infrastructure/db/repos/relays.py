@@ -1,11 +1,16 @@
+from typing import List
+
 from databases import Database
-from sqlalchemy import and_
+from sqlalchemy import BigInteger, Integer, String, Text, and_, cast, column, values
 
 from app.infrastructure.db.models.relays import RELAYS
 from app.infrastructure.db.models.transactions import TRANSACTIONS
 from app.usecases.interfaces.repos.relays import IRelaysRepo
 from app.usecases.schemas.relays import UpdateRepoAdapter
 
+# asyncpg allows at most 32767 bind parameters per statement; six per relay.
+MAX_RELAYS_PER_UPDATE = 5000
+
 
 class RelaysRepo(IRelaysRepo):
     def __init__(self, db: Database):
@@ -30,3 +35,55 @@ class RelaysRepo(IRelaysRepo):
         )
 
         await self.db.execute(update_statement)
+
+    async def update_many(self, relays: List[UpdateRepoAdapter]) -> None:
+        """Update many relay objects with one statement per 5000 relays."""
+
+        for i in range(0, len(relays), MAX_RELAYS_PER_UPDATE):
+            await self.db.execute(
+                self.__update_many_statement(
+                    relays=relays[i : i + MAX_RELAYS_PER_UPDATE]
+                )
+            )
+
+    def __update_many_statement(self, relays: List[UpdateRepoAdapter]):
+        columns = [
+            column("emitter_address", String),
+            column("source_chain_id", Integer),
+            column("sequence", BigInteger),
+            column("status", String),
+            column("error", Text),
+            column("cache_status", String),
+        ]
+
+        # Every value is cast so that Postgres can type the VALUES columns.
+        updates = values(*columns, name="updates").data(
+            [
+                (
+                    cast(relay.emitter_address.lower(), String),
+                    cast(relay.source_chain_id, Integer),
+                    cast(relay.sequence, BigInteger),
+                    cast(relay.status, String),
+                    cast(relay.error, Text),
+                    cast(relay.cache_status, String),
+                )
+                for relay in relays
+            ]
+        )
+
+        return (
+            RELAYS.update()
+            .values(
+                status=updates.c.status,
+                error=updates.c.error,
+                cache_status=updates.c.cache_status,
+            )
+            .where(
+                and_(
+                    TRANSACTIONS.c.emitter_address == updates.c.emitter_address,
+                    TRANSACTIONS.c.source_chain_id == updates.c.source_chain_id,
+                    TRANSACTIONS.c.sequence == updates.c.sequence,
+                    RELAYS.c.transaction_id == TRANSACTIONS.c.id,
+                )
+            )
+        )
@@ -1,9 +1,11 @@
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from databases import Database
-from sqlalchemy import and_, select
+from sqlalchemy import BigInteger, Integer, String, Text, and_, cast, func, select
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql.expression import Executable
 
+from app import metrics
 from app.infrastructure.db.models.relays import RELAYS
 from app.infrastructure.db.models.transactions import TRANSACTIONS
 from app.usecases.interfaces.repos.transactions import ITransactionsRepo
@@ -16,55 +18,84 @@ from app.usecases.schemas.transactions import (
 
 
 class TransactionsRepo(ITransactionsRepo):
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, cache_latest_sequences: bool = False):
         self.db = db
+        # (emitter_address, source_chain_id) -> highest stored sequence
+        self.latest_sequences: Optional[Dict[Tuple[str, int], int]] = (
+            {} if cache_latest_sequences else None
+        )
 
-    async def create(self, transaction: CreateRepoAdapter) -> TransactionsJoinRelays:
-        """Inserts and returns new transaction object."""
-        most_recent_record = await self.get_latest_sequence(
-            emitter_address=transaction.emitter_address,
-            source_chain_id=transaction.source_chain_id,
+    async def create(
+        self, transaction: CreateRepoAdapter, return_result: bool = True
+    ) -> Optional[TransactionsJoinRelays]:
+        """Inserts and returns new transaction object.
+
+        With return_result=False nothing is read back and None is returned.
+        """
+        emitter_key = (transaction.emitter_address.lower(), transaction.source_chain_id)
+        if self.latest_sequences is not None and emitter_key in self.latest_sequences:
+            latest_sequence = self.latest_sequences[emitter_key]
+        else:
+            most_recent_record = await self.get_latest_sequence(
+                emitter_address=transaction.emitter_address,
+                source_chain_id=transaction.source_chain_id,
+            )
+            latest_sequence = (
+                most_recent_record.sequence if most_recent_record is not None else None
+            )
+
+        upsert_statement = self.__upsert_statement(
+            transaction=transaction, return_result=return_result
         )
 
-        if most_recent_record is not None:
-            if most_recent_record.sequence != transaction.sequence - 1:
-                sequence_to_insert = most_recent_record.sequence + 1
-                while sequence_to_insert < transaction.sequence:
-                    insert_statement = (
-                        insert(TRANSACTIONS)
-                        .values(
-                            emitter_address=transaction.emitter_address.lower(),
-                            from_address=None,
-                            to_address=None,
-                            source_chain_id=transaction.source_chain_id,
-                            dest_chain_id=None,
-                            amount=None,
-                            sequence=sequence_to_insert,
-                        )
-                        .on_conflict_do_nothing()
-                    )
-
-                    async with self.db.transaction():
-                        transaction_id = await self.db.execute(insert_statement)
-
-                        insert_statement = (
-                            insert(RELAYS)
-                            .values(
-                                transaction_id=transaction_id,
-                                status=Status.FAILED,
-                                error=RelayErrors.MISSED_VAA,
-                                message=None,
-                                transaction_hash=None,
-                                grpc_status=GrpcStatus.FAILED,
-                                cache_status=CacheStatus.NEVER_CACHED,
-                            )
-                            .on_conflict_do_nothing()
-                        )
-
-                        if transaction_id:
-                            await self.db.execute(insert_statement)
-                    sequence_to_insert += 1
+        if latest_sequence is not None and latest_sequence < transaction.sequence - 1:
+            async with self.db.transaction():
+                filled_sequences = await self.__fill_gap(
+                    emitter_address=transaction.emitter_address,
+                    source_chain_id=transaction.source_chain_id,
+                    first_sequence=latest_sequence + 1,
+                    last_sequence=transaction.sequence - 1,
+                )
+                result = await self.__execute_upsert(
+                    upsert_statement=upsert_statement, return_result=return_result
+                )
+            metrics.GAP_SEQUENCES_FILLED.inc(filled_sequences)
+        else:
+            # A single statement is atomic; no explicit DB transaction needed.
+            result = await self.__execute_upsert(
+                upsert_statement=upsert_statement, return_result=return_result
+            )
+
+        if self.latest_sequences is not None:
+            self.latest_sequences[emitter_key] = (
+                transaction.sequence
+                if latest_sequence is None
+                else max(latest_sequence, transaction.sequence)
+            )
+
+        return result
+
+    async def __execute_upsert(
+        self, upsert_statement: Executable, return_result: bool
+    ) -> Optional[TransactionsJoinRelays]:
+        if not return_result:
+            await self.db.execute(upsert_statement)
+            return None
 
+        result = await self.db.fetch_one(upsert_statement)
+
+        return TransactionsJoinRelays(**result)
+
+    def __upsert_statement(
+        self, transaction: CreateRepoAdapter, return_result: bool
+    ) -> Executable:
+        """Upserts the transaction and its relay in one statement.
+
+        The transaction upsert is a data-modifying CTE whose returned id feeds the
+        relay upsert; when a result is wanted, both CTEs are joined into a
+        TransactionsJoinRelays row. The CTE columns are prefixed because
+        databases maps result columns by name across every RETURNING clause.
+        """
         insert_statement = insert(TRANSACTIONS).values(
             emitter_address=transaction.emitter_address.lower(),
             source_chain_id=transaction.source_chain_id,
@@ -75,47 +106,146 @@ class TransactionsRepo(ITransactionsRepo):
             amount=transaction.amount,
         )
 
-        upsert_statement = insert_statement.on_conflict_do_update(
-            index_elements=[
-                TRANSACTIONS.c.emitter_address,
-                TRANSACTIONS.c.source_chain_id,
-                TRANSACTIONS.c.sequence,
+        upserted_transaction = (
+            insert_statement.on_conflict_do_update(
+                index_elements=[
+                    TRANSACTIONS.c.emitter_address,
+                    TRANSACTIONS.c.source_chain_id,
+                    TRANSACTIONS.c.sequence,
+                ],
+                set_={
+                    "from_address": transaction.from_address.lower(),
+                    "to_address": transaction.to_address.lower(),
+                    "dest_chain_id": transaction.dest_chain_id,
+                    "amount": transaction.amount,
+                },
+            )
+            .returning(
+                *(column.label(f"upserted_{column.name}") for column in TRANSACTIONS.c)
+            )
+            .cte("upserted_transaction")
+        )
+
+        insert_statement = insert(RELAYS).from_select(
+            [
+                RELAYS.c.transaction_id,
+                RELAYS.c.status,
+                RELAYS.c.error,
+                RELAYS.c.message,
+                RELAYS.c.cache_status,
+                RELAYS.c.grpc_status,
             ],
+            select(
+                upserted_transaction.c.upserted_id,
+                cast(transaction.relay_status, String),
+                cast(transaction.relay_error, Text),
+                cast(transaction.relay_message, String),
+                cast(transaction.relay_cache_status, String),
+                cast(GrpcStatus.SUCCESS, String),
+            ),
+        )
+
+        upsert_statement = insert_statement.on_conflict_do_update(
+            index_elements=[RELAYS.c.transaction_id],
             set_={
-                "from_address": transaction.from_address.lower(),
-                "to_address": transaction.to_address.lower(),
-                "dest_chain_id": transaction.dest_chain_id,
-                "amount": transaction.amount,
+                "status": transaction.relay_status,
+                "error": transaction.relay_error,
+                "message": transaction.relay_message,
+                "cache_status": transaction.relay_cache_status,
+                "grpc_status": GrpcStatus.SUCCESS,
             },
         )
 
-        async with self.db.transaction():
-            transaction_id = await self.db.execute(upsert_statement)
-
-            insert_statement = insert(RELAYS).values(
-                transaction_id=transaction_id,
-                status=transaction.relay_status,
-                error=transaction.relay_error,
-                message=transaction.relay_message,
-                transaction_hash=None,
-                cache_status=transaction.relay_cache_status,
-                grpc_status=GrpcStatus.SUCCESS,
-            )
+        if not return_result:
+            return upsert_statement
 
-            upsert_statement = insert_statement.on_conflict_do_update(
-                index_elements=[RELAYS.c.transaction_id],
-                set_={
-                    "status": transaction.relay_status,
-                    "error": transaction.relay_error,
-                    "message": transaction.relay_message,
-                    "cache_status": transaction.relay_cache_status,
-                    "grpc_status": GrpcStatus.SUCCESS,
-                },
+        upserted_relay = upsert_statement.returning(
+            *(column.label(f"upserted_relay_{column.name}") for column in RELAYS.c)
+        ).cte("upserted_relay")
+
+        j = upserted_transaction.join(
+            upserted_relay,
+            upserted_transaction.c.upserted_id
+            == upserted_relay.c.upserted_relay_transaction_id,
+        )
+
+        columns_to_select = [
+            upserted_transaction.c[f"upserted_{column.name}"].label(column.name)
+            for column in TRANSACTIONS.c
+        ] + [
+            upserted_relay.c.upserted_relay_id.label("relay_id"),
+            upserted_relay.c.upserted_relay_status.label("relay_status"),
+            upserted_relay.c.upserted_relay_error.label("relay_error"),
+            upserted_relay.c.upserted_relay_message.label("relay_message"),
+            upserted_relay.c.upserted_relay_transaction_hash.label(
+                "relay_transaction_hash"
+            ),
+            upserted_relay.c.upserted_relay_cache_status.label("relay_cache_status"),
+            upserted_relay.c.upserted_relay_grpc_status.label("relay_grpc_status"),
+        ]
+
+        return select(columns_to_select).select_from(j)
+
+    async def __fill_gap(
+        self,
+        emitter_address: str,
+        source_chain_id: int,
+        first_sequence: int,
+        last_sequence: int,
+    ) -> int:
+        """Inserts failed placeholder transactions for every missed sequence.
+
+        The whole gap is written with one statement: the missing sequences come
+        from generate_series and the ids returned by the transactions insert feed
+        the relays insert through a CTE. Sequences already stored are skipped, so
+        the number of placeholders actually inserted is returned.
+        """
+        sequence = func.generate_series(
+            cast(first_sequence, BigInteger), cast(last_sequence, BigInteger)
+        ).column_valued("sequence")
+
+        new_transactions = (
+            insert(TRANSACTIONS)
+            .from_select(
+                [
+                    TRANSACTIONS.c.emitter_address,
+                    TRANSACTIONS.c.source_chain_id,
+                    TRANSACTIONS.c.sequence,
+                ],
+                select(
+                    cast(emitter_address.lower(), String),
+                    cast(source_chain_id, Integer),
+                    sequence,
+                ),
             )
+            .on_conflict_do_nothing()
+            .returning(TRANSACTIONS.c.id)
+            .cte("new_transactions")
+        )
 
-            await self.db.execute(upsert_statement)
+        insert_statement = (
+            insert(RELAYS)
+            .from_select(
+                [
+                    RELAYS.c.transaction_id,
+                    RELAYS.c.status,
+                    RELAYS.c.error,
+                    RELAYS.c.grpc_status,
+                    RELAYS.c.cache_status,
+                ],
+                select(
+                    new_transactions.c.id,
+                    cast(Status.FAILED.value, String),
+                    cast(RelayErrors.MISSED_VAA.value, Text),
+                    cast(GrpcStatus.FAILED.value, String),
+                    cast(CacheStatus.NEVER_CACHED.value, String),
+                ),
+            )
+            .on_conflict_do_nothing()
+            .returning(RELAYS.c.id)
+        )
 
-        return await self.retrieve(transaction_id=transaction_id)
+        return len(await self.db.fetch_all(insert_statement))
 
     async def retrieve(
         self,
@@ -188,6 +318,36 @@ class TransactionsRepo(ITransactionsRepo):
 
         return [TransactionsJoinRelays(**result) for result in results]
 
+    async def warm_latest_sequences(self) -> None:
+        """Loads the latest stored sequence of every emitter into the cache."""
+        if self.latest_sequences is None:
+            return
+
+        j = TRANSACTIONS.join(RELAYS, TRANSACTIONS.c.id == RELAYS.c.transaction_id)
+
+        query = (
+            select(
+                [
+                    TRANSACTIONS.c.emitter_address,
+                    TRANSACTIONS.c.source_chain_id,
+                    func.max(TRANSACTIONS.c.sequence).label("sequence"),
+                ]
+            )
+            .select_from(j)
+            .group_by(TRANSACTIONS.c.emitter_address, TRANSACTIONS.c.source_chain_id)
+        )
+
+        results = await self.db.fetch_all(query)
+
+        self.latest_sequences.update(
+            {
+                (result["emitter_address"], result["source_chain_id"]): result[
+                    "sequence"
+                ]
+                for result in results
+            }
+        )
+
     async def get_latest_sequence(
         self,
         emitter_address: str,
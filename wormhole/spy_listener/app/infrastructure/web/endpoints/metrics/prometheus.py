@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+prometheus_router = APIRouter(tags=["Metrics"])
+
+
+@prometheus_router.get("", response_class=Response)
+async def prometheus_metrics() -> Response:
+    """Returns ingest pipeline metrics in the Prometheus text format."""
+
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends
+
+from app.dependencies import get_vaa_manager
+from app.usecases.interfaces.services.vaa_manager import IVaaManager
+from app.usecases.schemas.recent_vaas import RecentVaasStats
+
+recent_vaas_router = APIRouter(tags=["Metrics"])
+
+
+@recent_vaas_router.get("", response_model=RecentVaasStats)
+async def recent_vaas_stats(
+    vaa_manager: IVaaManager = Depends(get_vaa_manager),
+) -> RecentVaasStats:
+    """Returns size and hit/miss counts of the recent VAA cache."""
+
+    return vaa_manager.get_recent_vaas_stats()
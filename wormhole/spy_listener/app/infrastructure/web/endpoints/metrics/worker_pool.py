@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends
+
+from app.dependencies import get_vaa_worker_pool
+from app.usecases.interfaces.services.vaa_worker_pool import IVaaWorkerPool
+from app.usecases.schemas.worker_pool import WorkerPoolStats
+
+worker_pool_router = APIRouter(tags=["Metrics"])
+
+
+@worker_pool_router.get("", response_model=WorkerPoolStats)
+async def worker_pool_stats(
+    vaa_worker_pool: IVaaWorkerPool = Depends(get_vaa_worker_pool),
+) -> WorkerPoolStats:
+    """Returns queue depth and throughput of the VAA processing workers."""
+
+    return vaa_worker_pool.get_stats()
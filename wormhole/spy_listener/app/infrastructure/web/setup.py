@@ -8,9 +8,15 @@ from app.dependencies import (
     get_event_loop,
     get_redis_client,
     get_stream_client,
+    get_vaa_worker_pool,
 )
 from app.infrastructure.db.core import get_or_create_database
-from app.infrastructure.web.endpoints.metrics import health
+from app.infrastructure.web.endpoints.metrics import (
+    health,
+    prometheus,
+    recent_vaas,
+    worker_pool,
+)
 from app.settings import settings
 
 
@@ -20,7 +26,14 @@ def setup_app() -> FastAPI:
         description="Listens to messages emitted by Wormhole's Guardian Spy.",
         openapi_url=settings.openapi_url,
     )
+    fastapi_app.include_router(prometheus.prometheus_router, prefix="/metrics")
     fastapi_app.include_router(health.health_router, prefix="/metrics/health")
+    fastapi_app.include_router(
+        worker_pool.worker_pool_router, prefix="/metrics/worker_pool"
+    )
+    fastapi_app.include_router(
+        recent_vaas.recent_vaas_router, prefix="/metrics/recent_vaas"
+    )
 
     # CORS (Cross-Origin Resource Sharing)
     origins = ["*"]
@@ -49,6 +62,9 @@ async def startup_event() -> None:
 
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
+    # Drain queued VAAs while the database and Redis are still connected
+    vaa_worker_pool = await get_vaa_worker_pool()
+    await vaa_worker_pool.stop(timeout=settings.vaa_drain_timeout)
     # Close client session
     client_session = await get_client_session()
     await client_session.close()
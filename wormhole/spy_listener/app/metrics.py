@@ -0,0 +1,75 @@
+"""Prometheus metrics for the VAA ingest pipeline, served at /metrics."""
+from prometheus_client import Counter, Gauge, Histogram
+
+# Per-VAA latencies are expected in the sub-millisecond to tens of milliseconds range.
+LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+# Latencies
+VAA_PARSE_SECONDS = Histogram(
+    "spy_listener_vaa_parse_seconds",
+    "Time spent decoding a VAA that was not recently processed.",
+    buckets=LATENCY_BUCKETS,
+)
+VAA_PUBLISH_SECONDS = Histogram(
+    "spy_listener_vaa_publish_seconds",
+    "Time spent publishing a VAA to the Redis unique set.",
+    buckets=LATENCY_BUCKETS,
+)
+VAA_STORE_SECONDS = Histogram(
+    "spy_listener_vaa_store_seconds",
+    "Time spent storing a VAA and its relay in the database.",
+    buckets=LATENCY_BUCKETS,
+)
+REDIS_PUBLISH_BATCH_SIZE = Histogram(
+    "spy_listener_redis_publish_batch_size",
+    "Messages sent to Redis by one pipelined publish.",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+
+# Counters
+DUPLICATE_VAAS = Counter(
+    "spy_listener_duplicate_vaas",
+    "VAAs skipped because they were recently processed.",
+)
+DROPPED_VAAS = Counter(
+    "spy_listener_dropped_vaas",
+    "VAAs dropped because their worker queue was full.",
+)
+GAP_SEQUENCES_FILLED = Counter(
+    "spy_listener_gap_sequences_filled",
+    "Missed sequences stored as failed placeholder relays.",
+)
+STREAM_RECONNECTS = Counter(
+    "spy_listener_stream_reconnects",
+    "Reconnects to the Guardian Spy stream.",
+)
+CACHED_MESSAGES = Counter(
+    "spy_listener_cached_messages",
+    "Messages cached locally after failing to publish to Redis.",
+)
+
+# Gauges; their values are read from the owning objects at scrape time.
+VAA_QUEUE_DEPTH = Gauge(
+    "spy_listener_vaa_queue_depth",
+    "VAAs waiting in the worker pool queues.",
+)
+MESSAGE_CACHE_SIZE = Gauge(
+    "spy_listener_message_cache_size",
+    "Messages waiting in the local Redis message cache.",
+)
@@ -1,7 +1,11 @@
 from os import path
+from typing import Optional
 
 from pydantic import BaseSettings
 
+from app.usecases.schemas.unique_set import UniqueSetMemberFormat, UniqueSetTransport
+from app.usecases.schemas.worker_pool import QueueFullPolicy
+
 # File path to the global .env file
 DOTENV_FILE = ".env" if path.isfile(".env") else None
 
@@ -23,6 +27,15 @@ class Settings(BaseSettings):
     spy_service_filters: str
     reconnect_wait_time: int
 
+    # VAA Processing
+    vaa_workers: int = 4
+    vaa_queue_size: int = 1000
+    vaa_queue_full_policy: QueueFullPolicy = QueueFullPolicy.BLOCK
+    # Seconds that queued VAAs are given to be processed on shutdown
+    vaa_drain_timeout: float = 10
+    recent_vaas_capacity: int = 1000
+    recent_vaas_ttl: Optional[float] = None
+
     # Database Settings
     db_url: str
     db_schema: str
@@ -32,8 +45,24 @@ class Settings(BaseSettings):
     redis_reconnect_frequency: int = 5
     redis_in_memory_cache_periodicity: int = 15
     redis_min_message_age: int = 10
+    redis_publish_batch_size: int = 100
+    redis_publish_batch_window_ms: int = 5
+    redis_message_cache_dir: str = ".message_cache"
+    redis_message_cache_ring_size: int = 10000
+    redis_message_cache_segment_size: int = 16 * 1024 * 1024
     redis_zset: str
     redis_url: str
+    # With the stream transport, messages are appended to a stream consumed by a
+    # group of relayers; a companion sorted set of recent members deduplicates.
+    redis_transport: UniqueSetTransport = UniqueSetTransport.SORTED_SET
+    redis_stream: str = "wormhole:vaas"
+    redis_stream_members: str = "wormhole:vaas:members"
+    redis_stream_max_length: int = 100000
+    redis_stream_member_ttl: int = 60 * 60
+    # Members are deduplicated as is, so the same VAA as JSON and as an envelope
+    # would be added twice. Envelopes are only published once every relayer can
+    # decode them, and every listener switches at once.
+    redis_member_format: UniqueSetMemberFormat = UniqueSetMemberFormat.JSON
 
     class Config:
         env_file = DOTENV_FILE
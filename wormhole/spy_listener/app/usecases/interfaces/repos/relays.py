@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List
 
 from app.usecases.schemas.relays import UpdateRepoAdapter
 
@@ -7,3 +8,7 @@ class IRelaysRepo(ABC):
     @abstractmethod
     async def update(self, relay: UpdateRepoAdapter) -> None:
         """Update relay object."""
+
+    @abstractmethod
+    async def update_many(self, relays: List[UpdateRepoAdapter]) -> None:
+        """Update many relay objects with one statement."""
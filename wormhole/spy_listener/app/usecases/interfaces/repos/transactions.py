@@ -10,7 +10,9 @@ from app.usecases.schemas.transactions import (
 
 class ITransactionsRepo(ABC):
     @abstractmethod
-    async def create(self, transaction: CreateRepoAdapter) -> TransactionsJoinRelays:
+    async def create(
+        self, transaction: CreateRepoAdapter, return_result: bool = True
+    ) -> Optional[TransactionsJoinRelays]:
         """Inserts and returns new transaction object."""
 
     @abstractmethod
@@ -26,3 +28,7 @@ class ITransactionsRepo(ABC):
         query_params: RetriveManyRepoAdapter,
     ) -> List[TransactionsJoinRelays]:
         """Retrieve transaction object with relay information."""
+
+    @abstractmethod
+    async def warm_latest_sequences(self) -> None:
+        """Loads the latest stored sequence of every emitter into the cache."""
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+from app.usecases.schemas.recent_vaas import RecentVaasStats
 from app.usecases.schemas.vaa import ParsedPayload, ParsedVaa
 
 
@@ -8,6 +9,10 @@ class IVaaManager(ABC):
     def process(self, vaa: bytes) -> None:
         """Processes vaa bytes."""
 
+    @abstractmethod
+    def get_recent_vaas_stats(self) -> RecentVaasStats:
+        """Returns size and hit/miss counts of the recent VAA cache."""
+
     @abstractmethod
     def parse_vaa(self, vaa: bytes) -> ParsedVaa:
         """Extracts utilizable data from VAA bytes."""
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from asyncio import AbstractEventLoop
+
+from app.usecases.schemas.worker_pool import WorkerPoolStats
+
+
+class IVaaWorkerPool(ABC):
+    @abstractmethod
+    async def start(self, loop: AbstractEventLoop) -> None:
+        """Starts the VAA processing workers."""
+
+    @abstractmethod
+    async def stop(self, timeout: float) -> None:
+        """Stops accepting VAAs, gives the queued ones up to timeout seconds to be
+        processed, then stops the workers."""
+
+    @abstractmethod
+    async def submit(self, vaa: bytes) -> None:
+        """Queues VAA bytes for processing."""
+
+    @abstractmethod
+    def get_stats(self) -> WorkerPoolStats:
+        """Returns queue and throughput statistics."""
@@ -0,0 +1,31 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class RecentVaasStats(BaseModel):
+    capacity: int = Field(
+        ...,
+        description="The maximum number of recently processed VAAs remembered.",
+        example=1000,
+    )
+    size: int = Field(
+        ...,
+        description="The number of recently processed VAAs currently remembered.",
+        example=850,
+    )
+    ttl: Optional[float] = Field(
+        None,
+        description="Seconds a VAA is remembered for; unlimited when null.",
+        example=600,
+    )
+    hits: int = Field(
+        ...,
+        description="The number of VAAs skipped because they were recently processed.",
+        example=90000,
+    )
+    misses: int = Field(
+        ...,
+        description="The number of VAAs that were not recently processed.",
+        example=10000,
+    )
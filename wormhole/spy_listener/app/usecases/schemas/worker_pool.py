@@ -0,0 +1,41 @@
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class QueueFullPolicy(str, Enum):
+    BLOCK = "block"
+    DROP = "drop"
+
+
+class WorkerPoolStats(BaseModel):
+    workers: int = Field(
+        ...,
+        description="The number of concurrent VAA processing workers.",
+        example=4,
+    )
+    queue_capacity: int = Field(
+        ...,
+        description="The total number of VAAs that can be queued across all workers.",
+        example=4000,
+    )
+    queue_depth: int = Field(
+        ...,
+        description="The number of VAAs currently waiting to be processed.",
+        example=12,
+    )
+    max_queue_depth: int = Field(
+        ...,
+        description="The highest queue depth observed since startup.",
+        example=250,
+    )
+    processed: int = Field(
+        ...,
+        description="The number of VAAs processed since startup.",
+        example=100000,
+    )
+    dropped: int = Field(
+        ...,
+        description="The number of VAAs dropped because their worker queue was full.",
+        example=0,
+    )
@@ -0,0 +1,55 @@
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from app.usecases.schemas.recent_vaas import RecentVaasStats
+
+
+class RecentVaas:
+    """LRU set of recently processed VAA keys with an optional TTL.
+
+    Guardians gossip the same VAA many times; remembering recent keys lets
+    repeats be skipped before they reach Redis or the database.
+    """
+
+    def __init__(self, capacity: int, ttl: Optional[float] = None) -> None:
+        self.capacity = capacity
+        self.ttl = ttl
+        # key -> monotonic expiry time, least recently used first
+        self.entries: "OrderedDict[Hashable, float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def seen(self, key: Hashable) -> bool:
+        """Returns whether key was recently added, marking it as recently used."""
+        expires_at = self.entries.get(key)
+        if expires_at is not None:
+            if expires_at > time.monotonic():
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return True
+            del self.entries[key]
+
+        self.misses += 1
+        return False
+
+    def add(self, key: Hashable) -> None:
+        """Remembers key, evicting the least recently used key when full."""
+        self.entries[key] = (
+            time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        )
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def get_stats(self) -> RecentVaasStats:
+        return RecentVaasStats(
+            capacity=self.capacity,
+            size=len(self.entries),
+            ttl=self.ttl,
+            hits=self.hits,
+            misses=self.misses,
+        )
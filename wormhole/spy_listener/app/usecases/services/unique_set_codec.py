@@ -0,0 +1,84 @@
+# pylint: disable=duplicate-code
+import json
+import struct
+
+from app.usecases.schemas.unique_set import UniqueSetMemberFormat, UniqueSetMessage
+from app.usecases.services.vaa_parser import emitter_address_to_str
+
+# Members are versioned binary envelopes. Members written before the envelope
+# are JSON objects, which never start with the envelope's magic byte.
+ENVELOPE_MAGIC = 0xA5
+ENVELOPE_VERSION = 1
+JSON_PREFIX = b"{"
+# magic (1) | version (1) | dest_chain_id (2) | emitter_chain (2) | sequence (8) | emitter_address (32) | to_address (32) | from_address length (2)
+ENVELOPE_HEADER = struct.Struct(">BBHHQ32s32sH")
+
+
+def encode_json(message: UniqueSetMessage) -> bytes:
+    """Encodes a message in the JSON format that predates the envelope."""
+    fields = message.dict(exclude={"vaa"})
+    fields["vaa_hex"] = message.vaa.hex().upper()
+    return json.dumps(fields).encode()
+
+
+def encode_message(
+    message: UniqueSetMessage,
+    member_format: UniqueSetMemberFormat = UniqueSetMemberFormat.ENVELOPE,
+) -> bytes:
+    """Encodes a message as an envelope: the header, from_address, then the raw VAA.
+
+    Messages whose fields do not fit the header, which only a malformed VAA
+    produces, are encoded as JSON instead, as are all with the JSON format.
+    """
+    if member_format == UniqueSetMemberFormat.JSON:
+        return encode_json(message=message)
+    try:
+        from_address = bytes.fromhex(message.from_address[2:])
+        header = ENVELOPE_HEADER.pack(
+            ENVELOPE_MAGIC,
+            ENVELOPE_VERSION,
+            message.dest_chain_id,
+            message.emitter_chain,
+            message.sequence,
+            int(message.emitter_address, 16).to_bytes(32, "big"),
+            message.to_address.to_bytes(32, "big"),
+            len(from_address),
+        )
+    except (struct.error, ValueError, OverflowError):
+        return encode_json(message=message)
+    return b"".join((header, from_address, message.vaa))
+
+
+def decode_message(member: bytes) -> UniqueSetMessage:
+    """Decodes an envelope or a JSON member; raises ValueError if it is neither."""
+    if member[:1] == JSON_PREFIX:
+        fields = json.loads(member)
+        return UniqueSetMessage(vaa=bytes.fromhex(fields.pop("vaa_hex")), **fields)
+
+    try:
+        (
+            magic,
+            version,
+            dest_chain_id,
+            emitter_chain,
+            sequence,
+            emitter_address,
+            to_address,
+            from_address_length,
+        ) = ENVELOPE_HEADER.unpack_from(member)
+    except struct.error as e:
+        raise ValueError("Unique-set member is too short for an envelope.") from e
+    if magic != ENVELOPE_MAGIC or version != ENVELOPE_VERSION:
+        raise ValueError(f"Unsupported unique-set envelope: {magic:#x} v{version}.")
+
+    from_address_end = ENVELOPE_HEADER.size + from_address_length
+    # The envelope is written by encode_message, so validation is skipped.
+    return UniqueSetMessage.construct(
+        dest_chain_id=dest_chain_id,
+        to_address=int.from_bytes(to_address, "big"),
+        from_address="0x" + member[ENVELOPE_HEADER.size : from_address_end].hex(),
+        sequence=sequence,
+        emitter_chain=emitter_chain,
+        emitter_address=emitter_address_to_str(emitter_address),
+        vaa=bytes(member[from_address_end:]),
+    )
@@ -1,18 +1,17 @@
-import codecs
-import hashlib
-import struct
+import time
 from logging import Logger
-from typing import Mapping
-
-from eth_abi import decode_abi
 
+from app import metrics
 from app.usecases.interfaces.clients.unique_set import IUniqueSetClient
 from app.usecases.interfaces.repos.transactions import ITransactionsRepo
 from app.usecases.interfaces.services.vaa_manager import IVaaManager
+from app.usecases.schemas.recent_vaas import RecentVaasStats
 from app.usecases.schemas.relays import CacheStatus, Status
 from app.usecases.schemas.transactions import CreateRepoAdapter
 from app.usecases.schemas.unique_set import UniqueSetException, UniqueSetMessage
 from app.usecases.schemas.vaa import ParsedPayload, ParsedVaa
+from app.usecases.services.recent_vaas import RecentVaas
+from app.usecases.services.vaa_parser import VaaPayload, VaaView
 
 
 class VaaManager(IVaaManager):
@@ -21,39 +20,43 @@ class VaaManager(IVaaManager):
         transactions_repo: ITransactionsRepo,
         unique_set: IUniqueSetClient,
         logger: Logger,
+        recent_vaas: RecentVaas,
     ):
         self.transactions_repo: ITransactionsRepo = transactions_repo
         self.unique_set: IUniqueSetClient = unique_set
         self.logger = logger
-        self.recent_vaas: Mapping[frozenset, bool] = dict()
+        self.recent_vaas = recent_vaas
 
     async def process(self, vaa: bytes) -> None:
         """Process vaa bytes."""
 
-        parsed_vaa = self.parse_vaa(vaa=vaa)
+        parse_start = time.perf_counter()
 
-        vaa_hex = codecs.encode(bytes(vaa), "hex_codec").decode().upper()
+        # Decoded lazily and without pydantic validation; this runs for every VAA.
+        parsed_vaa = VaaView(vaa)
 
-        vaa_unique_set = frozenset(
-            {
-                "emitter_chain": parsed_vaa.emitter_chain,
-                "emitter_address": parsed_vaa.emitter_address,
-                "sequence": parsed_vaa.sequence,
-            }.items()
+        vaa_key = (
+            parsed_vaa.emitter_chain,
+            parsed_vaa.emitter_address,
+            parsed_vaa.sequence,
         )
 
-        if not self.recent_vaas.get(vaa_unique_set):
+        if not self.recent_vaas.seen(vaa_key):
+            payload = parsed_vaa.payload
+            publish_start = time.perf_counter()
+            metrics.VAA_PARSE_SECONDS.observe(publish_start - parse_start)
+
             needs_db_store = True
             try:
                 set_result = await self.unique_set.publish(
                     message=UniqueSetMessage(
-                        dest_chain_id=parsed_vaa.payload.dest_chain_id,
-                        to_address=parsed_vaa.payload.to_address,
-                        from_address=parsed_vaa.payload.from_address,
+                        dest_chain_id=payload.dest_chain_id,
+                        to_address=payload.to_address,
+                        from_address=payload.from_address,
                         sequence=parsed_vaa.sequence,
                         emitter_chain=parsed_vaa.emitter_chain,
                         emitter_address=parsed_vaa.emitter_address,
-                        vaa_hex=vaa_hex,
+                        vaa=vaa,
                     )
                 )
             except UniqueSetException as e:
@@ -68,75 +71,44 @@ class VaaManager(IVaaManager):
                 else:
                     needs_db_store = False
 
+            store_start = time.perf_counter()
+            metrics.VAA_PUBLISH_SECONDS.observe(store_start - publish_start)
+
             if needs_db_store:
                 # Store in database
                 await self.transactions_repo.create(
                     transaction=CreateRepoAdapter(
                         emitter_address=parsed_vaa.emitter_address,
-                        from_address=parsed_vaa.payload.from_address,
-                        to_address=f"0x{parsed_vaa.payload.to_address:040x}",
+                        from_address=payload.from_address,
+                        to_address=f"0x{payload.to_address:040x}",
                         source_chain_id=parsed_vaa.emitter_chain,
-                        dest_chain_id=parsed_vaa.payload.dest_chain_id,
-                        amount=parsed_vaa.payload.amount,
+                        dest_chain_id=payload.dest_chain_id,
+                        amount=payload.amount,
                         sequence=parsed_vaa.sequence,
                         relay_error=error,
                         relay_status=status,
-                        relay_message=vaa_hex,
+                        relay_message=vaa.hex().upper(),
                         relay_cache_status=cache_status,
                     ),
+                    return_result=False,
                 )
+                metrics.VAA_STORE_SECONDS.observe(time.perf_counter() - store_start)
+
+            self.recent_vaas.add(vaa_key)
+        else:
+            metrics.DUPLICATE_VAAS.inc()
 
-            if len(self.recent_vaas) >= 100:
-                # Remove the oldest (from beginning)
-                self.recent_vaas.pop(next(iter(self.recent_vaas)))
+    def get_recent_vaas_stats(self) -> RecentVaasStats:
+        """Returns size and hit/miss counts of the recent VAA cache."""
 
-            # Add the newest (to end)
-            self.recent_vaas[vaa_unique_set] = True
+        return self.recent_vaas.get_stats()
 
     def parse_vaa(self, vaa: bytes) -> ParsedVaa:
         """Extracts utilizable data from VAA bytes."""
 
-        sig_start = 6
-        number_of_signers = vaa[5]
-        sig_length = 66
-
-        guardian_signatures = []
-        for i in range(number_of_signers):
-            start = sig_start + i * sig_length
-            guardian_signatures.append(
-                {
-                    "index": vaa[start],
-                    "signature": vaa[start + 1 : start + 66],
-                }
-            )
-
-        body = vaa[sig_start + sig_length * number_of_signers :]
-
-        return ParsedVaa(
-            version=vaa[0],
-            guardian_set_index=struct.unpack(">I", vaa[1:5])[0],
-            guardian_signatures=guardian_signatures,
-            timestamp=struct.unpack(">I", body[:4])[0],
-            nonce=struct.unpack(">I", body[4:8])[0],
-            emitter_chain=struct.unpack(">H", body[8:10])[0],
-            emitter_address="0x" + hex(int(body[10:42].hex(), 16))[2:],
-            sequence=int.from_bytes(body[42:50], byteorder="big", signed=False),
-            consistency_level=body[50],
-            payload=self.parse_payload(payload=body[51:]),
-            hash=hashlib.sha3_256(body).digest(),
-        )
+        return VaaView(vaa).to_parsed_vaa()
 
     def parse_payload(self, payload: bytes) -> ParsedPayload:
         """Extracts utilizable data from payload bytes."""
 
-        types = ["bytes", "uint256", "uint256", "uint256"]
-        from_address_bytes, dest_chain_id, to_address_uint256, amount = decode_abi(
-            types, payload
-        )
-
-        return ParsedPayload(
-            from_address="0x" + str(from_address_bytes.hex()),
-            to_address=to_address_uint256,
-            dest_chain_id=dest_chain_id,
-            amount=amount,
-        )
+        return VaaPayload(payload=memoryview(payload)).to_parsed_payload()
@@ -0,0 +1,159 @@
+import asyncio
+import struct
+from asyncio import AbstractEventLoop
+from logging import Logger
+from typing import List
+
+from app import metrics
+from app.usecases.interfaces.services.vaa_manager import IVaaManager
+from app.usecases.interfaces.services.vaa_worker_pool import IVaaWorkerPool
+from app.usecases.schemas.worker_pool import QueueFullPolicy, WorkerPoolStats
+from app.usecases.services.vaa_parser import HEADER, SIGNATURE, VaaView
+
+# emitter_chain (2) | emitter_address (32), after the body's timestamp and nonce
+EMITTER_OFFSET = struct.calcsize(">II")
+EMITTER_SIZE = struct.calcsize(">H32s")
+
+
+def emitter_key(vaa: bytes) -> bytes:
+    """Returns a VAA's emitter_chain and emitter_address bytes without parsing it.
+
+    A malformed VAA gets a short or empty key; the worker it is routed to
+    reports it, as does the pool if it is dropped.
+    """
+    number_of_signers = vaa[HEADER.size - 1 : HEADER.size]
+    start = (
+        HEADER.size
+        + SIGNATURE.size * (number_of_signers[0] if number_of_signers else 0)
+        + EMITTER_OFFSET
+    )
+    return bytes(vaa[start : start + EMITTER_SIZE])
+
+
+class VaaWorkerPool(IVaaWorkerPool):
+    """Decouples consumption of the spy stream from VAA processing.
+
+    Each worker owns a bounded queue, and VAAs are routed to a worker by
+    (emitter_chain, emitter_address), so VAAs from the same emitter are
+    always processed in the order they were received.
+    """
+
+    def __init__(  # pylint: disable = too-many-arguments
+        self,
+        vaa_manager: IVaaManager,
+        logger: Logger,
+        workers: int,
+        queue_size: int,
+        queue_full_policy: QueueFullPolicy,
+    ):
+        self.vaa_manager = vaa_manager
+        self.logger = logger
+        self.queue_size = queue_size
+        self.queue_full_policy = queue_full_policy
+        self.queues: List[asyncio.Queue] = [
+            asyncio.Queue(maxsize=queue_size) for _ in range(workers)
+        ]
+        self.workers: List[asyncio.Task] = []
+        self.stopping = False
+        self.processed = 0
+        self.dropped = 0
+        self.max_queue_depth = 0
+        metrics.VAA_QUEUE_DEPTH.set_function(lambda: self.queue_depth)
+
+    async def start(self, loop: AbstractEventLoop) -> None:
+        """Starts the VAA processing workers."""
+        self.stopping = False
+        self.workers = [
+            loop.create_task(self.__work(queue=queue)) for queue in self.queues
+        ]
+
+    async def stop(self, timeout: float) -> None:
+        """Stops accepting VAAs, gives the queued ones up to timeout seconds to be
+        processed, then stops the workers."""
+
+        self.stopping = True
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in self.queues)),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            # NOTE: Unprocessed VAAs are recovered as sequence gaps.
+            self.logger.warning(
+                "[VaaWorkerPool]: Stopped with %s VAAs still queued.",
+                self.queue_depth,
+            )
+
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+    async def submit(self, vaa: bytes) -> None:
+        """Queues VAA bytes for processing."""
+
+        # VAAs are routed by their emitter bytes; VaaManager parses them.
+        queue = self.queues[hash(emitter_key(vaa)) % len(self.queues)]
+
+        if self.stopping:
+            self.__drop(vaa=vaa, reason="Pool stopping")
+            return
+        if self.queue_full_policy == QueueFullPolicy.DROP:
+            try:
+                queue.put_nowait(vaa)
+            except asyncio.QueueFull:
+                self.__drop(vaa=vaa, reason="Queue full")
+                return
+        else:
+            await queue.put(vaa)
+
+        queue_depth = self.queue_depth
+        if queue_depth > self.max_queue_depth:
+            self.max_queue_depth = queue_depth
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(queue.qsize() for queue in self.queues)
+
+    def get_stats(self) -> WorkerPoolStats:
+        """Returns queue and throughput statistics."""
+
+        return WorkerPoolStats(
+            workers=len(self.queues),
+            queue_capacity=self.queue_size * len(self.queues),
+            queue_depth=self.queue_depth,
+            max_queue_depth=self.max_queue_depth,
+            processed=self.processed,
+            dropped=self.dropped,
+        )
+
+    def __drop(self, vaa: bytes, reason: str) -> None:
+        # NOTE: Dropped VAAs are recovered as sequence gaps.
+        self.dropped += 1
+        metrics.DROPPED_VAAS.inc()
+        try:
+            vaa_view = VaaView(vaa)
+        except struct.error:
+            self.logger.warning(
+                "[VaaWorkerPool]: %s; malformed VAA dropped: %s", reason, vaa.hex()
+            )
+            return
+        self.logger.warning(
+            "[VaaWorkerPool]: %s; VAA dropped. chain id: %s, sequence: %s",
+            reason,
+            vaa_view.emitter_chain,
+            vaa_view.sequence,
+        )
+
+    async def __work(self, queue: asyncio.Queue) -> None:
+        while True:
+            vaa = await queue.get()
+            try:
+                await self.vaa_manager.process(vaa=vaa)
+            except asyncio.CancelledError:  # pylint: disable = try-except-raise
+                raise
+            except Exception as e:  # pylint: disable = broad-except
+                self.logger.exception(e)
+            finally:
+                self.processed += 1
+                queue.task_done()
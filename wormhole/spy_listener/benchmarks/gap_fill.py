@@ -0,0 +1,134 @@
+"""Compares set-based gap filling against the previous per-sequence inserts.
+
+Writes to the database configured by DB_URL/DB_SCHEMA; point it at a disposable
+development database. Every row it creates is deleted afterwards.
+
+Run from the spy_listener directory with: python -m benchmarks.gap_fill
+"""
+import asyncio
+import time
+import uuid
+
+from databases import Database
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.infrastructure.db.models.relays import RELAYS
+from app.infrastructure.db.models.transactions import TRANSACTIONS
+from app.infrastructure.db.repos.transactions import TransactionsRepo
+from app.settings import settings
+from app.usecases.schemas.relays import CacheStatus, GrpcStatus, RelayErrors, Status
+from app.usecases.schemas.transactions import CreateRepoAdapter
+from tests.constants import (
+    TEST_AMOUNT,
+    TEST_DESTINATION_CHAIN_ID,
+    TEST_SOURCE_CHAIN_ID,
+    TEST_USER_ADDRESS,
+    TEST_VAA,
+)
+
+GAP = 10_000
+
+
+async def legacy_fill_gap(
+    db: Database, emitter_address: str, first_sequence: int, last_sequence: int
+) -> None:
+    for sequence in range(first_sequence, last_sequence + 1):
+        async with db.transaction():
+            transaction_id = await db.execute(
+                insert(TRANSACTIONS)
+                .values(
+                    emitter_address=emitter_address,
+                    source_chain_id=TEST_SOURCE_CHAIN_ID,
+                    sequence=sequence,
+                )
+                .on_conflict_do_nothing()
+            )
+            if transaction_id:
+                await db.execute(
+                    insert(RELAYS)
+                    .values(
+                        transaction_id=transaction_id,
+                        status=Status.FAILED,
+                        error=RelayErrors.MISSED_VAA,
+                        grpc_status=GrpcStatus.FAILED,
+                        cache_status=CacheStatus.NEVER_CACHED,
+                    )
+                    .on_conflict_do_nothing()
+                )
+
+
+def create_adapter(emitter_address: str, sequence: int) -> CreateRepoAdapter:
+    return CreateRepoAdapter(
+        emitter_address=emitter_address,
+        from_address=TEST_USER_ADDRESS,
+        to_address=TEST_USER_ADDRESS,
+        source_chain_id=TEST_SOURCE_CHAIN_ID,
+        dest_chain_id=TEST_DESTINATION_CHAIN_ID,
+        amount=TEST_AMOUNT,
+        sequence=sequence,
+        relay_status=Status.PENDING,
+        relay_error=None,
+        relay_cache_status=CacheStatus.NEVER_CACHED,
+        relay_message=TEST_VAA,
+    )
+
+
+async def cleanup(db: Database, emitter_address: str) -> None:
+    transaction_ids = select(TRANSACTIONS.c.id).where(
+        TRANSACTIONS.c.emitter_address == emitter_address
+    )
+    async with db.transaction():
+        await db.execute(
+            delete(RELAYS).where(RELAYS.c.transaction_id.in_(transaction_ids))
+        )
+        await db.execute(
+            delete(TRANSACTIONS).where(
+                TRANSACTIONS.c.emitter_address == emitter_address
+            )
+        )
+
+
+async def main() -> None:
+    db = Database(url=settings.db_url)
+    await db.connect()
+    transactions_repo = TransactionsRepo(db=db)
+
+    legacy_emitter = f"0xbenchmark{uuid.uuid4().hex}"
+    bulk_emitter = f"0xbenchmark{uuid.uuid4().hex}"
+    try:
+        start = time.perf_counter()
+        await legacy_fill_gap(
+            db=db, emitter_address=legacy_emitter, first_sequence=1, last_sequence=GAP
+        )
+        legacy_seconds = time.perf_counter() - start
+
+        await transactions_repo.create(transaction=create_adapter(bulk_emitter, 0))
+        start = time.perf_counter()
+        await transactions_repo.create(
+            transaction=create_adapter(bulk_emitter, GAP + 1)
+        )
+        bulk_seconds = time.perf_counter() - start
+
+        stored = await db.fetch_val(
+            "SELECT count(*) FROM "
+            f"{settings.db_schema}.transactions t JOIN {settings.db_schema}.relays r "
+            "ON r.transaction_id = t.id WHERE t.emitter_address = :emitter_address",
+            {"emitter_address": bulk_emitter},
+        )
+        assert stored == GAP + 2
+    finally:
+        await cleanup(db=db, emitter_address=legacy_emitter)
+        await cleanup(db=db, emitter_address=bulk_emitter)
+        await db.disconnect()
+
+    print(f"{GAP}-sequence gap")
+    print(f"{'per-sequence inserts':<24} {legacy_seconds * 1e3:10.1f} ms")
+    print(
+        f"{'set-based create()':<24} {bulk_seconds * 1e3:10.1f} ms  "
+        f"{legacy_seconds / bulk_seconds:6.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
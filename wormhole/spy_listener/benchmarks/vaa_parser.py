@@ -0,0 +1,102 @@
+"""Compares the struct/memoryview VAA parser against the previous implementation.
+
+Run from the spy_listener directory with: python -m benchmarks.vaa_parser
+"""
+import hashlib
+import struct
+import timeit
+
+from eth_abi import decode_abi
+
+from app.usecases.schemas.vaa import ParsedPayload, ParsedVaa
+from app.usecases.services.vaa_parser import VaaView
+from tests.constants import TEST_VAA_BYTES
+
+ITERATIONS = 20_000
+
+
+def legacy_parse_payload(payload: bytes) -> ParsedPayload:
+    types = ["bytes", "uint256", "uint256", "uint256"]
+    from_address_bytes, dest_chain_id, to_address_uint256, amount = decode_abi(
+        types, payload
+    )
+
+    return ParsedPayload(
+        from_address="0x" + str(from_address_bytes.hex()),
+        to_address=to_address_uint256,
+        dest_chain_id=dest_chain_id,
+        amount=amount,
+    )
+
+
+def legacy_parse_vaa(vaa: bytes) -> ParsedVaa:
+    sig_start = 6
+    number_of_signers = vaa[5]
+    sig_length = 66
+
+    guardian_signatures = []
+    for i in range(number_of_signers):
+        start = sig_start + i * sig_length
+        guardian_signatures.append(
+            {
+                "index": vaa[start],
+                "signature": vaa[start + 1 : start + 66],
+            }
+        )
+
+    body = vaa[sig_start + sig_length * number_of_signers :]
+
+    return ParsedVaa(
+        version=vaa[0],
+        guardian_set_index=struct.unpack(">I", vaa[1:5])[0],
+        guardian_signatures=guardian_signatures,
+        timestamp=struct.unpack(">I", body[:4])[0],
+        nonce=struct.unpack(">I", body[4:8])[0],
+        emitter_chain=struct.unpack(">H", body[8:10])[0],
+        emitter_address="0x" + hex(int(body[10:42].hex(), 16))[2:],
+        sequence=int.from_bytes(body[42:50], byteorder="big", signed=False),
+        consistency_level=body[50],
+        payload=legacy_parse_payload(payload=body[51:]),
+        hash=hashlib.sha3_256(body).digest(),
+    )
+
+
+def hot_path(vaa: bytes) -> tuple:
+    """The fields VaaManager.process reads for every VAA."""
+    vaa_view = VaaView(vaa)
+    payload = vaa_view.payload
+    return (
+        vaa_view.emitter_chain,
+        vaa_view.emitter_address,
+        vaa_view.sequence,
+        payload.from_address,
+        payload.to_address,
+        payload.dest_chain_id,
+        payload.amount,
+    )
+
+
+def main() -> None:
+    assert legacy_parse_vaa(TEST_VAA_BYTES) == VaaView(TEST_VAA_BYTES).to_parsed_vaa()
+
+    cases = {
+        "legacy parse_vaa": lambda: legacy_parse_vaa(TEST_VAA_BYTES),
+        "VaaView -> ParsedVaa (validated)": lambda: VaaView(
+            TEST_VAA_BYTES
+        ).to_parsed_vaa(),
+        "VaaView -> ParsedVaa (construct)": lambda: VaaView(
+            TEST_VAA_BYTES
+        ).to_parsed_vaa(validate=False),
+        "VaaView hot path": lambda: hot_path(TEST_VAA_BYTES),
+    }
+
+    baseline = None
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=ITERATIONS, repeat=5))
+        per_call_us = seconds / ITERATIONS * 1e6
+        baseline = baseline or per_call_us
+        print(f"{name:<36} {per_call_us:8.2f} us/VAA  {baseline / per_call_us:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,28 @@
-# pylint: disable=redefined-outer-name
+# pylint: disable=redefined-outer-name,unused-argument
+import asyncio
 import os
 from typing import List
 
+import aioredis
 import pytest_asyncio
 import respx
+from aioredis import Redis
 from databases import Database
 from fastapi import FastAPI
 from httpx import AsyncClient
 
 import tests.constants as constant
 from app.dependencies import get_transactions_repo, logger
+from app.infrastructure.clients.redis import RedisClient
 from app.infrastructure.db.repos.relays import RelaysRepo
 from app.infrastructure.db.repos.transactions import TransactionsRepo
 from app.infrastructure.web.setup import setup_app
+from app.settings import settings
 from app.usecases.interfaces.clients.unique_set import IUniqueSetClient
 from app.usecases.interfaces.repos.relays import IRelaysRepo
 from app.usecases.interfaces.repos.transactions import ITransactionsRepo
 from app.usecases.interfaces.services.vaa_manager import IVaaManager
+from app.usecases.interfaces.services.vaa_worker_pool import IVaaWorkerPool
 from app.usecases.schemas.relays import (
     CacheStatus,
     RelayErrors,
@@ -24,10 +30,15 @@ from app.usecases.schemas.relays import (
     UpdateRepoAdapter,
 )
 from app.usecases.schemas.transactions import CreateRepoAdapter, TransactionsJoinRelays
+from app.usecases.schemas.unique_set import UniqueSetTransport
+from app.usecases.schemas.worker_pool import QueueFullPolicy
+from app.usecases.services.recent_vaas import RecentVaas
 from app.usecases.services.vaa_manager import VaaManager
+from app.usecases.services.vaa_worker_pool import VaaWorkerPool
 
 # Mocks
 from tests.mocks.clients.unique_set import MockUniqueSetClient, UniqueSetResult
+from tests.mocks.services.vaa_manager import MockVaaManager
 
 
 # Database Connection
@@ -58,12 +69,90 @@ async def transactions_repo(test_db: Database) -> ITransactionsRepo:
     return TransactionsRepo(db=test_db)
 
 
+@pytest_asyncio.fixture
+async def cached_transactions_repo(test_db: Database) -> ITransactionsRepo:
+    return TransactionsRepo(db=test_db, cache_latest_sequences=True)
+
+
 @pytest_asyncio.fixture
 async def relays_repo(test_db: Database) -> IRelaysRepo:
     return RelaysRepo(db=test_db)
 
 
+# Redis Connection
+@pytest_asyncio.fixture
+async def test_redis_url() -> str:
+    host = os.getenv("REDIS_HOST", "localhost")
+    port = os.getenv("REDIS_PORT", "6380")
+    return f"redis://{host}:{port}/0"
+
+
+@pytest_asyncio.fixture
+async def test_redis(test_redis_url: str) -> Redis:
+    test_redis = await aioredis.from_url(test_redis_url)
+    yield test_redis
+    await test_redis.flushdb()
+    await test_redis.close()
+
+
+async def start_redis_client(relays_repo: IRelaysRepo) -> RedisClient:
+    """Starts a RedisClient and waits until it has connected."""
+    redis_client = RedisClient(
+        logger=logger, loop=asyncio.get_running_loop(), relays_repo=relays_repo
+    )
+    while redis_client.redis is None or (
+        settings.redis_transport == UniqueSetTransport.STREAM
+        and not redis_client.stream_publish_sha
+    ):
+        await asyncio.sleep(0.01)
+    return redis_client
+
+
 # Clients
+@pytest_asyncio.fixture
+async def redis_settings(
+    test_redis: Redis, test_redis_url: str, tmp_path, monkeypatch
+) -> None:
+    monkeypatch.setattr(settings, "redis_url", test_redis_url)
+    monkeypatch.setattr(settings, "redis_zset", constant.TEST_REDIS_ZSET)
+    monkeypatch.setattr(settings, "redis_message_cache_dir", str(tmp_path))
+    monkeypatch.setattr(
+        settings, "redis_publish_batch_size", constant.TEST_PUBLISH_BATCH_SIZE
+    )
+
+
+@pytest_asyncio.fixture
+async def cache_drain_settings(monkeypatch) -> None:
+    monkeypatch.setattr(
+        settings,
+        "redis_in_memory_cache_periodicity",
+        constant.TEST_CACHE_DRAIN_PERIODICITY,
+    )
+
+
+@pytest_asyncio.fixture
+async def redis_client(redis_settings: None, relays_repo: IRelaysRepo) -> RedisClient:
+    redis_client = await asyncio.wait_for(
+        start_redis_client(relays_repo=relays_repo),
+        timeout=constant.TEST_REDIS_CONNECT_TIMEOUT,
+    )
+    yield redis_client
+    await redis_client.close_connection()
+
+
+@pytest_asyncio.fixture
+async def stream_redis_client(
+    redis_settings: None, relays_repo: IRelaysRepo, monkeypatch
+) -> RedisClient:
+    monkeypatch.setattr(settings, "redis_transport", UniqueSetTransport.STREAM)
+    redis_client = await asyncio.wait_for(
+        start_redis_client(relays_repo=relays_repo),
+        timeout=constant.TEST_REDIS_CONNECT_TIMEOUT,
+    )
+    yield redis_client
+    await redis_client.close_connection()
+
+
 @pytest_asyncio.fixture
 async def test_unique_set_client_success() -> IUniqueSetClient:
     return MockUniqueSetClient(result=UniqueSetResult.SUCCESS)
@@ -84,6 +173,7 @@ async def vaa_manager(
         transactions_repo=transactions_repo,
         unique_set=test_unique_set_client_success,
         logger=logger,
+        recent_vaas=RecentVaas(capacity=constant.TEST_RECENT_VAAS_CAPACITY),
     )
 
 
@@ -95,7 +185,39 @@ async def vaa_manager_unique_set_fail(
         transactions_repo=transactions_repo,
         unique_set=test_unique_set_client_fail,
         logger=logger,
+        recent_vaas=RecentVaas(capacity=constant.TEST_RECENT_VAAS_CAPACITY),
+    )
+
+
+@pytest_asyncio.fixture
+async def mock_vaa_manager() -> MockVaaManager:
+    return MockVaaManager()
+
+
+@pytest_asyncio.fixture
+async def vaa_worker_pool(mock_vaa_manager: MockVaaManager) -> IVaaWorkerPool:
+    vaa_worker_pool = VaaWorkerPool(
+        vaa_manager=mock_vaa_manager,
+        logger=logger,
+        workers=constant.TEST_VAA_WORKERS,
+        queue_size=constant.TEST_VAA_QUEUE_SIZE,
+        queue_full_policy=QueueFullPolicy.BLOCK,
+    )
+    yield vaa_worker_pool
+    await vaa_worker_pool.stop(timeout=constant.TEST_VAA_DRAIN_TIMEOUT)
+
+
+@pytest_asyncio.fixture
+async def vaa_worker_pool_drop(mock_vaa_manager: MockVaaManager) -> IVaaWorkerPool:
+    vaa_worker_pool = VaaWorkerPool(
+        vaa_manager=mock_vaa_manager,
+        logger=logger,
+        workers=1,
+        queue_size=constant.TEST_VAA_QUEUE_SIZE,
+        queue_full_policy=QueueFullPolicy.DROP,
     )
+    yield vaa_worker_pool
+    await vaa_worker_pool.stop(timeout=constant.TEST_VAA_DRAIN_TIMEOUT)
 
 
 # Database-inserted Objects
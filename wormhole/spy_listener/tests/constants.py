@@ -14,3 +14,16 @@ TEST_VAA_PAYLOAD = b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0
 # Other Constants
 UNIQUE_SET_ERROR_DETAIL = "[RedisClient]: Error - Message was not published."
 DEFAULT_ITERATIONS = 3
+TEST_SEQUENCE_GAP = 100
+TEST_VAA_WORKERS = 4
+TEST_VAA_QUEUE_SIZE = 5
+TEST_VAA_DRAIN_TIMEOUT = 1
+TEST_REDIS_ZSET = "test:vaas"
+TEST_REDIS_CONNECT_TIMEOUT = 5
+TEST_PUBLISH_BATCH_SIZE = 4
+TEST_CACHE_DRAIN_PERIODICITY = 0.01
+TEST_RECENT_VAAS_CAPACITY = 3
+TEST_MESSAGES = 10
+TEST_MESSAGE_CACHE_RING_SIZE = 4
+# Fits three test messages per segment
+TEST_MESSAGE_CACHE_SEGMENT_SIZE = 8192
@@ -0,0 +1,37 @@
+import asyncio
+import random
+from typing import List, Tuple
+
+from app.usecases.interfaces.services.vaa_manager import IVaaManager
+from app.usecases.schemas.recent_vaas import RecentVaasStats
+from app.usecases.schemas.vaa import ParsedPayload, ParsedVaa
+from app.usecases.services.vaa_parser import VaaPayload, VaaView
+
+
+class MockVaaManager(IVaaManager):
+    """Records the (emitter_chain, emitter_address, sequence) of processed VAAs."""
+
+    def __init__(self) -> None:
+        self.processed: List[Tuple[int, str, int]] = []
+
+    async def process(self, vaa: bytes) -> None:
+        """Processes vaa bytes."""
+        # Yield a random number of times so that workers interleave.
+        for _ in range(random.randint(0, 3)):
+            await asyncio.sleep(0)
+        vaa_view = VaaView(vaa)
+        self.processed.append(
+            (vaa_view.emitter_chain, vaa_view.emitter_address, vaa_view.sequence)
+        )
+
+    def get_recent_vaas_stats(self) -> RecentVaasStats:
+        """Returns size and hit/miss counts of the recent VAA cache."""
+        return RecentVaasStats(capacity=0, size=0, hits=0, misses=len(self.processed))
+
+    def parse_vaa(self, vaa: bytes) -> ParsedVaa:
+        """Extracts utilizable data from VAA bytes."""
+        return VaaView(vaa).to_parsed_vaa()
+
+    def parse_payload(self, payload: bytes) -> ParsedPayload:
+        """Extracts utilizable data from payload bytes."""
+        return VaaPayload(payload=memoryview(payload)).to_parsed_payload()
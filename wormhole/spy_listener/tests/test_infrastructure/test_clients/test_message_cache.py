@@ -0,0 +1,122 @@
+import os
+
+import pytest
+
+import tests.constants as constant
+from app.infrastructure.clients.message_cache import (
+    RECORD_HEADER,
+    MessageCache,
+    SegmentLog,
+)
+from app.usecases.schemas.unique_set import UniqueSetMessage
+
+
+def build_message(sequence: int) -> UniqueSetMessage:
+    return UniqueSetMessage(
+        dest_chain_id=constant.TEST_DESTINATION_CHAIN_ID,
+        to_address=int(constant.TEST_USER_ADDRESS, 16),
+        from_address=constant.TEST_USER_ADDRESS,
+        sequence=sequence,
+        emitter_chain=constant.TEST_SOURCE_CHAIN_ID,
+        emitter_address=constant.TEST_EMITTER_ADDRESS,
+        vaa=constant.TEST_VAA_BYTES,
+    )
+
+
+def build_cache(directory: str) -> MessageCache:
+    return MessageCache(
+        directory=directory,
+        ring_size=constant.TEST_MESSAGE_CACHE_RING_SIZE,
+        segment_size=constant.TEST_MESSAGE_CACHE_SEGMENT_SIZE,
+    )
+
+
+def test_fifo_beyond_ring(tmp_path) -> None:
+    message_cache = build_cache(directory=str(tmp_path))
+    messages = [build_message(sequence) for sequence in range(constant.TEST_MESSAGES)]
+
+    message_cache.extend(messages)
+
+    assert len(message_cache) == constant.TEST_MESSAGES
+    assert len(message_cache.ring) == constant.TEST_MESSAGE_CACHE_RING_SIZE
+
+    drained = []
+    while len(message_cache):
+        batch = message_cache.peek(count=3)
+        drained.extend(batch)
+        message_cache.remove(count=len(batch))
+
+    assert drained == messages
+    # Fully consumed segments are deleted; only the active one remains.
+    assert len([name for name in os.listdir(tmp_path) if name.endswith(".log")]) == 1
+
+
+def test_recovery(tmp_path) -> None:
+    message_cache = build_cache(directory=str(tmp_path))
+    messages = [build_message(sequence) for sequence in range(constant.TEST_MESSAGES)]
+    message_cache.extend(messages)
+    message_cache.remove(count=2)
+    message_cache.close()
+
+    message_cache = build_cache(directory=str(tmp_path))
+
+    assert len(message_cache) == constant.TEST_MESSAGES - 2
+    assert (
+        message_cache.peek(count=constant.TEST_MESSAGES)
+        == messages[2 : 2 + constant.TEST_MESSAGE_CACHE_RING_SIZE]
+    )
+
+    message_cache.extend([build_message(constant.TEST_MESSAGES)])
+
+    assert len(message_cache) == constant.TEST_MESSAGES - 1
+
+
+def test_torn_write(tmp_path) -> None:
+    segment_log = SegmentLog(
+        directory=str(tmp_path), segment_size=constant.TEST_MESSAGE_CACHE_SEGMENT_SIZE
+    )
+    segment_log.append(b"first")
+    end = segment_log.append(b"second")
+    # Corrupt the last record's payload.
+    segment = segment_log.segments[-1][1]
+    segment[end - 1 : end] = b"X"
+    segment_log.close()
+
+    segment_log = SegmentLog(
+        directory=str(tmp_path), segment_size=constant.TEST_MESSAGE_CACHE_SEGMENT_SIZE
+    )
+
+    assert [record for _, record in segment_log.read(offset=0)] == [b"first"]
+
+    segment_log.append(b"third")
+
+    assert [record for _, record in segment_log.read(offset=0)] == [
+        b"first",
+        b"third",
+    ]
+
+
+def test_record_too_large(tmp_path) -> None:
+    segment_log = SegmentLog(
+        directory=str(tmp_path), segment_size=constant.TEST_MESSAGE_CACHE_SEGMENT_SIZE
+    )
+
+    with pytest.raises(ValueError):
+        segment_log.append(bytes(constant.TEST_MESSAGE_CACHE_SEGMENT_SIZE))
+
+
+def test_record_fills_segment(tmp_path) -> None:
+    segment_log = SegmentLog(
+        directory=str(tmp_path), segment_size=constant.TEST_MESSAGE_CACHE_SEGMENT_SIZE
+    )
+    # Two records that exactly fill the first segment
+    half = constant.TEST_MESSAGE_CACHE_SEGMENT_SIZE // 2
+    records = [
+        bytes([index]) * (half - RECORD_HEADER.size) for index in range(1, 3)
+    ] + [b"third"]
+
+    offsets = [segment_log.append(record) for record in records]
+
+    assert offsets == [half, 2 * half, 2 * half + RECORD_HEADER.size + len(records[2])]
+    assert [base for base, _ in segment_log.segments] == [0, 2 * half]
+    assert [record for _, record in segment_log.read(offset=0)] == records
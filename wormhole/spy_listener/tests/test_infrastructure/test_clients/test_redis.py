@@ -0,0 +1,212 @@
+# pylint: disable=unused-argument
+import asyncio
+from typing import List
+
+import pytest
+from aioredis import Redis
+from prometheus_client import REGISTRY
+
+import tests.constants as constant
+from app.infrastructure.clients.redis import RedisClient
+from app.settings import settings
+from app.usecases.schemas.unique_set import (
+    UniqueSetError,
+    UniqueSetMemberFormat,
+    UniqueSetMessage,
+)
+from app.usecases.services.unique_set_codec import encode_message
+
+
+def build_messages(count: int) -> List[UniqueSetMessage]:
+    return [
+        UniqueSetMessage(
+            dest_chain_id=constant.TEST_DESTINATION_CHAIN_ID,
+            to_address=int(constant.TEST_USER_ADDRESS, 16),
+            from_address=constant.TEST_USER_ADDRESS,
+            sequence=sequence,
+            emitter_chain=constant.TEST_SOURCE_CHAIN_ID,
+            emitter_address=constant.TEST_EMITTER_ADDRESS,
+            vaa=constant.TEST_VAA_BYTES,
+        )
+        for sequence in range(count)
+    ]
+
+
+def publish_batches() -> List[float]:
+    """Number of pipelined publishes so far and the messages they carried."""
+    return [
+        REGISTRY.get_sample_value(f"spy_listener_redis_publish_batch_size_{sample}")
+        for sample in ("count", "sum")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_window(
+    redis_client: RedisClient, test_redis: Redis, monkeypatch
+) -> None:
+    """Test that messages published within the window are sent together."""
+
+    monkeypatch.setattr(settings, "redis_publish_batch_window_ms", 100)
+    messages = build_messages(count=constant.TEST_PUBLISH_BATCH_SIZE - 1)
+    batches, batched_messages = publish_batches()
+
+    publishes = asyncio.gather(
+        *(redis_client.publish(message=message) for message in messages)
+    )
+    await asyncio.sleep(0.01)
+    assert not publishes.done()
+
+    assert await publishes == [1] * len(messages)
+    assert publish_batches() == [batches + 1, batched_messages + len(messages)]
+    assert await test_redis.zrange(constant.TEST_REDIS_ZSET, 0, -1) == sorted(
+        encode_message(message=message, member_format=settings.redis_member_format)
+        for message in messages
+    )
+
+
+@pytest.mark.asyncio
+async def test_publish_member_format(
+    redis_client: RedisClient, test_redis: Redis, monkeypatch
+) -> None:
+    """Test that the same message in each member format is a different member."""
+
+    message = build_messages(count=1)[0]
+
+    assert await redis_client.publish(message=message) == 1
+    monkeypatch.setattr(settings, "redis_member_format", UniqueSetMemberFormat.ENVELOPE)
+    assert await redis_client.publish(message=message) == 1
+
+    assert await test_redis.zrange(constant.TEST_REDIS_ZSET, 0, -1) == sorted(
+        encode_message(message=message, member_format=member_format)
+        for member_format in UniqueSetMemberFormat
+    )
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_size(redis_client: RedisClient, monkeypatch) -> None:
+    """Test that a full batch is sent without waiting for the window, and that
+    every caller receives the result for its own message."""
+
+    monkeypatch.setattr(settings, "redis_publish_batch_window_ms", 60 * 1000)
+    messages = build_messages(count=constant.TEST_PUBLISH_BATCH_SIZE - 1)
+    batches, _ = publish_batches()
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            *(redis_client.publish(message=message) for message in messages),
+            # Already a member by the time it is added
+            redis_client.publish(message=messages[0]),
+        ),
+        timeout=1,
+    )
+
+    assert results == [1] * len(messages) + [0]
+    assert publish_batches()[0] == batches + 1
+
+
+@pytest.mark.asyncio
+async def test_publish_error(redis_client: RedisClient, test_redis: Redis) -> None:
+    """Test that a failed pipeline fails every waiting caller and caches their messages."""
+
+    await test_redis.set(constant.TEST_REDIS_ZSET, "not a sorted set")
+    messages = build_messages(count=constant.TEST_PUBLISH_BATCH_SIZE)
+
+    results = await asyncio.gather(
+        *(redis_client.publish(message=message) for message in messages),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, UniqueSetError) for result in results)
+    assert redis_client.message_cache.peek(count=len(messages)) == messages
+
+
+@pytest.mark.asyncio
+async def test_publish_unexpected_error(redis_client: RedisClient, monkeypatch) -> None:
+    """Test that an error other than a Redis one still fails every waiting caller."""
+
+    def pipeline(**kwargs):
+        raise RuntimeError("Pipeline failed.")
+
+    monkeypatch.setattr(redis_client.redis, "pipeline", pipeline)
+    messages = build_messages(count=constant.TEST_PUBLISH_BATCH_SIZE)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            *(redis_client.publish(message=message) for message in messages),
+            return_exceptions=True,
+        ),
+        timeout=1,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_message_cache_update_error(
+    cache_drain_settings: None, redis_client: RedisClient, test_redis: Redis
+) -> None:
+    """Test that cached messages whose relays fail to update stay cached, and are
+    drained on a later pass."""
+
+    messages = build_messages(count=2)
+    update_many = redis_client.relays_repo.update_many
+    updates: List[int] = []
+
+    async def failing_update_many(relays) -> None:
+        updates.append(len(relays))
+        if len(updates) == 1:
+            raise ConnectionError("Database unavailable.")
+        await update_many(relays=relays)
+
+    redis_client.relays_repo.update_many = failing_update_many
+    redis_client.message_cache.extend(messages)
+
+    async def drained() -> None:
+        while len(redis_client.message_cache):
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(drained(), timeout=1)
+
+    assert updates == [len(messages), len(messages)]
+    assert await test_redis.zcard(constant.TEST_REDIS_ZSET) == len(messages)
+
+
+@pytest.mark.asyncio
+async def test_publish_stream(
+    stream_redis_client: RedisClient, test_redis: Redis
+) -> None:
+    """Test that a message is appended to the stream only once while it is a
+    recent member."""
+
+    message = build_messages(count=1)[0]
+
+    assert await stream_redis_client.publish(message=message) == 1
+    assert await stream_redis_client.publish(message=message) == 0
+
+    entries = await test_redis.xrange(settings.redis_stream)
+    assert [fields for _, fields in entries] == [
+        {
+            b"message": encode_message(
+                message=message, member_format=settings.redis_member_format
+            )
+        }
+    ]
+    assert await test_redis.zrange(settings.redis_stream_members, 0, -1) == [
+        encode_message(message=message, member_format=settings.redis_member_format)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_publish_stream_expired_member(
+    stream_redis_client: RedisClient, test_redis: Redis, monkeypatch
+) -> None:
+    """Test that a message is appended again once its member has expired."""
+
+    monkeypatch.setattr(settings, "redis_stream_member_ttl", 0)
+    message = build_messages(count=1)[0]
+
+    assert await stream_redis_client.publish(message=message) == 1
+    assert await stream_redis_client.publish(message=message) == 1
+
+    assert await test_redis.xlen(settings.redis_stream) == 2
+    assert await test_redis.zcard(settings.redis_stream_members) == 1
@@ -1,4 +1,6 @@
 # pylint: disable=unused-argument
+from typing import List
+
 import pytest
 from databases import Database
 
@@ -10,6 +12,7 @@ from app.usecases.schemas.relays import (
     Status,
     UpdateRepoAdapter,
 )
+from app.usecases.schemas.transactions import TransactionsJoinRelays
 
 
 @pytest.mark.asyncio
@@ -43,3 +46,44 @@ async def test_update(
     assert test_relay["status"] == Status.PENDING
     assert test_relay["cache_status"] == CacheStatus.PREVIOUSLY_CACHED
     assert test_relay["grpc_status"] == GrpcStatus.SUCCESS
+
+
+@pytest.mark.asyncio
+async def test_update_many(
+    relays_repo: IRelaysRepo,
+    many_inserted_transactions: List[TransactionsJoinRelays],
+    test_db: Database,
+) -> None:
+    """Test that many relays can be updated at once"""
+
+    await relays_repo.update_many(
+        relays=[
+            UpdateRepoAdapter(
+                emitter_address=transaction.emitter_address,
+                source_chain_id=transaction.source_chain_id,
+                sequence=transaction.sequence,
+                error=f"error {transaction.sequence}",
+                status=Status.FAILED,
+                cache_status=CacheStatus.PREVIOUSLY_CACHED,
+            )
+            for transaction in many_inserted_transactions
+        ]
+    )
+
+    # Assertions
+    test_relays = await test_db.fetch_all(
+        """SELECT * FROM wh_relayer.transactions AS t JOIN wh_relayer.relays AS r ON t.id = r.transaction_id
+        WHERE t.id = ANY(:transaction_ids)
+        """,
+        {
+            "transaction_ids": [
+                transaction.id for transaction in many_inserted_transactions
+            ]
+        },
+    )
+
+    assert len(test_relays) == constant.DEFAULT_ITERATIONS
+    for test_relay in test_relays:
+        assert test_relay["status"] == Status.FAILED
+        assert test_relay["error"] == f"error {test_relay['sequence']}"
+        assert test_relay["cache_status"] == CacheStatus.PREVIOUSLY_CACHED
@@ -2,10 +2,11 @@
 from typing import List
 
 import pytest
+from prometheus_client import REGISTRY
 
 import tests.constants as constant
 from app.usecases.interfaces.repos.transactions import ITransactionsRepo
-from app.usecases.schemas.relays import Status
+from app.usecases.schemas.relays import GrpcStatus, RelayErrors, Status
 from app.usecases.schemas.transactions import (
     CreateRepoAdapter,
     RetriveManyRepoAdapter,
@@ -27,6 +28,26 @@ async def test_create(
         assert value == transaction.dict()[key]
 
 
+@pytest.mark.asyncio
+async def test_create_no_result(
+    transactions_repo: ITransactionsRepo,
+    create_transaction_repo_adapter: CreateRepoAdapter,
+) -> None:
+    transaction = await transactions_repo.create(
+        transaction=create_transaction_repo_adapter, return_result=False
+    )
+
+    assert transaction is None
+
+    transactions = await transactions_repo.retrieve_many(
+        query_params=RetriveManyRepoAdapter(relay_status=Status.PENDING)
+    )
+
+    assert len(transactions) == 1
+    for key, value in create_transaction_repo_adapter.dict().items():
+        assert value == transactions[0].dict()[key]
+
+
 @pytest.mark.asyncio
 async def test_create_dummy(
     transactions_repo: ITransactionsRepo,
@@ -52,6 +73,119 @@ async def test_create_dummy(
     assert dummy_transaction.amount is None
 
 
+@pytest.mark.asyncio
+async def test_create_gap(
+    transactions_repo: ITransactionsRepo,
+    create_transaction_repo_adapter: CreateRepoAdapter,
+) -> None:
+    _ = await transactions_repo.create(transaction=create_transaction_repo_adapter)
+
+    create_transaction_repo_adapter.sequence += constant.TEST_SEQUENCE_GAP + 1
+
+    _ = await transactions_repo.create(transaction=create_transaction_repo_adapter)
+
+    dummy_transactions = await transactions_repo.retrieve_many(
+        query_params=RetriveManyRepoAdapter(relay_status=Status.FAILED)
+    )
+
+    assert len(dummy_transactions) == constant.TEST_SEQUENCE_GAP
+    assert sorted(transaction.sequence for transaction in dummy_transactions) == list(
+        range(
+            constant.TEST_SEQUENCE + 1,
+            constant.TEST_SEQUENCE + constant.TEST_SEQUENCE_GAP + 1,
+        )
+    )
+    for transaction in dummy_transactions:
+        assert transaction.from_address is None
+        assert transaction.relay_error == RelayErrors.MISSED_VAA
+        assert transaction.relay_grpc_status == GrpcStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_create_cached_gap(
+    cached_transactions_repo: ITransactionsRepo,
+    create_transaction_repo_adapter: CreateRepoAdapter,
+) -> None:
+    emitter_key = (constant.TEST_EMITTER_ADDRESS, constant.TEST_SOURCE_CHAIN_ID)
+
+    _ = await cached_transactions_repo.create(
+        transaction=create_transaction_repo_adapter
+    )
+
+    assert cached_transactions_repo.latest_sequences == {
+        emitter_key: constant.TEST_SEQUENCE
+    }
+
+    create_transaction_repo_adapter.sequence += constant.TEST_SEQUENCE_GAP + 1
+
+    _ = await cached_transactions_repo.create(
+        transaction=create_transaction_repo_adapter
+    )
+
+    dummy_transactions = await cached_transactions_repo.retrieve_many(
+        query_params=RetriveManyRepoAdapter(relay_status=Status.FAILED)
+    )
+
+    assert len(dummy_transactions) == constant.TEST_SEQUENCE_GAP
+    assert (
+        cached_transactions_repo.latest_sequences[emitter_key]
+        == create_transaction_repo_adapter.sequence
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_gap_partially_filled(
+    transactions_repo: ITransactionsRepo,
+    cached_transactions_repo: ITransactionsRepo,
+    create_transaction_repo_adapter: CreateRepoAdapter,
+) -> None:
+    """Test that only the placeholders actually inserted are counted as filled."""
+
+    _ = await cached_transactions_repo.create(
+        transaction=create_transaction_repo_adapter
+    )
+
+    # Stored by another writer; the cached repo still sees TEST_SEQUENCE as latest
+    create_transaction_repo_adapter.sequence += 2
+    _ = await transactions_repo.create(transaction=create_transaction_repo_adapter)
+
+    filled_sequences = REGISTRY.get_sample_value(
+        "spy_listener_gap_sequences_filled_total"
+    )
+
+    create_transaction_repo_adapter.sequence += 2
+    _ = await cached_transactions_repo.create(
+        transaction=create_transaction_repo_adapter
+    )
+
+    dummy_transactions = await transactions_repo.retrieve_many(
+        query_params=RetriveManyRepoAdapter(relay_status=Status.FAILED)
+    )
+
+    assert sorted(transaction.sequence for transaction in dummy_transactions) == [
+        constant.TEST_SEQUENCE + 1,
+        constant.TEST_SEQUENCE + 3,
+    ]
+    assert (
+        REGISTRY.get_sample_value("spy_listener_gap_sequences_filled_total")
+        == filled_sequences + 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_warm_latest_sequences(
+    many_inserted_transactions: List[TransactionsJoinRelays],
+    cached_transactions_repo: ITransactionsRepo,
+) -> None:
+    await cached_transactions_repo.warm_latest_sequences()
+
+    assert cached_transactions_repo.latest_sequences == {
+        (constant.TEST_EMITTER_ADDRESS, constant.TEST_SOURCE_CHAIN_ID): max(
+            transaction.sequence for transaction in many_inserted_transactions
+        )
+    }
+
+
 @pytest.mark.asyncio
 async def test_create_upsert(
     failed_transaction: int,
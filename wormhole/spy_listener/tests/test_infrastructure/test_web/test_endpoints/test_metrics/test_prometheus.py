@@ -0,0 +1,31 @@
+import pytest
+from httpx import AsyncClient
+
+import tests.constants as constant
+from app.usecases.interfaces.services.vaa_manager import IVaaManager
+
+
+@pytest.mark.asyncio
+async def test_prometheus_metrics(
+    test_client: AsyncClient, vaa_manager: IVaaManager
+) -> None:
+
+    endpoint = "/metrics"
+
+    await vaa_manager.process(vaa=constant.TEST_VAA_BYTES)
+    await vaa_manager.process(vaa=constant.TEST_VAA_BYTES)
+
+    response = await test_client.get(endpoint)
+
+    # Assertions
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    for metric in [
+        "spy_listener_vaa_parse_seconds_count",
+        "spy_listener_vaa_publish_seconds_count",
+        "spy_listener_vaa_store_seconds_count",
+        "spy_listener_duplicate_vaas_total",
+        "spy_listener_vaa_queue_depth",
+        "spy_listener_message_cache_size",
+    ]:
+        assert metric in response.text
@@ -0,0 +1,57 @@
+import time
+
+import tests.constants as constant
+from app.usecases.services.recent_vaas import RecentVaas
+
+
+def test_lru_eviction() -> None:
+    recent_vaas = RecentVaas(capacity=constant.TEST_RECENT_VAAS_CAPACITY)
+    keys = [
+        (constant.TEST_SOURCE_CHAIN_ID, constant.TEST_EMITTER_ADDRESS, sequence)
+        for sequence in range(constant.TEST_RECENT_VAAS_CAPACITY + 1)
+    ]
+
+    for key in keys[:-1]:
+        assert not recent_vaas.seen(key)
+        recent_vaas.add(key)
+
+    # Using the oldest key makes the second oldest the least recently used.
+    assert recent_vaas.seen(keys[0])
+    recent_vaas.add(keys[-1])
+
+    assert len(recent_vaas) == constant.TEST_RECENT_VAAS_CAPACITY
+    assert recent_vaas.seen(keys[0])
+    assert not recent_vaas.seen(keys[1])
+    assert recent_vaas.seen(keys[-1])
+
+
+def test_ttl_expiry(monkeypatch) -> None:
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    recent_vaas = RecentVaas(capacity=constant.TEST_RECENT_VAAS_CAPACITY, ttl=10)
+    key = (constant.TEST_SOURCE_CHAIN_ID, constant.TEST_EMITTER_ADDRESS, 1)
+
+    recent_vaas.add(key)
+    assert recent_vaas.seen(key)
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+    assert not recent_vaas.seen(key)
+    assert len(recent_vaas) == 0
+
+
+def test_stats() -> None:
+    recent_vaas = RecentVaas(capacity=constant.TEST_RECENT_VAAS_CAPACITY)
+    key = (constant.TEST_SOURCE_CHAIN_ID, constant.TEST_EMITTER_ADDRESS, 1)
+
+    recent_vaas.seen(key)
+    recent_vaas.add(key)
+    recent_vaas.seen(key)
+    recent_vaas.seen(key)
+
+    stats = recent_vaas.get_stats()
+
+    assert stats.capacity == constant.TEST_RECENT_VAAS_CAPACITY
+    assert stats.size == 1
+    assert stats.ttl is None
+    assert stats.hits == 2
+    assert stats.misses == 1
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+import tests.constants as constant
+from app.usecases.schemas.unique_set import UniqueSetMemberFormat, UniqueSetMessage
+from app.usecases.services.unique_set_codec import (
+    ENVELOPE_MAGIC,
+    decode_message,
+    encode_json,
+    encode_message,
+)
+
+
+def build_message(dest_chain_id: int = constant.TEST_DESTINATION_CHAIN_ID):
+    return UniqueSetMessage(
+        dest_chain_id=dest_chain_id,
+        to_address=int(constant.TEST_USER_ADDRESS, 16),
+        from_address=constant.TEST_USER_ADDRESS,
+        sequence=constant.TEST_SEQUENCE,
+        emitter_chain=constant.TEST_SOURCE_CHAIN_ID,
+        emitter_address=constant.TEST_EMITTER_ADDRESS,
+        vaa=constant.TEST_VAA_BYTES,
+    )
+
+
+def test_envelope_round_trip() -> None:
+    message = build_message()
+
+    member = encode_message(message=message)
+
+    assert member[0] == ENVELOPE_MAGIC
+    assert member.endswith(constant.TEST_VAA_BYTES)
+    assert decode_message(member=member) == message
+    assert len(member) < len(encode_json(message=message)) / 2
+
+
+def test_decode_json() -> None:
+    message = build_message()
+    # As published before the envelope was introduced
+    member = json.dumps(
+        {
+            "dest_chain_id": constant.TEST_DESTINATION_CHAIN_ID,
+            "to_address": int(constant.TEST_USER_ADDRESS, 16),
+            "from_address": constant.TEST_USER_ADDRESS,
+            "sequence": constant.TEST_SEQUENCE,
+            "emitter_chain": constant.TEST_SOURCE_CHAIN_ID,
+            "emitter_address": constant.TEST_EMITTER_ADDRESS,
+            "vaa_hex": constant.TEST_VAA,
+        }
+    ).encode()
+
+    assert encode_json(message=message) == member
+    assert decode_message(member=member) == message
+
+
+def test_encode_json() -> None:
+    message = build_message()
+
+    member = encode_message(message=message, member_format=UniqueSetMemberFormat.JSON)
+
+    assert member == encode_json(message=message)
+    assert decode_message(member=member) == message
+
+
+def test_encode_falls_back_to_json() -> None:
+    message = build_message(dest_chain_id=2**16)
+
+    member = encode_message(message=message)
+
+    assert member.startswith(b"{")
+    assert decode_message(member=member) == message
+
+
+def test_decode_invalid() -> None:
+    with pytest.raises(ValueError):
+        decode_message(member=bytes([ENVELOPE_MAGIC]))
+    with pytest.raises(ValueError):
+        decode_message(member=b"\x00" * 100)
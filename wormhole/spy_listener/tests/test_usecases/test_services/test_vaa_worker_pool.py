@@ -0,0 +1,132 @@
+# pylint: disable=unused-argument
+import asyncio
+import struct
+from collections import defaultdict
+
+import pytest
+
+import tests.constants as constant
+from app.usecases.interfaces.services.vaa_worker_pool import IVaaWorkerPool
+from app.usecases.services.vaa_parser import BODY, HEADER, SIGNATURE, VaaView
+from app.usecases.services.vaa_worker_pool import emitter_key
+from tests.mocks.services.vaa_manager import MockVaaManager
+
+
+def build_vaa(emitter_chain: int, emitter_address: bytes, sequence: int) -> bytes:
+    """Rewrites the emitter and sequence of the test VAA."""
+    vaa = bytearray(constant.TEST_VAA_BYTES)
+    body_start = HEADER.size + SIGNATURE.size * vaa[5]
+    timestamp, nonce, _, _, _, consistency_level = BODY.unpack_from(vaa, body_start)
+    struct.pack_into(
+        BODY.format,
+        vaa,
+        body_start,
+        timestamp,
+        nonce,
+        emitter_chain,
+        emitter_address,
+        sequence,
+        consistency_level,
+    )
+    return bytes(vaa)
+
+
+async def wait_until_idle(vaa_worker_pool: IVaaWorkerPool) -> None:
+    await asyncio.gather(*(queue.join() for queue in vaa_worker_pool.queues))
+
+
+@pytest.mark.asyncio
+async def test_emitter_ordering(
+    vaa_worker_pool: IVaaWorkerPool, mock_vaa_manager: MockVaaManager
+) -> None:
+    """Test that VAAs from the same emitter are processed in order."""
+
+    await vaa_worker_pool.start(loop=asyncio.get_running_loop())
+
+    emitters = [(chain_id, bytes([chain_id]) * 32) for chain_id in range(1, 9)]
+    for sequence in range(constant.TEST_VAA_QUEUE_SIZE * 4):
+        for emitter_chain, emitter_address in emitters:
+            await vaa_worker_pool.submit(
+                vaa=build_vaa(emitter_chain, emitter_address, sequence)
+            )
+
+    await wait_until_idle(vaa_worker_pool)
+
+    sequences = defaultdict(list)
+    for emitter_chain, emitter_address, sequence in mock_vaa_manager.processed:
+        sequences[(emitter_chain, emitter_address)].append(sequence)
+
+    assert len(sequences) == len(emitters)
+    for emitter_sequences in sequences.values():
+        assert emitter_sequences == list(range(constant.TEST_VAA_QUEUE_SIZE * 4))
+
+    stats = vaa_worker_pool.get_stats()
+    assert stats.processed == len(mock_vaa_manager.processed)
+    assert stats.queue_depth == 0
+    assert stats.dropped == 0
+    assert 0 < stats.max_queue_depth <= stats.queue_capacity
+
+
+@pytest.mark.asyncio
+async def test_drop_policy(
+    vaa_worker_pool_drop: IVaaWorkerPool, mock_vaa_manager: MockVaaManager
+) -> None:
+    """Test that VAAs are dropped, not queued, when the queue is full."""
+
+    extra_vaas = 3
+    for _ in range(constant.TEST_VAA_QUEUE_SIZE + extra_vaas):
+        await vaa_worker_pool_drop.submit(vaa=constant.TEST_VAA_BYTES)
+
+    stats = vaa_worker_pool_drop.get_stats()
+    assert stats.queue_depth == constant.TEST_VAA_QUEUE_SIZE
+    assert stats.dropped == extra_vaas
+
+    await vaa_worker_pool_drop.start(loop=asyncio.get_running_loop())
+    await wait_until_idle(vaa_worker_pool_drop)
+
+    assert len(mock_vaa_manager.processed) == constant.TEST_VAA_QUEUE_SIZE
+
+
+@pytest.mark.asyncio
+async def test_drop_malformed(vaa_worker_pool: IVaaWorkerPool) -> None:
+    """Test that a truncated VAA is dropped without raising."""
+
+    await vaa_worker_pool.stop(timeout=constant.TEST_VAA_DRAIN_TIMEOUT)
+    await vaa_worker_pool.submit(vaa=constant.TEST_VAA_BYTES[: HEADER.size + 1])
+
+    assert vaa_worker_pool.get_stats().dropped == 1
+
+
+@pytest.mark.asyncio
+async def test_stop(
+    vaa_worker_pool: IVaaWorkerPool, mock_vaa_manager: MockVaaManager
+) -> None:
+    """Test that stopping processes the queued VAAs and then stops the workers."""
+
+    await vaa_worker_pool.start(loop=asyncio.get_running_loop())
+    for sequence in range(constant.TEST_VAA_QUEUE_SIZE):
+        await vaa_worker_pool.submit(
+            vaa=build_vaa(constant.TEST_SOURCE_CHAIN_ID, bytes(32), sequence)
+        )
+
+    await vaa_worker_pool.stop(timeout=constant.TEST_VAA_DRAIN_TIMEOUT)
+    await vaa_worker_pool.submit(vaa=constant.TEST_VAA_BYTES)
+
+    assert len(mock_vaa_manager.processed) == constant.TEST_VAA_QUEUE_SIZE
+    assert vaa_worker_pool.workers == []
+    stats = vaa_worker_pool.get_stats()
+    assert stats.queue_depth == 0
+    assert stats.dropped == 1
+
+
+def test_emitter_key() -> None:
+    """Test that VAAs are routed by their emitter chain and address bytes."""
+
+    vaa_view = VaaView(constant.TEST_VAA_BYTES)
+
+    assert emitter_key(constant.TEST_VAA_BYTES) == struct.pack(
+        ">H32s",
+        vaa_view.emitter_chain,
+        bytes.fromhex(vaa_view.emitter_address[2:].rjust(64, "0")),
+    )
+    assert emitter_key(b"") == b""